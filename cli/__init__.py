@@ -1,6 +1,8 @@
 import click
 
 import cli.functions as funcs
+from cli.server import Session, create_server
+from ga.algorithms import GAPassive
 
 
 @click.group()
@@ -12,19 +14,25 @@ def main():
 @click.option('-c', '--config-file', required=True,
               help='The JSON file contains the config of GA.')
 @click.option('-i', '--input-path', required=True,
-              help='The JSON file contains parameters, fitness values, generations. '
+              help='The JSON file contains parameters, fitness values, generations, '
+                   'or a binary state file if the extension is .npz, '
+                   'or the latest generation of a journal file if the extension is .journal. '
                    'If the file is not exist, first population will be generated and '
                    'saved to the specified file path. '
                    'If it is a directory, the last file in the directory ordered by '
-                   'name will be loaded.')
+                   'name, numbers in names are compared by value, will be loaded.')
 @click.option('-o', '--output-path', required=False,
-              help='The output JSON file after the algorithm finished. '
+              help='The output JSON file after the algorithm finished, '
+                   'a binary state file is written if the extension is .npz, '
+                   'a generation is appended if the extension is .journal. '
                    'If not specified, the output will overwrite the input file. '
                    'If it is a directory, data of every generation will be created as'
                    'seperate files in the directory.')
 @click.option('-p', '--pretty', required=False, is_flag=True,
               help='Add indent to JSON file to make it human-readable')
-def run(config_file, input_path, output_path, pretty: bool = False):
+@click.option('-d', '--delta', required=False, is_flag=True,
+              help='Append only changes since the previous generation to a .journal file')
+def run(config_file, input_path, output_path, pretty: bool = False, delta: bool = False):
     config = funcs.load_config(config_file)
     if config is None:
         click.echo(click.style('😭 Config file not exists', fg='red'))
@@ -34,11 +42,11 @@ def run(config_file, input_path, output_path, pretty: bool = False):
     if input_data is None:
         click.echo(click.style('The input path is not exist.', fg='yellow'))
 
-    data = funcs.evolve(config, input_data) if input_data is not None else funcs.evolve(config)
+    ga = funcs.evolve_ga(config, input_data)
 
     output_file = output_path or input_path
 
-    result = funcs.dump_output(output_file, data, pretty)
+    result = funcs.dump_output(output_file, ga, pretty, delta)
     if result is None:
         click.echo(click.style('😭 Failed to write result to file', fg='red'))
         return
@@ -47,3 +55,65 @@ def run(config_file, input_path, output_path, pretty: bool = False):
 
 
 main.add_command(run)
+
+
+@click.command()
+@click.option('-c', '--config-file', required=True,
+              help='The JSON file contains the config of GA.')
+@click.option('-s', '--state-path', required=True,
+              help='The state file, a JSON file, a binary state file if the extension is .npz, '
+                   'or a journal file if the extension is .journal. '
+                   'It is loaded if exists, otherwise first population will be generated. '
+                   'Snapshots are saved to it.')
+@click.option('-h', '--host', default='127.0.0.1', show_default=True,
+              help='Host to listen.')
+@click.option('-P', '--port', default=8080, show_default=True,
+              help='Port to listen.')
+@click.option('-u', '--socket', required=False,
+              help='Listen to a Unix socket at this path instead of a port.')
+@click.option('-t', '--snapshot-interval', default=60.0, show_default=True,
+              help='Minimum seconds between two snapshots, a snapshot is also saved on exit.')
+@click.option('-d', '--delta', required=False, is_flag=True,
+              help='Append only changes since the previous snapshot to a .journal file')
+@click.option('--policy', type=click.Choice(GAPassive.POLICIES), default='generational', show_default=True,
+              help='generational evolves once quorum of offsprings are evaluated, '
+                   'steady replaces an eliminated individual with every evaluated offspring.')
+@click.option('-q', '--quorum', default=1.0, show_default=True,
+              help='Fraction of offsprings evaluated before the generational policy evolves, '
+                   'the others are dropped.')
+@click.option('-v', '--verbose', required=False, is_flag=True,
+              help='Log every request.')
+def serve(config_file, state_path, host, port, socket, snapshot_interval, delta=False,
+          policy='generational', quorum=1.0, verbose=False):
+    """
+    Keep the passive GA in memory and serve exterior evaluators:
+
+    \b
+    GET  /ask?n=10   candidates to evaluate
+    POST /tell       {"results": [{"id": 0, "fitness": 1.2}]}
+    GET  /status     generation, progress and the best individual
+    POST /snapshot   save the state now
+    """
+    config = funcs.load_config(config_file)
+    if config is None:
+        click.echo(click.style('😭 Config file not exists', fg='red'))
+        return
+
+    session = Session(config, state_path, snapshot_interval, delta, policy, quorum)
+    server = create_server(session, host, port, socket, verbose)
+    click.echo(f'Current generation: {session.ga.generation}')
+    click.echo(click.style('✨ Serving on ' + (socket or f'http://{host}:{server.server_address[1]}'), fg='green'))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        result = session.snapshot()
+        if result is None:
+            click.echo(click.style('😭 Failed to write state to file', fg='red'))
+        else:
+            click.echo(click.style('✨ State has been save to ' + result, fg='green'))
+
+
+main.add_command(serve)
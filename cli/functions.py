@@ -3,8 +3,21 @@ import json
 import os
 import click
 
-from typing import Optional
+from typing import Optional, Union, Dict
 from ga.algorithms import GAPassive
+from ga.journal import Journal, natural_key, EXTENSION as JOURNAL_EXTENSION
+from ga.state import EXTENSION, is_state, load_state, save_state
+
+# journals opened by this process, so the latest state is only read once
+_journals: Dict[str, Journal] = {}
+
+
+def open_journal(path, delta=False) -> Journal:
+    path = os.path.abspath(path)
+    if path not in _journals:
+        _journals[path] = Journal(path)
+    _journals[path].delta = delta
+    return _journals[path]
 
 
 def load_config(path) -> Optional[dict]:
@@ -14,44 +27,78 @@ def load_config(path) -> Optional[dict]:
     return None
 
 
+def load_file(path) -> Optional[dict]:
+    """Load a JSON file, a binary state if the extension is .npz, or the latest state of a .journal file"""
+    ext = os.path.splitext(str(path))[1]
+    if ext == EXTENSION:
+        return load_state(str(path))
+    if ext == JOURNAL_EXTENSION:
+        return open_journal(path).latest()
+    with open(path) as file:
+        return json.load(file)
+
+
 def load_input_file(path) -> Optional[dict]:
     if os.path.isfile(path):
-        with open(path) as file:
-            return json.load(file)
+        return load_file(path)
     elif os.path.isdir(path):
-        files = sorted([os.path.join(path, f) for f in os.listdir(path)])
+        files = sorted([os.path.join(path, f) for f in os.listdir(path)], key=natural_key)
         files = [f for f in files if os.path.isfile(f)]
         if len(files) <= 0:
             return None
-        with open(files[-1]) as file:
-            return json.load(file)
+        return load_file(files[-1])
     return None
 
 
-def dump_output(path, obj: dict, pretty=False) -> Optional[str]:
+def dump_file(path, obj: Union[dict, GAPassive], pretty=False, delta=False):
+    """Dump to a JSON file, a binary state if the extension is .npz, or append to a .journal file"""
+    ext = os.path.splitext(str(path))[1]
+    if ext == EXTENSION:
+        assert isinstance(obj, GAPassive), 'only GAPassive can be saved as binary state'
+        save_state(str(path), obj.serialize_arrays())
+        return
+    if isinstance(obj, GAPassive):
+        obj = obj.serialize()
+    if ext == JOURNAL_EXTENSION:
+        open_journal(path, delta).append(obj)
+        return
+    # replaced atomically, so readers never see a partly written file
+    temp = f'{path}.{os.getpid()}.tmp'
+    with open(temp, 'w+') as file:
+        json.dump(obj, file, indent=2 if pretty else None)
+    os.replace(temp, path)
+
+
+def dump_output(path, obj: Union[dict, GAPassive], pretty=False, delta=False) -> Optional[str]:
     name, ext = os.path.splitext(path)
     if ext == '':
         os.makedirs(path, exist_ok=True)
-        filename = os.path.join(path, '%03d.json' % obj.get('generation'))
-        with open(filename, 'w+') as file:
-            json.dump(obj, file, indent=2 if pretty else None)
+        generation = obj.generation if isinstance(obj, GAPassive) else obj.get('generation')
+        filename = os.path.join(path, '%03d.json' % generation)
+        dump_file(filename, obj, pretty)
         return filename
     elif os.path.exists(os.path.dirname(os.path.abspath(path))):
-        with open(path, 'w+') as file:
-            json.dump(obj, file, indent=2 if pretty else None)
+        dump_file(path, obj, pretty, delta)
         return path
     return None
 
 
-def evolve(config_data: dict, input_data: Optional[dict] = None) -> dict:
+def evolve_ga(config_data: dict, input_data: Optional[dict] = None) -> GAPassive:
     if input_data is None:
         ga = GAPassive.from_dict(config_data)
         click.echo('No input data, initial population generated.')
     else:
-        ga = GAPassive.from_dict(config_data, input_data)
+        if is_state(input_data):
+            ga = GAPassive.from_arrays(config_data, input_data)
+        else:
+            ga = GAPassive.from_dict(config_data, input_data)
         click.echo('Input data accepted.')
         click.echo(f'Current generation: {ga.generation}')
         click.echo('Evolving...')
         ga.evolve()
         click.echo(f'Number of offsprings generated: {len(ga.offsprings)}')
-    return ga.serialize()
+    return ga
+
+
+def evolve(config_data: dict, input_data: Optional[dict] = None) -> dict:
+    return evolve_ga(config_data, input_data).serialize()
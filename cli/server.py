@@ -0,0 +1,214 @@
+import json
+import os
+import socketserver
+import stat
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, List
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+
+import cli.functions as funcs
+from ga.algorithms import GAPassive
+from ga.state import is_state
+
+
+class Session:
+    """
+    A GAPassive kept in memory for exterior evaluators, see GAPassive.ask and GAPassive.tell.
+    The state is saved every snapshot_interval seconds rather than on every call.
+    """
+
+    def __init__(
+            self,
+            config_data: dict,
+            path: str,
+            snapshot_interval: float = 60.0,
+            delta: bool = False,
+            policy: str = 'generational',
+            quorum: float = 1.0,
+    ):
+        """
+        :param config_data: config
+        :param path: state file path, it is loaded if exists, snapshots are saved to it
+        :param snapshot_interval: minimum seconds between two snapshots saved by the server
+        :param delta: append only changes if path is a journal
+        :param policy: 'generational' or 'steady', see GAPassive
+        :param quorum: fraction of offsprings evaluated before the generational policy evolves
+        """
+        self.config_data = config_data
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self.delta = delta
+        self.lock = threading.RLock()
+
+        data = funcs.load_input_file(path)
+        if data is None:
+            self.ga = GAPassive.from_dict(config_data, policy=policy, quorum=quorum)
+        elif is_state(data):
+            self.ga = GAPassive.from_arrays(config_data, data, policy=policy, quorum=quorum)
+        else:
+            self.ga = GAPassive.from_dict(config_data, data, policy=policy, quorum=quorum)
+        self.saved = time.time()
+        self.dirty = data is None
+
+    def ask(self, n: Optional[int] = None) -> dict:
+        """
+        :param n: maximum number of candidates, all of them if None
+        :return: generation and candidates with ids and parameters
+        """
+        with self.lock:
+            candidates = self.ga.ask(n)
+            return {
+                'generation': self.ga.generation,
+                'satisfied': self.ga.is_satisfied(),
+                'candidates': [{'id': key, 'parameters': parameters} for key, parameters in candidates],
+            }
+
+    def tell(self, results: List[dict]) -> dict:
+        """
+        :param results: list of {'id': id, 'fitness': fitness value}
+        :return: number of accepted results and the current generation
+        """
+        with self.lock:
+            accepted = self.ga.tell([(item['id'], item['fitness']) for item in results])
+            self.dirty = self.dirty or accepted > 0
+            return {'accepted': accepted, 'generation': self.ga.generation}
+
+    def status(self) -> dict:
+        with self.lock:
+            evaluated = self.ga.evaluated
+            return {
+                'generation': self.ga.generation,
+                'satisfied': self.ga.is_satisfied(),
+                'pending': int(np.count_nonzero(~evaluated)),
+                'evaluated': int(np.count_nonzero(evaluated)),
+                'best': self.ga.best().serialize(),
+                'saved': self.saved,
+            }
+
+    def snapshot(self) -> Optional[str]:
+        """
+        Save the state now
+
+        :return: path of the saved file, None if failed
+        """
+        with self.lock:
+            result = funcs.dump_output(self.path, self.ga, delta=self.delta)
+            self.saved = time.time()
+            self.dirty = False
+            return result
+
+    def save_if_due(self):
+        """Save the state if it changed and the last snapshot is older than snapshot_interval"""
+        if self.dirty and time.time() - self.saved >= self.snapshot_interval:
+            self.snapshot()
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    JSON API of a Session:
+        GET  /ask?n=10   candidates
+        POST /tell       {"results": [{"id": 0, "fitness": 1.2}]}
+        GET  /status     generation, number of pending candidates and the best individual
+        POST /snapshot   save the state now
+    """
+
+    server: '_SessionMixIn'
+
+    def _reply(self, status: int, data: dict):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str):
+        url = urlparse(self.path)
+        session = self.server.session
+        try:
+            if method == 'GET' and url.path == '/ask':
+                n = parse_qs(url.query).get('n')
+                self._reply(200, session.ask(int(n[0]) if n else None))
+            elif method == 'POST' and url.path == '/tell':
+                length = int(self.headers.get('Content-Length') or 0)
+                data = json.loads(self.rfile.read(length) or b'{}')
+                self._reply(200, session.tell(data.get('results', [])))
+            elif method == 'GET' and url.path == '/status':
+                self._reply(200, session.status())
+            elif method == 'POST' and url.path == '/snapshot':
+                self._reply(200, {'path': session.snapshot()})
+            else:
+                self._reply(404, {'error': f'{method} {url.path} is not found'})
+        except (AssertionError, KeyError, TypeError, ValueError) as e:
+            self._reply(400, {'error': str(e) or type(e).__name__})
+        except Exception as e:
+            # the client gets an error instead of a dropped connection
+            self.log_error('%s', traceback.format_exc())
+            self._reply(500, {'error': f'{type(e).__name__}: {e}'})
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def address_string(self):
+        # the client address of a unix socket is not a tuple
+        return str(self.client_address[0]) if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _SessionMixIn:
+    session: Session
+    verbose = False
+
+    def service_actions(self):
+        # called by serve_forever between requests
+        self.session.save_if_due()
+
+
+class _Server(_SessionMixIn, ThreadingHTTPServer):
+    pass
+
+
+class _UnixServer(_SessionMixIn, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(
+        session: Session,
+        host: str = '127.0.0.1',
+        port: int = 8080,
+        socket: Optional[str] = None,
+        verbose: bool = False,
+):
+    """
+    Create a server of the session, listening to a unix socket if socket is given
+
+    :param session: the session
+    :param host: host to listen
+    :param port: port to listen, a free port is picked if 0
+    :param socket: path of a unix socket, host and port are ignored if given,
+                   an existing socket at the path is replaced
+    :param verbose: log requests to stderr
+    :return: server, call serve_forever() to start
+    """
+    if socket is not None:
+        if os.path.exists(socket):
+            # a stale socket of a previous server is removed, never other files
+            assert stat.S_ISSOCK(os.stat(socket).st_mode), f'{socket} exists and is not a socket'
+            os.remove(socket)
+        server = _UnixServer(socket, Handler)
+    else:
+        server = _Server((host, port), Handler)
+    server.session = session
+    server.verbose = verbose
+    return server
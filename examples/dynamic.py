@@ -42,7 +42,7 @@ def run(gene_len=5, max_gen=200, problem=rastrigin):
     ps = []
     for i in range(gene_len):
         ax = plt.subplot(gs[0, i])
-        pl, = ax.plot([item.genes[i] for item in p.chromosomes], '.')
+        pl, = ax.plot(p.population.genes[:, i], '.')
         ax.set_ylim(0, 1)
         ax.set_xticks([])
         ax.set_xticklabels([])
@@ -69,10 +69,10 @@ def run(gene_len=5, max_gen=200, problem=rastrigin):
 
     def update(ga: GA):
         for i in range(gene_len):
-            ps[i].set_ydata([item.genes[i] for item in ga.chromosomes])
+            ps[i].set_ydata(ga.population.genes[:, i])
         x_data.append(ga.generation)
         y_data.append(ga.best().raw_fitness)
-        mean.append(np.mean([c.raw_fitness for c in ga.chromosomes]))
+        mean.append(np.mean(ga.population.fitness))
         p2.set_xdata(x_data)
         p2.set_ydata(y_data)
         p3.set_xdata(x_data)
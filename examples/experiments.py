@@ -53,7 +53,7 @@ class GAPlot:
         ))
 
     def update(self, ga: GA):
-        values = [item.fitness for item in ga.chromosomes]
+        values = ga.population.effective_fitness()
         self.gen.append(ga.generation)
         self.best.append(ga.best().raw_fitness)
         self.mean.append(np.mean(values))
@@ -64,7 +64,7 @@ class GAPlot:
         fig = plt.figure(dpi=100, figsize=(10, 5))
         for i in range(self.n):
             ax = fig.add_subplot(self.grid[0, i])
-            ax.plot([item.genes[i] for item in self.ga.chromosomes], '.k', markersize=2)
+            ax.plot(self.ga.population.genes[:, i], '.k', markersize=2)
             ax.set_ylim(0, 1)
             ax.set_xticks([])
             ax.set_xticklabels([])
@@ -22,21 +22,18 @@ import numpy as np
 
 
 def sphere(x):
-    result = 0
-    for i in x:
-        result += i ** 2
-    return result
+    """Works on a single vector or a matrix with one vector per row"""
+    x = np.asarray(x)
+    return np.sum(x ** 2, axis=-1)
 
 
 def rosenbrock(x):
-    result = 0
-    for i in range(len(x) - 1):
-        result += 100 * (x[i + 1] - x[i] ** 2) ** 2 + (1 - x[i]) ** 2
-    return result
+    """Works on a single vector or a matrix with one vector per row"""
+    x = np.asarray(x)
+    return np.sum(100 * (x[..., 1:] - x[..., :-1] ** 2) ** 2 + (1 - x[..., :-1]) ** 2, axis=-1)
 
 
 def rastrigin(x):
-    result = 10 * len(x)
-    for i in x:
-        result += i ** 2 - 10 * np.cos(2 * np.pi * i)
-    return result
+    """Works on a single vector or a matrix with one vector per row"""
+    x = np.asarray(x)
+    return 10 * x.shape[-1] + np.sum(x ** 2 - 10 * np.cos(2 * np.pi * x), axis=-1)
@@ -0,0 +1,77 @@
+#  Copyright (C) 2020 All Rights Reserved
+#
+#      This file is part of genetic_algorithm.
+#
+#      Foobar is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      Foobar is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with Foobar.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
+#
+
+"""
+Memory benchmark reporting bytes per individual.
+
+before: every individual is an object with a __dict__, a list of genes,
+        a reference to Config and its own scaling closure
+after:  a Population keeps genes and other columns in arrays,
+        Chromosome is a slotted view created on demand
+
+Usage: python -m examples.memory [size] [dimension]
+"""
+
+import gc
+import random
+import sys
+import tracemalloc
+
+from ga.conf import Config, FloatItem
+from ga.population import Population
+
+
+class LegacyChromosome:
+    """Same attributes as a Chromosome used to have"""
+
+    def __init__(self, config: Config):
+        self.age = 0
+        self.is_alive = True
+        self._fitness = 0.0
+        self.penalty = 1.0
+        self.scale = lambda x: x
+        self.config = config
+        self.genes = [random.random() for _ in range(len(config.gene_pattern))]
+
+
+def measure(create) -> (object, int):
+    gc.collect()
+    tracemalloc.start()
+    result = create()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def run(size: int = 100000, dimension: int = 10):
+    config = Config([FloatItem(0, 1, 5) for _ in range(dimension)], sum, size=size)
+
+    _, before = measure(lambda: [LegacyChromosome(config) for _ in range(size)])
+    population, after = measure(lambda: Population(config))
+    _, views = measure(lambda: list(population))
+
+    print(f'{size} individuals, {dimension} genes')
+    print(f'before:                {before / size:10.1f} bytes per individual')
+    print(f'after:                 {after / size:10.1f} bytes per individual')
+    print(f'after, all views held: {(after + views) / size:10.1f} bytes per individual')
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:3]])
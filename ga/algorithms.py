@@ -20,12 +20,21 @@
 
 from __future__ import annotations
 
-from collections import Iterable
-from typing import List, Optional, Callable
+import asyncio
+import inspect
+import os
+from collections.abc import Iterable
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from typing import List, Mapping, Optional, Callable, Tuple, Union
+
+import numpy as np
 
 from operators.utils import prettify_matrix
+from .cache import unique_keys
 from .conf import Config
+from .evaluators import AsyncEvaluator, PoolEvaluator
 from .genetic import Chromosome
+from .population import Population
 
 
 class GA(Iterable):
@@ -40,7 +49,8 @@ class GA(Iterable):
         ↓
     * Diversity Control: penalize individuals who have many neighbors
         ↓
-    Scaling: Scale fitness value to provide evolution pressure
+    Scaling: Scale fitness value to provide evolution pressure,
+             effective fitness of the generation is materialized
         ↓
     Selection: create a mating pool for offsprings
         ↓
@@ -58,84 +68,186 @@ class GA(Iterable):
 
     """
 
-    def __init__(self, config: Config, chromosomes: Optional[List[Chromosome]] = None):
+    def __init__(self, config: Config, chromosomes: Optional[Iterable[Chromosome]] = None):
         """
         Create a population for running genetic algorithm
 
         :param config: GA Config
-        :param chromosomes: initial chromosomes, can be used to continue last running
+        :param chromosomes: initial chromosomes or population, can be used to continue last running
         """
         self.config = config
         self.generation = 0
-        self.chromosomes: List[Chromosome] = [] if chromosomes is None else chromosomes
-        self.offsprings: List[Chromosome] = []
+        self.population: Optional[Population] = None
+        self.offsprings = Population.from_chromosomes(config, [])
         if chromosomes is None:
             self.generate_population()
+        else:
+            self.population = Population.from_chromosomes(config, chromosomes)
+
+    @property
+    def chromosomes(self) -> Population:
+        return self.population
+
+    @chromosomes.setter
+    def chromosomes(self, value: Iterable[Chromosome]):
+        self.population = Population.from_chromosomes(self.config, value)
 
     def generate_population(self):
         """
         Generation specific size of chromosomes
         :return:
         """
-        for i in range(self.config.size):
-            self.chromosomes.append(Chromosome(self.config))
+        self.population = Population(self.config)
 
     def diversity(self):
         if self.config.diversity:
-            penalties = self.config.divcon([item.genes for item in self.chromosomes])
-            for i, item in enumerate(self.chromosomes):
-                item.penalty = penalties[i]
+            self.population.penalty[:] = self.config.divcon(self.population.genes)
 
     def scale(self):
+        self.population.effective = None
+        fitness = self.population.effective_fitness()
         if self.config.scaling:
-            scale = self.config.scale([item.fitness for item in self.chromosomes])
-            for item in self.chromosomes:
-                item.scale = scale
+            fitness = np.maximum(self.config.scale(fitness), 0)
+        self.population.effective = np.asarray(fitness, dtype=float)
 
     def create_mating_pool(self) -> List[Chromosome]:
-        return self.config.selection(self.chromosomes, self.config.pool_size)
+        return self.config.selection(
+            self.population,
+            self.config.pool_size,
+            fitness=self.population.effective_fitness(),
+            round_size=self.config.round_size,
+        )
 
     def age_grow(self):
-        for item in self.chromosomes:
-            item.age += 1
+        self.population.age += 1
 
     def eliminate(self):
-        self.config.elimination(self.chromosomes, self.config.pool_size)
+        self.config.elimination(
+            self.population,
+            self.config.pool_size,
+            fitness=self.population.effective_fitness(),
+            round_size=self.config.round_size,
+        )
 
     def crossover(self):
-        mating_pool = self.create_mating_pool()
-        self.offsprings = self.config.mating(mating_pool)
+        mating_pool = Population.from_chromosomes(self.config, self.create_mating_pool())
+        self.offsprings = Population.from_chromosomes(self.config, self.config.mating(mating_pool))
 
     def mutate(self):
         if self.config.mutation_range_shrink:
             sigma = (1 - self.generation / self.config.max_gen) * self.config.mutation_sigma
         else:
             sigma = self.config.mutation_sigma
-        for offspring in self.offsprings:
-            offspring.mutate(sigma=sigma)
+        if self.config.mutation_batch is not None:
+            self.config.mutation_batch(self.offsprings.genes, sigma=sigma)
+            self.offsprings.repair()
+        else:
+            for offspring in self.offsprings:
+                offspring.mutate(sigma=sigma)
+
+    def evaluate(self, population: Population):
+        parameters = population.decode()
+        if self.config.cache is None:
+            population.update_fitness(self._fit(parameters))
+            return
 
-    def evaluate(self, chromosomes: List[Chromosome]):
-        for i in chromosomes:
-            i.fitness = self.config.fit(list(i.decode()))
+        keys, unique, inverse, fitness = self._lookup(parameters)
+        missing = np.flatnonzero(np.isnan(fitness))
+        if len(missing) > 0:
+            fitness[missing] = self._fit(unique[missing])
+            self.config.cache.put_many([keys[i] for i in missing], fitness[missing])
+        population.update_fitness(fitness[inverse])
+
+    async def evaluate_async(self, population: Population):
+        """
+        Evaluate fitness values without blocking the event loop.
+        fit or fit_batch can be a coroutine function. An AsyncEvaluator is awaited directly,
+        coroutine functions are gathered without limit if the evaluator is not an AsyncEvaluator,
+        otherwise the evaluator runs in the default executor of the loop.
+
+        :param population: individuals to be evaluated
+        """
+        parameters = population.decode()
+        if self.config.cache is None:
+            population.update_fitness(await self._fit_async(parameters))
+            return
+
+        keys, unique, inverse, fitness = self._lookup(parameters)
+        missing = np.flatnonzero(np.isnan(fitness))
+        if len(missing) > 0:
+            fitness[missing] = await self._fit_async(unique[missing])
+            self.config.cache.put_many([keys[i] for i in missing], fitness[missing])
+        population.update_fitness(fitness[inverse])
+
+    def _lookup(self, parameters: np.ndarray):
+        """
+        Look up unique rows of parameters in the cache at once
+
+        :param parameters: N×D matrix of decoded parameters
+        :return: keys of unique rows, unique rows, indices to rebuild all rows,
+                 fitness values of unique rows which is nan if not found
+        """
+        keys, unique, inverse = unique_keys(parameters)
+        return keys, unique, inverse, self.config.cache.get_many(keys)
+
+    def _fit(self, parameters: np.ndarray) -> np.ndarray:
+        if self.config.fit_batch is not None:
+            fitness = self.config.fit_batch(parameters)
+        else:
+            fitness = self.config.evaluator.evaluate(self.config.fit, parameters)
+        return self._check_fitness(parameters, fitness)
+
+    async def _fit_async(self, parameters: np.ndarray) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        if self.config.fit_batch is not None:
+            if inspect.iscoroutinefunction(self.config.fit_batch):
+                fitness = await self.config.fit_batch(parameters)
+            else:
+                # a blocking fit_batch runs in the default executor to keep the event loop running
+                fitness = await loop.run_in_executor(None, self.config.fit_batch, parameters)
+                if inspect.isawaitable(fitness):
+                    fitness = await fitness
+        elif isinstance(self.config.evaluator, AsyncEvaluator):
+            fitness = await self.config.evaluator(self.config.fit, parameters.tolist())
+        elif inspect.iscoroutinefunction(self.config.fit):
+            fitness = await AsyncEvaluator()(self.config.fit, parameters.tolist())
+        else:
+            fitness = await loop.run_in_executor(None, self.config.evaluator.evaluate, self.config.fit, parameters)
+        return self._check_fitness(parameters, fitness)
+
+    @staticmethod
+    def _check_fitness(parameters: np.ndarray, fitness) -> np.ndarray:
+        fitness = np.asarray(fitness, dtype=float).reshape(-1)
+        assert len(fitness) == len(parameters), 'a fitness value is required for every individual'
+        assert np.all(fitness >= 0)
+        return fitness
 
     def keep_elitist(self):
-        best_parent = self.best()
-        best_child = self.best(self.offsprings)
+        """
+        Parents among the best elite_size individuals of parents and offsprings survive,
+        the worst offsprings are dropped to leave their slots to revived parents
+        """
+        parents = self.population.fitness
+        candidates = np.concatenate([parents, self.offsprings.fitness])
+        k = min(self.config.elite_size, len(candidates))
+        elites = np.argpartition(-candidates, k - 1)[:k]
+        elites = elites[elites < len(parents)]
+        revived = elites[~self.population.alive[elites]]
+        if len(revived) == 0:
+            return
 
-        if best_parent.raw_fitness > best_child.raw_fitness:
-            best_parent.is_alive = True
-            self.offsprings.remove(best_child)
+        self.population.alive[revived] = True
+        n = min(len(revived), len(self.offsprings))
+        if n > 0:
+            self.offsprings = self.offsprings.delete(np.argpartition(self.offsprings.fitness, n - 1)[:n])
 
     def replace(self):
         if self.config.elitism:
             self.keep_elitist()
 
-        i = 0
-        for offspring in self.offsprings:
-            while i < len(self.chromosomes) and self.chromosomes[i].is_alive:
-                i += 1
-            assert i < len(self.chromosomes)
-            self.chromosomes[i] = offspring
+        dead = np.flatnonzero(~self.population.alive)
+        assert len(self.offsprings) <= len(dead)
+        self.population.put(dead[:len(self.offsprings)], self.offsprings)
 
     # TODO: Standard Deviation?
     def is_satisfied(self) -> bool:
@@ -148,7 +260,7 @@ class GA(Iterable):
         :param callback: a function called every generation
         """
         self.generation = 0
-        self.evaluate(self.chromosomes)
+        self.evaluate(self.population)
         callback(self) if callback is not None else None
         while not self.is_satisfied():
             self.generation += 1
@@ -162,22 +274,54 @@ class GA(Iterable):
             self.replace()
             callback(self) if callback is not None else None
 
-    def best(self, chromosomes: List[Chromosome] = None) -> Chromosome:
+    async def evolve_async(self, callback: Optional[Callable[[GA], None]] = None) -> None:
+        """
+        Same as evolve, but fitness values are evaluated by evaluate_async,
+        so fitness function can be a coroutine function.
+
+        :param callback: a function called every generation, it will be awaited if it returns an awaitable
+        """
+        self.generation = 0
+        await self.evaluate_async(self.population)
+        await _call(callback, self)
+        while not self.is_satisfied():
+            self.generation += 1
+            self.diversity()
+            self.scale()
+            self.age_grow()
+            self.crossover()
+            self.mutate()
+            await self.evaluate_async(self.offsprings)
+            self.eliminate()
+            self.replace()
+            await _call(callback, self)
+
+    def best(self, chromosomes: Optional[Iterable[Chromosome]] = None) -> Chromosome:
         if chromosomes is None:
-            return max(self.chromosomes, key=lambda x: x.raw_fitness)
+            chromosomes = self.population
+        if isinstance(chromosomes, Population):
+            return chromosomes[chromosomes.champion()]
         return max(chromosomes, key=lambda x: x.raw_fitness)
 
     def __getitem__(self, item: int) -> Chromosome:
-        return self.chromosomes[item]
+        return self.population[item]
 
     def __setitem__(self, key: int, value: Chromosome):
-        self.chromosomes[key] = value
+        self.population.put(key, value)
 
     def __iter__(self):
-        return iter(self.chromosomes)
+        return iter(self.population)
 
     def __repr__(self):
-        return prettify_matrix([c.decode() for c in self.chromosomes])
+        return prettify_matrix(self.population.decode().tolist())
+
+
+async def _call(callback: Optional[Callable[[GA], None]], ga: GA):
+    if callback is None:
+        return
+    result = callback(ga)
+    if inspect.isawaitable(result):
+        await result
 
 
 class GAPassive(GA):
@@ -185,23 +329,261 @@ class GAPassive(GA):
     GAPassive accept fitness from exterior when generations is not 0.
     It will not evaluate fitness after evolved, so evolve should be
     called only once.
+
+    Fitness values can also be streamed by ask and tell, candidates are
+    handed out with ids and results are accepted in any order. With the
+    'generational' policy, the GA evolves once quorum of the offsprings are
+    evaluated, the others are dropped and their eliminated parents survive.
+    With the 'steady' policy, an evaluated offspring replaces an individual
+    eliminated by the elimination operator at once and a new offspring is bred
+    in its place, a generation is counted every pool_size insertions.
+    The whole population is evaluated in generation 0 under both policies.
     """
 
+    POLICIES = ('generational', 'steady')
+
     def __init__(
             self,
             config: Config,
             generation: int = 0,
-            population: Optional[List[Chromosome]] = None,
-            offsprings: Optional[List[Chromosome]] = None,
+            population: Optional[Iterable[Chromosome]] = None,
+            offsprings: Optional[Iterable[Chromosome]] = None,
+            policy: str = 'generational',
+            quorum: float = 1.0,
     ):
+        """
+        :param config: GA Config
+        :param generation: current generation
+        :param population: population
+        :param offsprings: offsprings waiting for fitness values
+        :param policy: 'generational' or 'steady', how tell advances the GA
+        :param quorum: fraction of offsprings evaluated before the generational policy evolves
+        """
+        assert policy in self.POLICIES, f'policy could only be one of {self.POLICIES}'
+        assert 0 < quorum <= 1
+
         super().__init__(config, population)
         self.generation = generation
-        self.offsprings = offsprings or []
+        self.offsprings = Population.from_chromosomes(config, offsprings if offsprings is not None else [])
+        self.policy = policy
+        self.quorum = quorum
+        self.inserted = 0
         self._satisfied = None
+        self._cached: Optional[np.ndarray] = None
+        # pending individuals whose fitness values are known, None if all of them are
+        self._evaluated: Optional[np.ndarray] = None
+        # ids and handed out flags of pending individuals, created by the first ask or tell
+        self._ids: Optional[np.ndarray] = None
+        self._asked: Optional[np.ndarray] = None
+        self._next_id = 0
+        self._dropped = 0
 
         if self.generation > 0:
             assert len(self.offsprings) > 0
 
+    @property
+    def pending(self) -> Population:
+        """Individuals whose fitness values are evaluated by exterior"""
+        return self.population if self.generation == 0 else self.offsprings
+
+    @property
+    def evaluated(self) -> np.ndarray:
+        """Whether fitness values of candidates are told or found in the cache, see ask"""
+        if self._asked is None:
+            self._open()
+        return self._evaluated
+
+    def _open(self):
+        """Start handing out pending individuals, those found in the cache are evaluated"""
+        size = len(self.pending)
+        if self._evaluated is None or len(self._evaluated) != size:
+            cached = self._cached
+            self._evaluated = cached.copy() if cached is not None and len(cached) == size \
+                else np.zeros(size, dtype=bool)
+        if self._ids is None or len(self._ids) != size:
+            self._ids = np.arange(self._next_id, self._next_id + size)
+            self._next_id += size
+        self._asked = self._evaluated.copy()
+
+    def _restore_ids(self, ids):
+        assert len(ids) == len(self.pending)
+        self._ids = np.array(ids, dtype=np.int64)
+        self._next_id = int(self._ids.max()) + 1
+
+    def candidates(self) -> List[Tuple[int, List[float]]]:
+        """
+        All candidates whose fitness values are unknown, they are not handed out
+
+        :return: ids and parameters of candidates
+        """
+        if self._asked is None:
+            self._open()
+        if self.is_satisfied():
+            return []
+        parameters = self.pending.decode()
+        return [(int(self._ids[i]), parameters[i].tolist()) for i in np.flatnonzero(~self._evaluated)]
+
+    def ask(self, n: Optional[int] = None) -> List[Tuple[int, List[float]]]:
+        """
+        Hand out pending individuals whose fitness values are unknown,
+        those handed out but not told are handed out again once all the others are
+
+        :param n: maximum number of candidates, all of them if None
+        :return: ids and parameters of candidates
+        """
+        if self._asked is None:
+            self._open()
+        if self.is_satisfied():
+            return []
+
+        waiting = np.flatnonzero(~self._asked)
+        if len(waiting) == 0:
+            self._asked[:] = self._evaluated
+            waiting = np.flatnonzero(~self._asked)
+        if n is not None:
+            waiting = waiting[:n]
+        self._asked[waiting] = True
+
+        parameters = self.pending.decode()
+        return [(int(self._ids[i]), parameters[i].tolist()) for i in waiting]
+
+    def tell(self, results: Union[Mapping[int, float], Iterable[Tuple[int, float]]]) -> int:
+        """
+        Accept fitness values of any candidates in any order, the GA advances
+        by its policy, results of unknown or replaced candidates are ignored
+
+        :param results: fitness values keyed by ids of candidates, or pairs of id and fitness value
+        :return: number of accepted results
+        """
+        if self._asked is None:
+            self._open()
+        if isinstance(results, Mapping):
+            results = results.items()
+        results = [(int(key), float(fitness)) for key, fitness in results]
+        assert all(fitness >= 0 for _, fitness in results), 'fitness value should not be negative'
+        rows = {int(item): i for i, item in enumerate(self._ids)}
+
+        accepted = []
+        for key, fitness in results:
+            i = rows.get(key)
+            if i is None or self._evaluated[i] or self.is_satisfied():
+                continue
+            self.pending.update_fitness(fitness, i)
+            self._evaluated[i] = True
+            accepted.append(i)
+
+        # offsprings of a new generation may all be found in the cache
+        while not self.is_satisfied() and not (self.policy == 'steady' and self.generation > 0):
+            size = len(self.pending)
+            required = size if self.generation == 0 else max(1, int(np.ceil(self.quorum * size)))
+            if np.count_nonzero(self._evaluated) < required:
+                break
+            self._advance()
+
+        if self.policy == 'steady' and self.generation > 0:
+            self._insert(np.flatnonzero(self._evaluated))
+        return len(accepted)
+
+    def _advance(self):
+        """Evolve the generation, offsprings not evaluated are dropped"""
+        self.remember()
+        if self.generation > 0:
+            dropped = np.flatnonzero(~self._evaluated)
+            self.offsprings = self.offsprings.delete(dropped)
+            self._dropped = len(dropped)
+        self.evolve()
+        self._open()
+
+    def _insert(self, rows: np.ndarray):
+        """
+        Replace individuals eliminated by the elimination operator with evaluated offsprings,
+        new offsprings are bred in their places, those found in the cache are inserted at once
+        """
+        queue = list(rows)
+        while len(queue) > 0 and not self.is_satisfied():
+            i = queue.pop(0)
+            offspring = self.offsprings.take([i])
+            if self.config.cache is not None:
+                self.config.cache.put_many(unique_keys(offspring.decode())[0], offspring.fitness)
+
+            # parents eliminated by the last evolve are replaced first
+            if np.all(self.population.alive):
+                self.config.elimination(
+                    self.population,
+                    1,
+                    fitness=self.population.effective_fitness(),
+                    round_size=self.config.round_size,
+                )
+            pool, self.offsprings = self.offsprings, offspring
+            self.replace()
+            self.offsprings = pool
+            # put() drops the materialized effective fitness, the new row is scaled with the others
+            self.scale()
+
+            self.offsprings.put([i], self._breed())
+            self._evaluated[i] = False
+            self._asked[i] = False
+            self._ids[i] = self._next_id
+            self._next_id += 1
+            if self.config.cache is not None:
+                fitness = self._lookup(self.offsprings.take([i]).decode())[3]
+                if not np.isnan(fitness[0]):
+                    self.offsprings.update_fitness(fitness[0], i)
+                    self._evaluated[i] = self._asked[i] = True
+                    queue.append(i)
+
+            self.inserted += 1
+            if self.inserted % self.config.pool_size == 0:
+                self.generation += 1
+                self._satisfied = None
+                if not self.is_satisfied():
+                    self.diversity()
+                    self.scale()
+                    self.age_grow()
+
+    def _breed(self) -> Population:
+        """Create an offspring from parents picked by the selection operator"""
+        parents = self.config.selection(
+            self.population,
+            2,
+            fitness=np.where(self.population.alive, self.population.effective_fitness(), 0),
+            round_size=self.config.round_size,
+        )
+        offsprings = self.offsprings
+        self.offsprings = Population.from_chromosomes(
+            self.config, self.config.mating(Population.from_chromosomes(self.config, parents)))
+        self.mutate()
+        offsprings, self.offsprings = self.offsprings, offsprings
+        return offsprings.take([0])
+
+    def remember(self):
+        """Put fitness values evaluated by exterior into the cache"""
+        if self.config.cache is None or len(self.pending) == 0:
+            return
+        parameters, fitness = self.pending.decode(), self.pending.fitness
+        if self._evaluated is not None:
+            parameters, fitness = parameters[self._evaluated], fitness[self._evaluated]
+        keys, _, inverse = unique_keys(parameters)
+        values = np.zeros(len(keys))
+        values[inverse] = fitness
+        self.config.cache.put_many(keys, values)
+
+    def recall(self):
+        """Fill fitness values of pending individuals which are found in the cache"""
+        if self.config.cache is None or len(self.pending) == 0:
+            return
+        _, _, inverse, fitness = self._lookup(self.pending.decode())
+        fitness = fitness[inverse]
+        self._cached = ~np.isnan(fitness)
+        self.pending.update_fitness(fitness[self._cached], self._cached)
+
+    def replace(self):
+        super().replace()
+        # parents whose offsprings were dropped survive
+        if self._dropped > 0:
+            self.population.alive[np.flatnonzero(~self.population.alive)[:self._dropped]] = True
+            self._dropped = 0
+
     def is_satisfied(self) -> bool:
         if self._satisfied is None:
             self._satisfied = super().is_satisfied()
@@ -212,18 +594,25 @@ class GAPassive(GA):
             return
         self.replace() if self.generation > 0 else None
         self.generation += 1
+        self._satisfied = None
+        self._evaluated = None
+        self._ids = None
+        self._asked = None
         self.diversity()
         self.scale()
         self.age_grow()
         self.crossover()
         self.mutate()
         self.eliminate()
+        self.recall()
 
     @staticmethod
-    def from_dict(config_data: dict, data: Optional[dict] = None):
+    def from_dict(config_data: dict, data: Optional[dict] = None, **kwargs):
         config = Config.from_dict(config_data)
         if data is None:
-            return GAPassive(config)
+            ga = GAPassive(config, **kwargs)
+            ga.recall()
+            return ga
 
         generation = data.get('generation')
         assert generation is not None
@@ -236,18 +625,258 @@ class GAPassive(GA):
 
         offsprings = data.get('offsprings') or []
 
-        return GAPassive(
+        ga = GAPassive(
             config,
             generation,
             [Chromosome.from_dict(config, item) for item in population],
             [Chromosome.from_dict(config, item) for item in offsprings],
+            **kwargs,
         )
+        pending = population if generation == 0 else offsprings
+        if any('evaluated' in item for item in pending):
+            ga._evaluated = np.array([item.get('evaluated', True) for item in pending], dtype=bool)
+        if all('id' in item for item in pending) and len(pending) > 0:
+            ga._restore_ids([item['id'] for item in pending])
+        ga.remember()
+        return ga
+
+    @staticmethod
+    def from_arrays(config_data: dict, data, **kwargs) -> GAPassive:
+        """
+        Restore from columns of the binary state, see ga.state
+
+        :param config_data: config
+        :param data: columns, e.g. loaded by ga.state.load_state
+        :param kwargs: policy and quorum, see GAPassive
+        :return: GAPassive
+        """
+        config = Config.from_dict(config_data)
+
+        generation = int(data['generation'])
+        assert generation >= 0
+
+        population, offsprings = [
+            Population(
+                config,
+                data[f'{name}_genes'],
+                fitness=data[f'{name}_fitness'],
+                age=data[f'{name}_age'],
+                alive=data[f'{name}_alive'],
+            )
+            for name in ('population', 'offsprings')
+        ]
+        assert len(population) == config.size
+        assert np.all(population.fitness >= 0) and np.all(offsprings.fitness >= 0)
+
+        ga = GAPassive(config, generation, population, offsprings, **kwargs)
+        if 'evaluated' in data:
+            ga._evaluated = np.array(data['evaluated'], dtype=bool)
+        if 'ids' in data:
+            ga._restore_ids(data['ids'])
+        ga.remember()
+        return ga
+
+    def serialize_arrays(self) -> dict:
+        """
+        Columns of the binary state, see ga.state.
+        Genes and raw fitness values are kept as they are, so the state is restored exactly.
+
+        :return: dict of numpy arrays
+        """
+        result = {
+            'generation': np.array(self.generation),
+            'satisfied': np.array(self.is_satisfied()),
+            'best': np.array(self.population.champion()),
+            'parameters': self.pending.decode(),
+        }
+        for name, population in (('population', self.population), ('offsprings', self.offsprings)):
+            result[f'{name}_genes'] = population.genes
+            result[f'{name}_fitness'] = population.fitness
+            result[f'{name}_age'] = population.age
+            result[f'{name}_alive'] = population.alive
+        if self._cached is not None:
+            result['cached'] = self._cached
+        if self._evaluated is not None:
+            result['evaluated'] = self._evaluated
+        if self._ids is not None:
+            result['ids'] = self._ids
+        return result
 
     def serialize(self) -> dict:
+        population = [item.serialize() for item in self.population]
+        offsprings = [item.serialize() for item in self.offsprings]
+        if self._cached is not None:
+            for item, cached in zip(population if self.generation == 0 else offsprings, self._cached):
+                item['cached'] = bool(cached)
+        if self._evaluated is not None:
+            for item, evaluated in zip(population if self.generation == 0 else offsprings, self._evaluated):
+                item['evaluated'] = bool(evaluated)
+        if self._ids is not None:
+            for item, key in zip(population if self.generation == 0 else offsprings, self._ids):
+                item['id'] = int(key)
+
         return {
-            'population': [item.serialize() for item in self.chromosomes],
-            'offsprings': [item.serialize() for item in self.offsprings],
+            'population': population,
+            'offsprings': offsprings,
             'generation': self.generation,
             'satisfied': self.is_satisfied(),
             'best': self.best().serialize(),
         }
+
+
+class GASteadyState(GA):
+    """
+    GASteadyState keeps a fixed number of offsprings under evaluation.
+    As soon as the fitness of an offspring returns, one individual is eliminated
+    by the elimination operator and the offspring takes its place, then a new
+    offspring is bred, so workers do not wait for the slowest evaluation.
+
+    A generation is counted every pool_size insertions, diversity penalties
+    and scaling are refreshed once a generation. Offsprings are evaluated
+    concurrently only if the evaluator is a PoolEvaluator, otherwise one by one.
+    """
+
+    def __init__(
+            self,
+            config: Config,
+            chromosomes: Optional[Iterable[Chromosome]] = None,
+            in_flight: Optional[int] = None,
+    ):
+        """
+        :param config: GA Config
+        :param chromosomes: initial chromosomes or population
+        :param in_flight: number of offsprings under evaluation at the same time,
+                          number of workers of the evaluator if None
+        """
+        super().__init__(config, chromosomes)
+        if in_flight is None:
+            evaluator = config.evaluator
+            in_flight = (evaluator.max_workers or os.cpu_count() or 1) if isinstance(evaluator, PoolEvaluator) else 1
+        assert in_flight > 0
+
+        self.in_flight = in_flight
+        self.inserted = 0
+        self._queue: List[Population] = []
+        self._finished = False
+
+    def breed(self) -> Population:
+        """
+        Create an offspring, parents are picked by the selection operator,
+        both offsprings of a pair are used before new parents are picked
+
+        :return: a population of one offspring
+        """
+        if len(self._queue) == 0:
+            parents = self.config.selection(
+                self.population,
+                2,
+                fitness=self.population.effective_fitness(),
+                round_size=self.config.round_size,
+            )
+            parents = Population.from_chromosomes(self.config, parents)
+            self.offsprings = Population.from_chromosomes(self.config, self.config.mating(parents))
+            self.mutate()
+            self._queue = [self.offsprings[[i]] for i in range(len(self.offsprings))]
+        return self._queue.pop()
+
+    def insert(self, offspring: Population, callback: Optional[Callable[[GA], None]] = None):
+        """
+        Replace an individual eliminated by the elimination operator with an evaluated offspring
+
+        :param offspring: a population of one offspring
+        :param callback: a function called every generation
+        """
+        self.config.elimination(
+            self.population,
+            1,
+            fitness=self.population.effective_fitness(),
+            round_size=self.config.round_size,
+        )
+        self.offsprings = offspring
+        self.replace()
+        # put() drops the materialized effective fitness, the new row is scaled with the others
+        self.scale()
+
+        self.inserted += 1
+        if self.inserted % self.config.pool_size == 0:
+            callback(self) if callback is not None else None
+            if self.is_satisfied():
+                self._finished = True
+            else:
+                self.next_generation()
+
+    def next_generation(self):
+        self.generation += 1
+        self.diversity()
+        self.scale()
+        self.age_grow()
+
+    def evolve(self, callback: Optional[Callable[[GA], None]] = None) -> None:
+        """
+        Main method for running steady state genetic algorithm
+
+        :param callback: a function called every generation
+        """
+        self.generation = 0
+        self.inserted = 0
+        self._queue = []
+        self.evaluate(self.population)
+        callback(self) if callback is not None else None
+        self._finished = self.is_satisfied()
+        if self._finished:
+            return
+        self.next_generation()
+
+        if not isinstance(self.config.evaluator, PoolEvaluator):
+            while not self._finished:
+                offspring = self.breed()
+                self.evaluate(offspring)
+                self.insert(offspring, callback)
+            return
+
+        executor = self.config.evaluator.executor
+        futures = {}
+        try:
+            while not self._finished:
+                while len(futures) < self.in_flight and not self._finished:
+                    offspring = self.breed()
+                    if self._recall(offspring):
+                        self.insert(offspring, callback)
+                    else:
+                        futures[self._submit(executor, offspring)] = offspring
+
+                if self._finished:
+                    break
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    offspring = futures.pop(future)
+                    self._remember(offspring, future.result())
+                    self.insert(offspring, callback)
+                    if self._finished:
+                        break
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _submit(self, executor, offspring: Population) -> Future:
+        parameters = offspring.decode()
+        if self.config.fit_batch is not None:
+            return executor.submit(self.config.fit_batch, parameters)
+        return executor.submit(self.config.fit, parameters[0].tolist())
+
+    def _recall(self, offspring: Population) -> bool:
+        """Fill the fitness value from the cache, return True if found"""
+        if self.config.cache is None:
+            return False
+        fitness = self._lookup(offspring.decode())[3]
+        if np.isnan(fitness[0]):
+            return False
+        offspring.update_fitness(fitness)
+        return True
+
+    def _remember(self, offspring: Population, result):
+        parameters = offspring.decode()
+        fitness = self._check_fitness(parameters, result if self.config.fit_batch is not None else [result])
+        offspring.update_fitness(fitness)
+        if self.config.cache is not None:
+            self.config.cache.put_many(unique_keys(parameters)[0], fitness)
@@ -0,0 +1,273 @@
+#  Copyright (C) 2020 All Rights Reserved
+#
+#      This file is part of genetic_algorithm.
+#
+#      Foobar is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      Foobar is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with Foobar.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
+#
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Tuple, List, Optional, Sequence
+
+import numpy as np
+
+Key = Tuple[float, ...]
+
+# approximate size of a float object and of an entry in OrderedDict
+_FLOAT_SIZE = sys.getsizeof(0.0)
+_ENTRY_SIZE = 100
+
+
+class FitnessCache:
+    """
+    A least recently used cache of fitness values in memory.
+    Keys are decoded parameters, which are rounded to the precision of
+    gene pattern, so individuals decoded to same parameters share one evaluation.
+    """
+
+    def __init__(self, max_size: Optional[int] = 100000, max_memory: Optional[int] = None):
+        """
+        :param max_size: maximum number of entries, no limit if None
+        :param max_memory: approximate maximum memory in bytes used by entries, no limit if None
+        """
+        assert max_size is None or max_size > 0
+        assert max_memory is None or max_memory > 0
+
+        self.max_size = max_size
+        self.max_memory = max_memory
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Key, float] = OrderedDict()
+
+    @staticmethod
+    def _sizeof(key: Key) -> int:
+        return sys.getsizeof(key) + _FLOAT_SIZE * (len(key) + 1) + _ENTRY_SIZE
+
+    def get(self, key: Key) -> Optional[float]:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Key, value: float):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            self.memory += self._sizeof(key)
+        self._entries[key] = float(value)
+        self._evict()
+
+    def get_many(self, keys: Sequence[Key]) -> np.ndarray:
+        """
+        :param keys: list of decoded parameters
+        :return: fitness values, nan for those not in the cache
+        """
+        result = np.full(len(keys), np.nan)
+        for i, key in enumerate(keys):
+            value = self.get(key)
+            if value is not None:
+                result[i] = value
+        return result
+
+    def put_many(self, keys: Sequence[Key], values: Sequence[float]):
+        for key, value in zip(keys, values):
+            self.put(key, value)
+
+    def _evict(self):
+        while len(self._entries) > 0 and (
+                (self.max_size is not None and len(self._entries) > self.max_size) or
+                (self.max_memory is not None and self.memory > self.max_memory)
+        ):
+            key, _ = self._entries.popitem(last=False)
+            self.memory -= self._sizeof(key)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.memory = 0
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self),
+            'memory': self.memory,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FitnessStore:
+    """
+    A fitness cache persisted in a SQLite database, it can be shared across runs
+    and command line invocations. Keys are the hash of gene pattern plus decoded
+    parameters, so different problems can share one database file.
+    A store can be used by multiple threads, e.g. the threads of a server.
+    """
+
+    # SQLite limits the number of variables in a statement
+    _CHUNK = 500
+
+    def __init__(self, path: str, gene_pattern: list, max_size: Optional[int] = None, policy: str = 'lru'):
+        """
+        :param path: database file path
+        :param gene_pattern: list of FloatItem of the problem
+        :param max_size: maximum number of entries of this gene pattern, no limit if None
+        :param policy: evict least recently used entries if 'lru', evict oldest entries if 'age'
+        """
+        assert max_size is None or max_size > 0
+        assert policy in ('lru', 'age'), 'policy could only be "lru" or "age"'
+
+        self.path = path
+        self.max_size = max_size
+        self.policy = policy
+        self.pattern = hashlib.sha1(
+            json.dumps([item.serialize() for item in gene_pattern]).encode()).hexdigest()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # the connection is shared by threads and guarded by the lock
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS fitness ('
+                'pattern TEXT NOT NULL, '
+                'parameters BLOB NOT NULL, '
+                'fitness REAL NOT NULL, '
+                'created REAL NOT NULL, '
+                'accessed REAL NOT NULL, '
+                'PRIMARY KEY (pattern, parameters))')
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS fitness_accessed ON fitness (pattern, accessed)')
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS fitness_created ON fitness (pattern, created)')
+
+    @staticmethod
+    def _blob(key: Key) -> bytes:
+        return np.asarray(key, dtype='<f8').tobytes()
+
+    def get(self, key: Key) -> Optional[float]:
+        value = self.get_many([key])[0]
+        return None if np.isnan(value) else float(value)
+
+    def put(self, key: Key, value: float):
+        self.put_many([key], [value])
+
+    def get_many(self, keys: Sequence[Key]) -> np.ndarray:
+        """
+        :param keys: list of decoded parameters
+        :return: fitness values, nan for those not in the store
+        """
+        blobs = [self._blob(key) for key in keys]
+        found = {}
+        with self._lock:
+            for i in range(0, len(blobs), self._CHUNK):
+                chunk = blobs[i:i + self._CHUNK]
+                marks = ','.join('?' * len(chunk))
+                rows = self._connection.execute(
+                    f'SELECT parameters, fitness FROM fitness WHERE pattern = ? AND parameters IN ({marks})',
+                    [self.pattern, *chunk])
+                found.update(rows)
+
+            if len(found) > 0 and self.policy == 'lru':
+                with self._connection:
+                    now = time.time()
+                    self._connection.executemany(
+                        'UPDATE fitness SET accessed = ? WHERE pattern = ? AND parameters = ?',
+                        [(now, self.pattern, blob) for blob in found])
+
+        result = np.array([found.get(blob, np.nan) for blob in blobs], dtype=float)
+        hits = int(np.count_nonzero(~np.isnan(result)))
+        with self._lock:
+            self.hits += hits
+            self.misses += len(blobs) - hits
+        return result
+
+    def put_many(self, keys: Sequence[Key], values: Sequence[float]):
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT INTO fitness (pattern, parameters, fitness, created, accessed) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (pattern, parameters) DO UPDATE SET fitness = excluded.fitness, accessed = excluded.accessed',
+                [(self.pattern, self._blob(key), float(value), now, now) for key, value in zip(keys, values)])
+            self._evict()
+
+    def _evict(self):
+        if self.max_size is None:
+            return
+        excess = len(self) - self.max_size
+        if excess <= 0:
+            return
+        column = 'accessed' if self.policy == 'lru' else 'created'
+        self._connection.execute(
+            f'DELETE FROM fitness WHERE rowid IN ('
+            f'SELECT rowid FROM fitness WHERE pattern = ? ORDER BY {column} LIMIT ?)',
+            (self.pattern, excess))
+        self.evictions += excess
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM fitness WHERE pattern = ?', (self.pattern,))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __contains__(self, key: Key) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM fitness WHERE pattern = ?', (self.pattern,)).fetchone()[0]
+
+
+def unique_keys(parameters: np.ndarray) -> Tuple[List[Key], np.ndarray, np.ndarray]:
+    """
+    Remove duplicated rows of decoded parameters
+
+    :param parameters: N×D matrix of decoded parameters
+    :return: keys of unique rows, the unique rows and indices to rebuild all N rows from unique rows
+    """
+    unique, inverse = np.unique(parameters, axis=0, return_inverse=True)
+    return [tuple(row) for row in unique.tolist()], unique, inverse.reshape(-1)
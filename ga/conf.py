@@ -22,7 +22,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from math import floor
-from typing import List, Callable, Tuple, Any, Optional
+from typing import List, Callable, Tuple, Any, Optional, Sequence, Union
+
+import numpy as np
 
 import operators.crossover as cro
 import operators.diversity as div
@@ -31,6 +33,8 @@ import operators.mating as mat
 import operators.mutation as mut
 import operators.scaling as scl
 import operators.selection as sel
+from .cache import FitnessCache, FitnessStore
+from .evaluators import Evaluator, SerialEvaluator
 
 
 @dataclass
@@ -67,6 +71,55 @@ class FloatItem:
         }
 
 
+_BELOW_ONE = np.nextafter(1.0, 0.0)
+
+
+class GenePattern:
+    """
+    A list of FloatItem compiled into arrays of start, span and precision,
+    so genes of an individual or of a whole population are decoded and encoded at once.
+    """
+
+    def __init__(self, items: List[FloatItem]):
+        """
+        :param items: list of FloatItem
+        """
+        self.start = np.array([item.start for item in items], dtype=float)
+        self.span = np.array([item.end - item.start for item in items], dtype=float)
+        self.precision = np.array([item.precision for item in items], dtype=int)
+        # columns sharing a precision are rounded together
+        self._groups = [(int(p), np.flatnonzero(self.precision == p)) for p in np.unique(self.precision)]
+
+    def decode(self, genes) -> np.ndarray:
+        """
+        Map genes to actual parameters
+
+        :param genes: genes of an individual, or N×D matrix of genes of a population
+        :return: actual parameters in the same shape
+        """
+        parameters = np.asarray(genes, dtype=float) * self.span + self.start
+        if len(self._groups) == 1:
+            return np.round(parameters, self._groups[0][0])
+        for precision, columns in self._groups:
+            parameters[..., columns] = np.round(parameters[..., columns], precision)
+        return parameters
+
+    def encode(self, parameters) -> np.ndarray:
+        """
+        Map actual parameters to genes, genes are repaired by '% 1'.
+        Decoding may round a gene close to 1 up to the end of the range,
+        such a parameter is encoded to the largest gene below 1 rather than wrapped to 0.
+
+        :param parameters: actual parameters of an individual, or N×D matrix of a population
+        :return: genes in the same shape
+        """
+        genes = (np.asarray(parameters, dtype=float) - self.start) / self.span
+        return np.where(np.abs(genes - 1) < 1e-12, _BELOW_ONE, np.mod(genes, 1))
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+
 @dataclass
 class Config:
     def __init__(
@@ -89,6 +142,11 @@ class Config:
             mutation_range_shrink: bool = True,
             divcon: Callable[[list], List[float]] = div.divcon_b,
             scale: Callable[[List[float]], List[float]] = scl.offset,
+            fit_batch: Optional[Callable[[np.ndarray], Sequence[float]]] = None,
+            evaluator: Optional[Evaluator] = None,
+            cache: Optional[Union[FitnessCache, FitnessStore]] = None,
+            round_size: int = 3,
+            elite_size: int = 1,
     ):
         """
         Create a GA Config
@@ -106,10 +164,18 @@ class Config:
         :param selection: Selection operator
         :param elimination: Elimination operator
         :param mating: Mating operator
-        :param crossover: Crossover operator
-        :param mutation: Mutation operator
+        :param crossover: Crossover operator, its batch variant is used for a whole mating pool if there is one
+        :param mutation: Mutation operator, its batch variant is used for all offsprings if there is one
         :param mutation_sigma: The sigma value for normal distribution, only effective when operator is norm_dist
         :param mutation_range_shrink: Change mutation_sigma gradually by every generation
+        :param fit_batch: A function receives a 2-D array of actual data, one row for every individual,
+                          and returns a fitness number for every row. It is preferred over fit if specified.
+        :param evaluator: The way fit is called for a generation, e.g. in a thread pool or a process pool,
+                          individuals are evaluated one by one if None
+        :param cache: A cache of fitness values keyed by actual data, individuals decoded to
+                      the same data will only be evaluated once while they stay in the cache
+        :param round_size: Number of individuals in a round of tournament selection and elimination
+        :param elite_size: Number of best individuals kept by elitism
         """
         if gene_pattern is None:
             raise ValueError('"pattern" has to be a list of item, eg. [FloatItem(min=0.1, max=1, precision=8)]')
@@ -124,22 +190,30 @@ class Config:
 
         assert size >= 2, 'size less than 2 is meaningless'
         assert max_gen > 0, '0 max generation is meaningless'
+        assert round_size > 0, 'round size should be positive'
+        assert 0 < elite_size <= size, 'elite size should be positive and not greater than size'
 
         pool_size = int(floor(size * (crossover_rate if crossover_rate <= 1 else 1)))
         pool_size = pool_size - (pool_size % 2)
         assert pool_size > 0, 'crossover rate is too low to build a valid mating pool'
 
         self.gene_pattern = gene_pattern
+        self.pattern = GenePattern(gene_pattern if isinstance(gene_pattern, list) else [gene_pattern])
         self.size = size
         self._crossover_rate = crossover_rate
         self.pool_size = pool_size
         self.mutation_rate = mutation_rate if mutation_rate <= 1 else 1
         self.fit = fit
+        self.fit_batch = fit_batch
+        self.evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.cache = cache
         self.elitism = elitism
+        self.elite_size = elite_size
         self.diversity = diversity
         self.scaling = scaling
         self.max_gen = max_gen
         self.selection = selection
+        self.round_size = round_size
         self.elimination = elimination
         self.mating = mating
         self.crossover = crossover
@@ -153,24 +227,68 @@ class Config:
             return self._mutation(genes, self.mutation_rate, **kwargs)
 
         self.mutation = m
+        self._mutation_wrapper = m
+        # batch variants are resolved from the current operators unless they are assigned
+        self._batch = {}
+
+    @property
+    def crossover_batch(self) -> Optional[Callable]:
+        """Batch variant of the crossover operator, None if there is not one"""
+        if 'crossover' in self._batch:
+            return self._batch['crossover']
+        return cro.batch(self.crossover)
+
+    @crossover_batch.setter
+    def crossover_batch(self, value: Optional[Callable]):
+        self._batch['crossover'] = value
+
+    @property
+    def mutation_batch(self) -> Optional[Callable]:
+        """
+        Batch variant of the mutation operator with mutation rate, None if there is not one
+        or the mutation operator is replaced by another function
+        """
+        if 'mutation' in self._batch:
+            return self._batch['mutation']
+        if self.mutation is not self._mutation_wrapper:
+            return None
+        mutation_batch = mut.batch(self._mutation)
+        if mutation_batch is None:
+            return None
+
+        def mb(genes: np.ndarray, **kwargs) -> np.ndarray:
+            return mutation_batch(genes, self.mutation_rate, **kwargs)
+
+        return mb
+
+    @mutation_batch.setter
+    def mutation_batch(self, value: Optional[Callable]):
+        self._batch['mutation'] = value
 
     @staticmethod
     def from_dict(data: dict) -> Config:
         pattern = data.get('pattern')
         assert isinstance(pattern, list)
 
+        gene_pattern = [FloatItem.from_dict(item) for item in pattern]
+        cache = data.get('cache')
+        if cache is not None:
+            assert isinstance(cache, dict) and cache.get('path') is not None
+            cache = FitnessStore(cache.get('path'), gene_pattern, cache.get('size'), cache.get('policy', 'lru'))
+
         return Config(
-            gene_pattern=[FloatItem.from_dict(item) for item in pattern],
+            gene_pattern=gene_pattern,
             size=data.get('size', 100),
             crossover_rate=data.get('crossoverRate', 0.8),
             mutation_rate=data.get('mutationRate', 0.05),
             elitism=data.get('elitism', True),
             max_gen=data.get('maxGen', 100),
             diversity=data.get('diversity', True),
+            cache=cache,
         )
 
     def serialize(self):
-        return {
+        result = {
             'pattern': [item.serialize() for item in self.gene_pattern],
             'size': self.size,
             'crossoverRate': self._crossover_rate,
@@ -201,3 +319,10 @@ class Config:
             #     'shrink': self.mutation_range_shrink,
             # },
         }
+        if isinstance(self.cache, FitnessStore):
+            result['cache'] = {
+                'path': self.cache.path,
+                'size': self.cache.max_size,
+                'policy': self.cache.policy,
+            }
+        return result
@@ -0,0 +1,191 @@
+#  Copyright (C) 2020 All Rights Reserved
+#
+#      This file is part of genetic_algorithm.
+#
+#      Foobar is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      Foobar is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with Foobar.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
+#
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from math import ceil
+from typing import List, Callable, Optional, Tuple, Union, Awaitable, Sequence
+
+import numpy as np
+
+
+class Evaluator:
+    """
+    An evaluator calls the fitness function for a list of parameters
+    and returns fitness values in the same order.
+    """
+
+    def __call__(self, fit: Callable[[List[float]], float], parameters: List[List[float]]) -> List[float]:
+        """
+        Evaluate fitness values
+
+        :param fit: fitness function receives actual parameters of an individual
+        :param parameters: actual parameters of all individuals
+        :return: fitness values in the same order as parameters
+        """
+        raise NotImplementedError
+
+    def evaluate(self, fit: Callable[[List[float]], float], parameters: np.ndarray) -> Sequence[float]:
+        """
+        Evaluate fitness values of a matrix of parameters, GA calls this method.
+        Evaluators can override it to avoid converting parameters to lists.
+
+        :param fit: fitness function receives actual parameters of an individual
+        :param parameters: N×D matrix of actual parameters
+        :return: fitness values in the same order as parameters
+        """
+        return self(fit, parameters.tolist())
+
+    def close(self):
+        """Release resources held by the evaluator"""
+        pass
+
+    def __enter__(self) -> Evaluator:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class SerialEvaluator(Evaluator):
+    """
+    Evaluate fitness values one by one in the current thread.
+    """
+
+    def __call__(self, fit: Callable[[List[float]], float], parameters: List[List[float]]) -> List[float]:
+        return [fit(item) for item in parameters]
+
+
+class PoolEvaluator(Evaluator):
+    """
+    Evaluate fitness values by an executor pool. The pool is created when it is
+    first used and reused for every generation until close() is called.
+    """
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            chunksize: Optional[int] = None,
+            initializer: Optional[Callable] = None,
+            initargs: Tuple = (),
+    ):
+        """
+        :param max_workers: number of workers, depends on the executor if None
+        :param chunksize: number of individuals sent to a worker at once,
+                          it is calculated to give every worker about 4 chunks if None
+        :param initializer: a callable called in every worker when it starts
+        :param initargs: arguments passed to initializer
+        """
+        assert max_workers is None or max_workers > 0
+        assert chunksize is None or chunksize > 0
+
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executor: Optional[Executor] = None
+
+    def create_executor(self) -> Executor:
+        raise NotImplementedError
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self.create_executor()
+        return self._executor
+
+    def _chunksize(self, size: int) -> int:
+        if self.chunksize is not None:
+            return self.chunksize
+        workers = self.max_workers or os.cpu_count() or 1
+        return max(1, ceil(size / (workers * 4)))
+
+    def __call__(self, fit: Callable[[List[float]], float], parameters: List[List[float]]) -> List[float]:
+        return list(self.executor.map(fit, parameters, chunksize=self._chunksize(len(parameters))))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+
+
+class ThreadPoolEvaluator(PoolEvaluator):
+    """
+    Evaluate fitness values in threads,
+    useful when the fitness function releases the GIL, e.g. calls a simulator.
+    """
+
+    def create_executor(self) -> Executor:
+        return ThreadPoolExecutor(self.max_workers, initializer=self.initializer, initargs=self.initargs)
+
+
+class ProcessPoolEvaluator(PoolEvaluator):
+    """
+    Evaluate fitness values in processes.
+    The fitness function and parameters have to be picklable,
+    so a lambda or a local function cannot be used as fitness function.
+    """
+
+    def create_executor(self) -> Executor:
+        return ProcessPoolExecutor(self.max_workers, initializer=self.initializer, initargs=self.initargs)
+
+
+class AsyncEvaluator(Evaluator):
+    """
+    Evaluate fitness values by awaiting coroutines in the running event loop,
+    useful when the fitness function is an 'async def' talking to other services.
+    It can only be used by GA.evolve_async.
+    """
+
+    def __init__(self, concurrency: Optional[int] = None):
+        """
+        :param concurrency: maximum number of evaluations in flight, no limit if None
+        """
+        assert concurrency is None or concurrency > 0
+
+        self.concurrency = concurrency
+
+    async def __call__(
+            self,
+            fit: Callable[[List[float]], Union[float, Awaitable[float]]],
+            parameters: List[List[float]],
+    ) -> List[float]:
+        semaphore = asyncio.Semaphore(self.concurrency) if self.concurrency is not None else None
+
+        async def evaluate(item: List[float]) -> float:
+            if semaphore is None:
+                return await _resolve(fit(item))
+            async with semaphore:
+                return await _resolve(fit(item))
+
+        return list(await asyncio.gather(*[evaluate(item) for item in parameters]))
+
+
+async def _resolve(value):
+    return await value if inspect.isawaitable(value) else value
@@ -20,11 +20,13 @@
 
 from __future__ import annotations
 
-import random
-from collections import Iterable
+from collections.abc import Iterable
 from typing import List, Optional
 
+import numpy as np
+
 from operators.utils import repair
+from . import population as pop
 from .conf import Config
 
 
@@ -32,53 +34,103 @@ class Chromosome(Iterable):
     """
     A chromosome contains a serial of genes represented in numbers.
     The gene is a real number from 0 to 1 mapped from actual parameters.
+
+    A chromosome is a view onto one row of a Population, it owns a
+    population of size 1 when it is created alone. It only holds the
+    population and the row index, config and scaling state are shared
+    by the population.
     """
 
+    __slots__ = ('population', 'index')
+
     def __init__(
             self,
             config: Config,
-            genes: Optional[List[float]] = None
+            genes: Optional[List[float]] = None,
+            population: Optional[pop.Population] = None,
+            index: int = 0,
     ):
         """
         Create a new Chromosome with Config
 
         :param config: GA Config
         :param genes: list of real numbers from 0 to 1, it will be repaired by '% 1' if not in the range
+        :param population: the population this chromosome belongs to, a new one will be created if None
+        :param index: row index in the population
         """
-        self.age = 0
-        self.is_alive = True
-        self.fitness = 0.0
-        self.penalty = 1.0
-        self.scale = lambda x: x
-        self.config = config
-        if genes is not None:
-            self.genes = repair(genes)
-        else:
-            self.generate()
+        if population is None:
+            if genes is None:
+                genes = np.random.random(len(config.gene_pattern))
+            population = pop.Population(config, [genes])
+            index = 0
+        self.population = population
+        self.index = index
+
+    @property
+    def config(self) -> Config:
+        return self.population.config
+
+    @property
+    def array(self) -> np.ndarray:
+        """The row of genes in the population, no copy"""
+        return self.population.genes[self.index]
+
+    @property
+    def genes(self) -> List[float]:
+        return self.population.genes[self.index].tolist()
+
+    @genes.setter
+    def genes(self, value: List[float]):
+        self.population.genes[self.index] = value
+        self.population.invalidate(self.index)
 
     @property
     def raw_fitness(self):
-        return self.__fitness
+        return float(self.population.fitness[self.index])
 
     @property
     def fitness(self):
-        result = self.__fitness
+        effective = self.population.effective
+        if effective is not None:
+            return float(effective[self.index])
+        result = self.raw_fitness
         if self.config.diversity:
             result *= self.penalty
-        if self.config.scaling:
-            result = self.scale(result)
         return result if result >= 0 else 0
 
     @fitness.setter
     def fitness(self, value: float):
         assert value >= 0
-        self.__fitness = float(value)
+        self.population.update_fitness(float(value), self.index)
+
+    @property
+    def penalty(self) -> float:
+        return float(self.population.penalty[self.index])
+
+    @penalty.setter
+    def penalty(self, value: float):
+        self.population.penalty[self.index] = value
+        self.population.effective = None
+
+    @property
+    def age(self) -> int:
+        return int(self.population.age[self.index])
+
+    @age.setter
+    def age(self, value: int):
+        self.population.age[self.index] = value
+
+    @property
+    def is_alive(self) -> bool:
+        return bool(self.population.alive[self.index])
+
+    @is_alive.setter
+    def is_alive(self, value: bool):
+        self.population.alive[self.index] = value
 
     def generate(self):
         """Generate and replace genes randomly"""
-        self.genes = []
-        for _ in range(len(self.config.gene_pattern)):
-            self.genes.append(random.random())
+        self.genes = np.random.random(len(self.config.gene_pattern))
 
     def mutate(self, **kwargs):
         """
@@ -94,20 +146,19 @@ class Chromosome(Iterable):
         """
         parameters = data.get('parameters')
         assert parameters is not None
-        assert len(parameters) == len(self.config.gene_pattern), 'incompatitive parameters'
+        assert len(parameters) == len(self.config.pattern), 'incompatitive parameters'
 
-        self.is_alive = data.get('alive')
-        assert isinstance(self.is_alive, bool)
+        alive = data.get('alive')
+        assert isinstance(alive, bool)
+        self.is_alive = alive
 
-        result = []
-        for i, item in enumerate(self.config.gene_pattern):
-            result.append((parameters[i] - item.start) / (item.end - item.start))
-        self.genes = repair(result)
+        self.genes = self.config.pattern.encode(parameters)
 
         self.fitness = data.get('fitness', 0)
 
-        self.age = data.get('age', 0)
-        assert isinstance(self.age, int)
+        age = data.get('age', 0)
+        assert isinstance(age, int)
+        self.age = age
 
     @staticmethod
     def from_dict(config: Config, data: dict):
@@ -122,10 +173,7 @@ class Chromosome(Iterable):
         :return: actual parameters
         """
         # TODO: Logarithmic map to 0 - 1
-        result = []
-        for i, item in enumerate(self.config.gene_pattern):
-            result.append(round(self.genes[i] * (item.end - item.start) + item.start, item.precision))
-        return result
+        return self.population.decode_row(self.index).tolist()
 
     def serialize(self) -> dict:
         return {
@@ -145,6 +193,17 @@ class Chromosome(Iterable):
         a, b = self.config.crossover(self.genes, other.genes)
         return Chromosome(self.config, repair(a)), Chromosome(self.config, repair(b))
 
+    def __copy__(self) -> Chromosome:
+        """
+        Detach the row from its population, config is shared rather than copied
+
+        :return: a chromosome owns its data
+        """
+        return Chromosome(self.config, population=self.population.take([self.index]))
+
+    def __deepcopy__(self, memo) -> Chromosome:
+        return self.__copy__()
+
     def __gt__(self, other: Chromosome):
         return self.fitness > other.fitness
 
@@ -152,13 +211,15 @@ class Chromosome(Iterable):
         return self.fitness < other.fitness
 
     def __getitem__(self, item: int) -> float:
-        return self.genes[item]
+        # read the cell directly rather than converting the whole row
+        return self.population.genes[self.index, item].tolist()
 
     def __setitem__(self, key: int, value: float):
-        self.genes[key] = value
+        self.population.genes[self.index, key] = value
+        self.population.invalidate(self.index)
 
     def __iter__(self):
-        return iter(self.genes)
+        return iter(self.population.genes[self.index])
 
     def __repr__(self):
         return str(self.decode())
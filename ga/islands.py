@@ -0,0 +1,216 @@
+#  Copyright (C) 2020 All Rights Reserved
+#
+#      This file is part of genetic_algorithm.
+#
+#      Foobar is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      Foobar is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with Foobar.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
+#
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import queue
+import random
+from typing import List, Optional
+
+import numpy as np
+
+from .algorithms import GA
+from .conf import Config
+from .genetic import Chromosome
+from .population import Population
+
+TOPOLOGIES = ('ring', 'star', 'full')
+
+
+def topology_targets(topology: str, size: int) -> List[List[int]]:
+    """
+    Islands every island sends its emigrants to
+
+    :param topology: 'ring' sends to the next island,
+                     'star' connects island 0 with all the others,
+                     'full' sends to all other islands
+    :param size: number of islands
+    :return: target islands of every island
+    """
+    assert topology in TOPOLOGIES, f'topology could only be one of {TOPOLOGIES}'
+
+    if size < 2:
+        return [[] for _ in range(size)]
+    if topology == 'ring':
+        return [[(i + 1) % size] for i in range(size)]
+    if topology == 'star':
+        return [list(range(1, size))] + [[0] for _ in range(1, size)]
+    return [[j for j in range(size) if j != i] for i in range(size)]
+
+
+class _Migration:
+    """Callback of an island exchanging its best individuals with other islands"""
+
+    def __init__(self, index: int, interval: int, size: int, targets: List[int], sources: int, inboxes):
+        self.index = index
+        self.interval = interval
+        self.size = size
+        self.targets = targets
+        self.sources = sources
+        self.inboxes = inboxes
+
+    def __call__(self, ga: GA):
+        if ga.generation == 0 or ga.generation % self.interval != 0 or ga.is_satisfied():
+            return
+
+        population = ga.population
+        best = np.argpartition(-population.fitness, self.size - 1)[:self.size]
+        emigrants = (self.index, population.genes[best], population.fitness[best])
+        for target in self.targets:
+            self.inboxes[target].put(emigrants)
+
+        messages = sorted([self.inboxes[self.index].get() for _ in range(self.sources)], key=lambda m: m[0])
+        if len(messages) == 0:
+            return
+        immigrants = population.spawn(np.concatenate([m[1] for m in messages]))
+        immigrants.update_fitness(np.concatenate([m[2] for m in messages]))
+        worst = np.argpartition(population.fitness, len(immigrants) - 1)[:len(immigrants)]
+        population.put(worst, immigrants)
+
+
+def _island(index: int, config: Config, seed: int, migration: _Migration, results):
+    try:
+        random.seed(seed)
+        np.random.seed(seed)
+        ga = GA(config)
+        ga.evolve(migration)
+        population = ga.population
+        results.put((index, population.genes, population.fitness, population.age, None))
+    except BaseException as e:
+        results.put((index, None, None, None, repr(e)))
+        raise
+
+
+class IslandModel:
+    """
+    Island model runs a GA on every island in a separate process.
+    Every migration_interval generations, every island sends copies of its best
+    migration_size individuals to its target islands, the immigrants replace
+    the worst individuals of an island. Migration is synchronous, so results
+    can be reproduced from the seed.
+
+    The config is sent to processes, so fitness function has to be picklable
+    if the start method of processes is not 'fork'.
+    """
+
+    def __init__(
+            self,
+            config: Config,
+            islands: int = 4,
+            migration_interval: int = 10,
+            migration_size: int = 2,
+            topology: str = 'ring',
+            seed: Optional[int] = None,
+            context: Optional[str] = None,
+    ):
+        """
+        :param config: GA Config shared by all islands
+        :param islands: number of islands
+        :param migration_interval: number of generations between migrations
+        :param migration_size: number of individuals an island sends to each target
+        :param topology: 'ring', 'star' or 'full', see topology_targets
+        :param seed: seed of islands, islands are seeded differently from it, random if None
+        :param context: start method of processes, default of multiprocessing if None
+        """
+        assert islands > 0
+        assert migration_interval > 0
+        assert migration_size > 0
+
+        self.config = config
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.targets = topology_targets(topology, islands)
+        self.topology = topology
+        self.sources = [sum(i in targets for targets in self.targets) for i in range(islands)]
+        assert migration_size * max(self.sources) < config.size, 'too many immigrants for the population size'
+
+        self.seeds = np.random.SeedSequence(seed).generate_state(islands).tolist()
+        self.context = mp.get_context(context)
+        self.populations: List[Population] = []
+
+    def evolve(self) -> List[Population]:
+        """
+        Run all islands until max_gen and gather their final populations
+
+        :return: final population of every island
+        """
+        inboxes = [self.context.Queue() for _ in range(self.islands)]
+        results = self.context.Queue()
+        processes = [
+            self.context.Process(
+                target=_island,
+                args=(
+                    i,
+                    self.config,
+                    self.seeds[i],
+                    _Migration(i, self.migration_interval, self.migration_size,
+                               self.targets[i], self.sources[i], inboxes),
+                    results,
+                ),
+                daemon=True,
+            )
+            for i in range(self.islands)
+        ]
+        for process in processes:
+            process.start()
+
+        populations: List[Optional[Population]] = [None] * self.islands
+
+        def receive(result):
+            index, genes, fitness, age, error = result
+            if error is not None:
+                raise RuntimeError(f'island {index} failed: {error}')
+            populations[index] = Population(self.config, genes, fitness=fitness, age=age)
+
+        try:
+            while any(item is None for item in populations):
+                try:
+                    receive(results.get(timeout=0.1))
+                    continue
+                except queue.Empty:
+                    pass
+                # an island may put its result and exit after the timeout
+                exited = [i for i, process in enumerate(processes)
+                          if populations[i] is None and not process.is_alive()]
+                while True:
+                    try:
+                        receive(results.get_nowait())
+                    except queue.Empty:
+                        break
+                for i in exited:
+                    if populations[i] is None and processes[i].exitcode != 0:
+                        raise RuntimeError(f'island {i} exited with code {processes[i].exitcode}')
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            for item in inboxes + [results]:
+                item.close()
+
+        self.populations = populations
+        return populations
+
+    def best(self) -> Chromosome:
+        """The best individual of all islands"""
+        assert len(self.populations) > 0, 'islands have not evolved'
+        return max((item[item.champion()] for item in self.populations), key=lambda x: x.raw_fitness)
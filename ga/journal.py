@@ -0,0 +1,239 @@
+#  Copyright (C) 2020 All Rights Reserved
+#
+#      This file is part of genetic_algorithm.
+#
+#      Foobar is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      Foobar is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with Foobar.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
+#
+
+"""
+Append-only journal of GAPassive states, one record per generation.
+
+A record is a header, a JSON payload and a trailer:
+    header   magic 'GAJR', kind, generation, payload length, offset of its full record
+    payload  GAPassive.serialize() for a full record, changes since the previous record for a delta
+    trailer  offset of the header, magic 'GAJE'
+
+The trailer of the last record is at the end of the file, so the latest
+record is found by one seek. A delta is applied to the records after the
+last full record, which is written at least every full_every records.
+"""
+
+import json
+import os
+import re
+import struct
+from typing import Iterator, Optional, Tuple
+
+EXTENSION = '.journal'
+
+FULL = 0
+DELTA = 1
+
+_HEADER = struct.Struct('<4sBQQQ')
+_TRAILER = struct.Struct('<Q4s')
+_HEADER_MAGIC = b'GAJR'
+_TRAILER_MAGIC = b'GAJE'
+
+
+def natural_key(name: str) -> list:
+    """Sort key ordering numbers in names by value, e.g. 999.json before 1000.json"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', str(name))]
+
+
+def diff(previous: dict, current: dict) -> dict:
+    """
+    Changes of population between two serialized states, offsprings are always new
+
+    :param previous: GAPassive.serialize() of the previous generation
+    :param current: GAPassive.serialize() of the current generation
+    :return: delta payload
+    """
+    assert len(previous['population']) == len(current['population'])
+
+    changed = {}
+    for i, (a, b) in enumerate(zip(previous['population'], current['population'])):
+        if a['parameters'] != b['parameters'] or a['fitness'] != b['fitness'] \
+                or any(a.get(key) != b.get(key) for key in ('cached', 'evaluated', 'id')):
+            changed[str(i)] = {key: value for key, value in b.items() if key not in ('alive', 'age')}
+
+    return {
+        'generation': current['generation'],
+        'satisfied': current['satisfied'],
+        'best': current['best'],
+        'offsprings': current['offsprings'],
+        'changed': changed,
+        'alive': [item['alive'] for item in current['population']],
+        'age': [item['age'] for item in current['population']],
+    }
+
+
+def patch(previous: dict, delta: dict) -> dict:
+    """
+    Apply a delta payload to the previous state
+
+    :param previous: GAPassive.serialize() of the previous generation
+    :param delta: changes created by diff
+    :return: GAPassive.serialize() of the current generation
+    """
+    population = []
+    for i, item in enumerate(previous['population']):
+        item = dict(delta['changed'].get(str(i), item))
+        item['alive'] = delta['alive'][i]
+        item['age'] = delta['age'][i]
+        population.append(item)
+
+    return {
+        'population': population,
+        'offsprings': delta['offsprings'],
+        'generation': delta['generation'],
+        'satisfied': delta['satisfied'],
+        'best': delta['best'],
+    }
+
+
+class Journal:
+    """
+    An append-only file of GAPassive states, see the module documentation
+    """
+
+    def __init__(self, path: str, delta: bool = False, full_every: int = 100):
+        """
+        :param path: journal file path
+        :param delta: append changes since the previous record instead of full states
+        :param full_every: maximum number of records from a full record to the next one
+        """
+        assert full_every > 0
+
+        self.path = str(path)
+        self.delta = delta
+        self.full_every = full_every
+        # the latest state and where its full record is, read or written by this object,
+        # it is read again if the file size changed
+        self._latest: Optional[dict] = None
+        self._size = 0
+        self._base = 0
+        self._count = 0
+
+    def _read_record(self, file, offset: int) -> Tuple[int, int, int, bytes, int]:
+        file.seek(offset)
+        magic, kind, generation, length, base = _HEADER.unpack(file.read(_HEADER.size))
+        assert magic == _HEADER_MAGIC, f'broken journal record at {offset}'
+        payload = file.read(length)
+        assert len(payload) == length, f'broken journal record at {offset}'
+        return kind, generation, base, payload, offset + _HEADER.size + length + _TRAILER.size
+
+    def _tail(self, file) -> Tuple[Optional[int], int]:
+        """
+        Find the last complete record, a record partly written by an interrupted
+        process is skipped by scanning the file from the beginning
+
+        :return: offset of the last complete record or None, end of the last complete record
+        """
+        size = file.seek(0, os.SEEK_END)
+        if size >= _TRAILER.size:
+            file.seek(size - _TRAILER.size)
+            offset, magic = _TRAILER.unpack(file.read(_TRAILER.size))
+            if magic == _TRAILER_MAGIC and offset < size:
+                return offset, size
+
+        last, end = None, 0
+        while end + _HEADER.size <= size:
+            file.seek(end)
+            magic, _, _, length, _ = _HEADER.unpack(file.read(_HEADER.size))
+            stop = end + _HEADER.size + length + _TRAILER.size
+            if magic != _HEADER_MAGIC or stop > size:
+                break
+            file.seek(stop - _TRAILER.size)
+            if _TRAILER.unpack(file.read(_TRAILER.size)) != (end, _TRAILER_MAGIC):
+                break
+            last, end = end, stop
+        return last, end
+
+    def records(self) -> Iterator[Tuple[int, dict]]:
+        """
+        Iterate all generations from the beginning
+
+        :return: generation and GAPassive.serialize() of every record
+        """
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, 'rb') as file:
+            _, end = self._tail(file)
+            offset = 0
+            state = None
+            while offset < end:
+                kind, generation, _, payload, offset = self._read_record(file, offset)
+                data = json.loads(payload)
+                state = data if kind == FULL else patch(state, data)
+                yield generation, state
+
+    def latest(self) -> Optional[dict]:
+        """
+        Read the latest state, only records from its full record are read
+
+        :return: GAPassive.serialize() of the latest generation, None if the journal is empty
+        """
+        if not os.path.isfile(self.path):
+            return None
+        if self._latest is not None and os.path.getsize(self.path) == self._size:
+            return self._latest
+
+        with open(self.path, 'rb') as file:
+            last, size = self._tail(file)
+            if last is None:
+                return None
+            _, _, base, _, _ = self._read_record(file, last)
+
+            offset = base
+            state = None
+            count = 0
+            while offset <= last:
+                kind, _, _, payload, offset = self._read_record(file, offset)
+                data = json.loads(payload)
+                state = data if kind == FULL else patch(state, data)
+                count += 1
+
+        self._latest = state
+        self._size = size
+        self._base = base
+        self._count = count
+        return state
+
+    def append(self, data: dict):
+        """
+        Append a generation
+
+        :param data: GAPassive.serialize()
+        """
+        previous = self.latest() if self.delta else None
+        full = previous is None or self._count >= self.full_every
+
+        with open(self.path, 'ab') as file:
+            with open(self.path, 'rb') as reader:
+                _, offset = self._tail(reader)
+            # drop a record partly written by an interrupted process
+            file.truncate(offset)
+            payload = json.dumps(data if full else diff(previous, data)).encode()
+            base = offset if full else self._base
+            file.write(_HEADER.pack(_HEADER_MAGIC, FULL if full else DELTA, data['generation'], len(payload), base))
+            file.write(payload)
+            file.write(_TRAILER.pack(offset, _TRAILER_MAGIC))
+            size = file.tell()
+
+        self._latest = data
+        self._size = size
+        self._base = base
+        self._count = 1 if full else self._count + 1
@@ -0,0 +1,299 @@
+#  Copyright (C) 2020 All Rights Reserved
+#
+#      This file is part of genetic_algorithm.
+#
+#      Foobar is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      Foobar is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with Foobar.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
+#
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from . import genetic
+from .conf import Config
+
+
+class Population(Sequence):
+    """
+    A population stores the genes of all individuals as one N×D matrix,
+    raw fitness, penalty, age and alive flags are kept as parallel arrays.
+    Effective fitness of a generation, which is penalized and scaled,
+    is materialized by GA as another array and dropped when rows are replaced.
+
+    Decoded parameters are cached per row. Methods changing genes invalidate
+    their rows, call invalidate() after writing to genes directly.
+    Likewise raw fitness should be written by update_fitness(), so that
+    the index of the champion stays valid.
+
+    Indexing with an int returns a Chromosome which is a view onto one row,
+    indexing with a slice or an array of indices returns a new Population.
+    """
+
+    def __init__(
+            self,
+            config: Config,
+            genes=None,
+            fitness=None,
+            penalty=None,
+            age=None,
+            alive=None,
+    ):
+        """
+        Create a population
+
+        :param config: GA Config
+        :param genes: N×D matrix of real numbers from 0 to 1, it will be repaired by '% 1' if not in the range.
+                      If it is None, config.size individuals will be generated randomly.
+        :param fitness: raw fitness values, 0 by default
+        :param penalty: diversity penalties, 1 by default
+        :param age: ages, 0 by default
+        :param alive: alive flags, True by default
+        """
+        dimension = len(config.gene_pattern)
+        if genes is None:
+            genes = np.random.random((config.size, dimension))
+
+        self.config = config
+        self.genes = np.mod(np.array(genes, dtype=float).reshape(-1, dimension), 1)
+        self.fitness = self._column(fitness, 0.0, float)
+        self.penalty = self._column(penalty, 1.0, float)
+        self.age = self._column(age, 0, int)
+        self.alive = self._column(alive, True, bool)
+        self.effective: Optional[np.ndarray] = None
+        self._phenotype: Optional[np.ndarray] = None
+        self._decoded = np.zeros(len(self.genes), dtype=bool)
+        self._champion: Optional[int] = None
+
+    def _column(self, values, default, dtype) -> np.ndarray:
+        if values is None:
+            return np.full(len(self.genes), default, dtype=dtype)
+        column = np.array(values, dtype=dtype).reshape(-1)
+        assert len(column) == len(self.genes), 'every column should have same size as genes'
+        return column
+
+    @staticmethod
+    def from_chromosomes(config: Config, chromosomes: Iterable[genetic.Chromosome]) -> Population:
+        """
+        Gather chromosomes into a population, their data will be copied
+
+        :param config: GA Config
+        :param chromosomes: chromosomes or a population
+        :return: a new population
+        """
+        if isinstance(chromosomes, Population):
+            return chromosomes
+
+        items = list(chromosomes)
+        if len(items) == 0:
+            return Population(config, np.empty((0, len(config.gene_pattern))))
+
+        return Population(
+            config,
+            np.array([item.array for item in items]),
+            fitness=[item.raw_fitness for item in items],
+            penalty=[item.penalty for item in items],
+            age=[item.age for item in items],
+            alive=[item.is_alive for item in items],
+        )
+
+    @property
+    def dimension(self) -> int:
+        return self.genes.shape[1]
+
+    def update_fitness(self, values, indices=slice(None)):
+        """
+        Write raw fitness values, the materialized effective fitness is dropped
+
+        :param values: raw fitness values
+        :param indices: rows to be written, all rows by default
+        """
+        self.fitness[indices] = values
+        self.effective = None
+        self._champion = None
+
+    def champion(self) -> int:
+        """
+        Index of the individual with the highest raw fitness,
+        it is maintained while rows are replaced by put()
+
+        :return: row index
+        """
+        if self._champion is None:
+            self._champion = int(np.argmax(self.fitness))
+        return self._champion
+
+    def effective_fitness(self) -> np.ndarray:
+        """
+        Fitness values used by operators, the materialized array if GA has scaled this generation,
+        otherwise raw fitness multiplied by penalty if diversity control is enabled
+
+        :return: non-negative fitness values
+        """
+        if self.effective is not None:
+            return self.effective
+        fitness = self.fitness * self.penalty if self.config.diversity else self.fitness
+        return np.maximum(fitness, 0)
+
+    def take(self, indices) -> Population:
+        """
+        Copy rows into a new population
+
+        :param indices: a slice, a list of indices or a boolean mask
+        :return: a new population
+        """
+        result = Population(
+            self.config,
+            self.genes[indices],
+            fitness=self.fitness[indices],
+            penalty=self.penalty[indices],
+            age=self.age[indices],
+            alive=self.alive[indices],
+        )
+        # a slice indexes views, the caches are copied so they are not shared with this population
+        if self.effective is not None:
+            result.effective = np.array(self.effective[indices])
+        if self._phenotype is not None:
+            result._phenotype = np.array(self._phenotype[indices])
+            result._decoded = np.array(self._decoded[indices])
+        return result
+
+    def spawn(self, genes) -> Population:
+        """
+        Create new individuals sharing the config of this population
+
+        :param genes: N×D matrix of genes
+        :return: a new population
+        """
+        return Population(self.config, genes)
+
+    def repair(self):
+        """Repair genes by '% 1' in place"""
+        np.mod(self.genes, 1, out=self.genes)
+        self.invalidate()
+
+    def invalidate(self, indices=slice(None)):
+        """
+        Drop cached decoded parameters after genes changed
+
+        :param indices: rows whose genes changed, all rows by default
+        """
+        self._decoded[indices] = False
+
+    def put(self, indices, other: Union[Population, genetic.Chromosome]):
+        """
+        Overwrite rows by the individuals of another population
+
+        :param indices: indices of rows to be replaced
+        :param other: a population whose size matches indices, or a chromosome
+        """
+        if isinstance(other, genetic.Chromosome):
+            other = other.population.take([other.index])
+
+        self.effective = None
+        rows = np.atleast_1d(np.arange(len(self))[indices])
+        if self._champion is not None:
+            if np.any(rows == self._champion):
+                self._champion = None
+            elif len(other) > 0:
+                best = other.champion()
+                if other.fitness[best] > self.fitness[self._champion]:
+                    self._champion = int(rows[best])
+
+        self.genes[indices] = other.genes
+        if other._phenotype is not None:
+            self._phenotype_buffer()[indices] = other._phenotype
+            self._decoded[indices] = other._decoded
+        else:
+            self._decoded[indices] = False
+        self.fitness[indices] = other.fitness
+        self.penalty[indices] = other.penalty
+        self.age[indices] = other.age
+        self.alive[indices] = other.alive
+
+    def delete(self, indices) -> Population:
+        """
+        Remove rows
+
+        :param indices: indices of rows to be removed
+        :return: a new population without those rows
+        """
+        mask = np.ones(len(self), dtype=bool)
+        mask[indices] = False
+        return self.take(mask)
+
+    def _phenotype_buffer(self) -> np.ndarray:
+        if self._phenotype is None:
+            self._phenotype = np.empty_like(self.genes)
+        return self._phenotype
+
+    def decode(self) -> np.ndarray:
+        """
+        Decode genes of all individuals to actual parameters,
+        only rows changed since last decoding are decoded again
+
+        :return: N×D matrix of actual parameters, read only
+        """
+        stale = np.flatnonzero(~self._decoded)
+        if len(stale) == len(self):
+            self._phenotype = self.config.pattern.decode(self.genes)
+        elif len(stale) > 0:
+            self._phenotype[stale] = self.config.pattern.decode(self.genes[stale])
+        self._decoded[:] = True
+
+        result = self._phenotype_buffer().view()
+        result.flags.writeable = False
+        return result
+
+    def decode_row(self, index: int) -> np.ndarray:
+        """
+        Decode genes of an individual to actual parameters
+
+        :param index: row index
+        :return: actual parameters, read only
+        """
+        phenotype = self._phenotype_buffer()
+        if not self._decoded[index]:
+            phenotype[index] = self.config.pattern.decode(self.genes[index])
+            self._decoded[index] = True
+
+        result = phenotype[index].view()
+        result.flags.writeable = False
+        return result
+
+    def copy(self) -> Population:
+        return self.take(slice(None))
+
+    def __len__(self) -> int:
+        return len(self.genes)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            if item < 0:
+                item += len(self)
+            if not 0 <= item < len(self):
+                raise IndexError('population index out of range')
+            return genetic.Chromosome(self.config, population=self, index=int(item))
+        return self.take(item)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield genetic.Chromosome(self.config, population=self, index=i)
+
+    def __repr__(self):
+        return f'<Population size={len(self)} dimension={self.dimension}>'
@@ -0,0 +1,234 @@
+#  Copyright (C) 2020 All Rights Reserved
+#
+#      This file is part of genetic_algorithm.
+#
+#      Foobar is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      Foobar is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with Foobar.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
+#
+
+from __future__ import annotations
+
+import weakref
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .conf import Config
+from .evaluators import ProcessPoolEvaluator
+from .population import Population
+
+
+class Handle(NamedTuple):
+    """Picklable description of a shared array, send it to workers instead of the array"""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+def _release(memory: SharedMemory):
+    try:
+        memory.close()
+    except BufferError:
+        # arrays backed by the block are still referenced, the mapping goes with them
+        pass
+    try:
+        memory.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class SharedArray:
+    """
+    A numpy array stored in a shared memory block owned by this process.
+    The block is unlinked by close(), or when the object is garbage collected
+    or the interpreter exits, so it does not leak if workers crash.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype=float):
+        """
+        :param shape: shape of the array
+        :param dtype: data type of the array
+        """
+        dtype = np.dtype(dtype)
+        size = max(1, int(np.prod(shape)) * dtype.itemsize)
+        self.memory = SharedMemory(create=True, size=size)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.memory.buf)
+        self.handle = Handle(self.memory.name, tuple(shape), dtype.str)
+        self._finalizer = weakref.finalize(self, _release, self.memory)
+
+    def close(self):
+        """Release the block, the array cannot be used anymore"""
+        self.array = None
+        self._finalizer()
+
+
+def attach(handle: Handle) -> Tuple[SharedMemory, np.ndarray]:
+    """
+    Attach a shared array in a worker, the worker never unlinks it.
+    Keep the returned SharedMemory while the array is used, then close it.
+
+    :param handle: handle of a SharedArray
+    :return: the shared memory block and the array backed by it
+    """
+    try:
+        memory = SharedMemory(name=handle.name, track=False)
+    except TypeError:
+        # track is only available since Python 3.13, the resource tracker is shared with
+        # the owner, so the block must not be registered again by a worker
+        register = resource_tracker.register
+        resource_tracker.register = lambda *_: None
+        try:
+            memory = SharedMemory(name=handle.name)
+        finally:
+            resource_tracker.register = register
+    return memory, np.ndarray(handle.shape, dtype=np.dtype(handle.dtype), buffer=memory.buf)
+
+
+class SharedPopulation(Population):
+    """
+    A population whose genes and raw fitness values are stored in shared memory,
+    workers attach them by handles() without copying, e.g. for diversity control.
+    Rows are written in place by put(), repair() and update_fitness(),
+    populations created by take() are ordinary populations.
+    """
+
+    def __init__(self, config: Config, genes=None, fitness=None, penalty=None, age=None, alive=None):
+        super().__init__(config, genes, fitness, penalty, age, alive)
+        self._genes = SharedArray(self.genes.shape)
+        self._genes.array[:] = self.genes
+        self._fitness = SharedArray(self.fitness.shape)
+        self._fitness.array[:] = self.fitness
+        self.genes = self._genes.array
+        self.fitness = self._fitness.array
+
+    def handles(self) -> Tuple[Handle, Handle]:
+        """
+        :return: handles of the gene matrix and the fitness array
+        """
+        return self._genes.handle, self._fitness.handle
+
+    def close(self):
+        """Release shared memory, genes and fitness values are copied back to private arrays"""
+        self.genes = self.genes.copy()
+        self.fitness = self.fitness.copy()
+        self._genes.close()
+        self._fitness.close()
+
+    def __enter__(self) -> SharedPopulation:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+# attached arrays of a worker, keyed by the name of shared memory
+_attached: Dict[str, Tuple[SharedMemory, np.ndarray]] = {}
+
+
+def _worker_arrays(*handles: Handle) -> List[np.ndarray]:
+    names = [handle.name for handle in handles]
+    # blocks replaced by the owner are detached
+    for name in [name for name in _attached if name not in names]:
+        memory = _attached.pop(name)[0]
+        memory.close()
+    for handle in handles:
+        if handle.name not in _attached:
+            _attached[handle.name] = attach(handle)
+    return [_attached[name][1] for name in names]
+
+
+def _evaluate_rows(fit: Callable[[List[float]], float], parameters: Handle, fitness: Handle, start: int, stop: int):
+    source, target = _worker_arrays(parameters, fitness)
+    for i in range(start, stop):
+        target[i] = fit(source[i].tolist())
+
+
+class SharedMemoryEvaluator(ProcessPoolEvaluator):
+    """
+    Evaluate fitness values in processes. Parameters are written to a shared
+    memory block once per generation and workers write fitness values into
+    another block, only row ranges are sent to workers, so individuals are not pickled.
+    The fitness function still has to be picklable.
+
+    Blocks are owned by this process and unlinked by close(),
+    a crashed worker breaks the pool but leaks nothing.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._parameters: Optional[SharedArray] = None
+        self._fitness: Optional[SharedArray] = None
+
+    def _reserve(self, size: int, dimension: int):
+        if self._parameters is not None \
+                and self._parameters.array.shape[0] >= size and self._parameters.array.shape[1] == dimension:
+            return
+        self._release()
+        capacity = max(size, 1)
+        self._parameters = SharedArray((capacity, dimension))
+        self._fitness = SharedArray((capacity,))
+
+    def _release(self):
+        if self._parameters is None:
+            return
+        self._parameters.close()
+        self._fitness.close()
+        self._parameters = None
+        self._fitness = None
+
+    def evaluate(self, fit: Callable[[List[float]], float], parameters: np.ndarray) -> Sequence[float]:
+        parameters = np.asarray(parameters, dtype=float)
+        size = len(parameters)
+        if size == 0:
+            return np.zeros(0)
+
+        self._reserve(size, parameters.shape[1])
+        self._parameters.array[:size] = parameters
+        chunksize = self._chunksize(size)
+        futures = [
+            self.executor.submit(
+                _evaluate_rows, fit, self._parameters.handle, self._fitness.handle, start, min(start + chunksize, size))
+            for start in range(0, size, chunksize)
+        ]
+        try:
+            wait(futures)
+            for future in futures:
+                future.result()
+        except BrokenProcessPool:
+            # a new pool will be created for the next call,
+            # futures are cancelled here since cancel_futures of shutdown needs Python 3.9
+            for future in futures:
+                future.cancel()
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            raise
+        return self._fitness.array[:size].copy()
+
+    def __call__(self, fit: Callable[[List[float]], float], parameters: List[List[float]]) -> List[float]:
+        return self.evaluate(fit, np.array(parameters, dtype=float)).tolist()
+
+    def close(self):
+        self._release()
+        super().close()
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_parameters'] = None
+        state['_fitness'] = None
+        return state
@@ -0,0 +1,106 @@
+#  Copyright (C) 2020 All Rights Reserved
+#
+#      This file is part of genetic_algorithm.
+#
+#      Foobar is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      Foobar is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with Foobar.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
+#
+
+"""
+Binary columnar state of GAPassive, stored as an uncompressed NPZ file.
+
+Columns written by GAPassive.serialize_arrays:
+    generation, satisfied        scalars
+    best                         index of the best individual in population
+    population_genes             N×D genes from 0 to 1
+    population_fitness           raw fitness values
+    population_age               ages
+    population_alive             alive flags
+    offsprings_*                 same columns of offsprings
+    parameters                   decoded parameters of individuals waiting for fitness values,
+                                 offsprings, or population in generation 0
+    cached                       optional, whether those fitness values are found in the cache
+    evaluated                    optional, whether those fitness values are known, written by ask and tell
+    ids                          optional, ids of those individuals handed out by ask
+
+Exterior evaluators read parameters and write fitness values to
+offsprings_fitness (population_fitness in generation 0).
+Members are stored without compression, so they can be memory mapped.
+"""
+
+import os
+import zipfile
+from typing import Dict
+
+import numpy as np
+
+EXTENSION = '.npz'
+
+# size of the fixed part of a local file header in a zip file
+_LOCAL_HEADER = 30
+
+
+def is_state(data) -> bool:
+    """Whether data is a binary state rather than a JSON object"""
+    return data is not None and 'population_genes' in data
+
+
+def save_state(path: str, arrays: Dict[str, np.ndarray]):
+    """
+    Write columns to an NPZ file, the file is replaced atomically
+
+    :param path: file path ends with .npz
+    :param arrays: columns
+    """
+    temp = f'{path}.{os.getpid()}.tmp'
+    with open(temp, 'wb') as file:
+        np.savez(file, **arrays)
+    os.replace(temp, path)
+
+
+def _map_member(path: str, info: zipfile.ZipInfo):
+    with open(path, 'rb') as file:
+        file.seek(info.header_offset + 26)
+        name_length, extra_length = np.frombuffer(file.read(4), dtype='<u2')
+        file.seek(info.header_offset + _LOCAL_HEADER + int(name_length) + int(extra_length))
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(file)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(file)
+        offset = file.tell()
+
+    if dtype.hasobject or len(shape) == 0 or int(np.prod(shape)) == 0:
+        return None
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape, order='F' if fortran else 'C')
+
+
+def load_state(path: str, mmap: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Read columns from an NPZ file
+
+    :param path: file path
+    :param mmap: map uncompressed columns read only instead of reading them into memory
+    :return: columns
+    """
+    result = {}
+    with np.load(path) as data, zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            name = info.filename[:-len('.npy')] if info.filename.endswith('.npy') else info.filename
+            array = None
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                array = _map_member(path, info)
+            result[name] = array if array is not None else data[name]
+    return result
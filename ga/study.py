@@ -0,0 +1,295 @@
+#  Copyright (C) 2020 All Rights Reserved
+#
+#      This file is part of genetic_algorithm.
+#
+#      Foobar is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      Foobar is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with Foobar.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
+#
+
+"""
+Studies of GAPassive stored in a SQLite database, shared by worker processes.
+
+A study is a named GAPassive with its config, its state is stored as the columns of
+GAPassive.serialize_arrays() in NPZ format, so raw fitness values are restored exactly.
+Candidates waiting for fitness values are rows of the trials table:
+    waiting    not claimed by any worker
+    running    claimed by a worker, claimed again by others after the timeout of claim
+    complete   its fitness value is told to the GA
+
+claim and complete run in immediate transactions, so concurrent workers never
+claim the same candidate, and results are told to the GA one transaction at a time.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from .algorithms import GAPassive
+
+WAITING = 'waiting'
+RUNNING = 'running'
+COMPLETE = 'complete'
+
+
+class StudyStorage:
+    """
+    Multiple named studies in one SQLite database file, see the module documentation.
+    Open a StudyStorage in every worker process instead of sharing one.
+    """
+
+    # SQLite limits the number of variables in a statement
+    _CHUNK = 500
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        :param path: database file path
+        :param timeout: seconds to wait for a transaction of another process
+        """
+        self.path = path
+        # the state of a study read by this object and its version,
+        # it is parsed again only if another process changed the study
+        self._studies: Dict[str, Tuple[int, GAPassive]] = {}
+
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        with self._transaction():
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS studies ('
+                'name TEXT PRIMARY KEY, '
+                'config TEXT NOT NULL, '
+                'state BLOB NOT NULL, '
+                'policy TEXT NOT NULL, '
+                'quorum REAL NOT NULL, '
+                'generation INTEGER NOT NULL, '
+                'version INTEGER NOT NULL, '
+                'updated REAL NOT NULL)')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS trials ('
+                'study TEXT NOT NULL, '
+                'id INTEGER NOT NULL, '
+                'generation INTEGER NOT NULL, '
+                'parameters TEXT NOT NULL, '
+                'status TEXT NOT NULL, '
+                'worker TEXT, '
+                'claimed REAL, '
+                'fitness REAL, '
+                'PRIMARY KEY (study, id))')
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS trials_status ON trials (study, status, claimed)')
+
+    @contextmanager
+    def _transaction(self):
+        # immediate transactions take the write lock at the beginning,
+        # so a row read in a transaction is not changed by other processes before it ends
+        self._connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            self._connection.execute('ROLLBACK')
+            raise
+        self._connection.execute('COMMIT')
+
+    def create(self, name: str, config_data: dict, policy: str = 'generational', quorum: float = 1.0) -> bool:
+        """
+        Create a study with the first population, an existing study is kept as it is
+
+        :param name: name of the study
+        :param config_data: config
+        :param policy: 'generational' or 'steady', see GAPassive
+        :param quorum: fraction of offsprings evaluated before the generational policy evolves
+        :return: whether the study is created
+        """
+        with self._transaction():
+            if self._version(name) is not None:
+                return False
+            ga = GAPassive.from_dict(config_data, policy=policy, quorum=quorum)
+            self._connection.execute(
+                'INSERT INTO studies (name, config, state, policy, quorum, generation, version, updated) '
+                'VALUES (?, ?, ?, ?, ?, ?, 0, ?)',
+                (name, json.dumps(config_data), self._blob(ga), policy, quorum, ga.generation, time.time()))
+            self._sync(name, ga)
+            self._save(name, ga)
+        return True
+
+    def studies(self) -> List[str]:
+        """Names of all studies"""
+        return [row[0] for row in self._connection.execute('SELECT name FROM studies ORDER BY name')]
+
+    def delete(self, name: str):
+        """Delete a study and its trials"""
+        with self._transaction():
+            self._connection.execute('DELETE FROM trials WHERE study = ?', (name,))
+            self._connection.execute('DELETE FROM studies WHERE name = ?', (name,))
+        self._studies.pop(name, None)
+
+    def _version(self, name: str) -> Optional[int]:
+        row = self._connection.execute('SELECT version FROM studies WHERE name = ?', (name,)).fetchone()
+        return None if row is None else row[0]
+
+    def load(self, name: str) -> GAPassive:
+        """
+        The GA of a study, changes to it are not stored
+
+        :param name: name of the study
+        :return: GAPassive
+        """
+        row = self._connection.execute(
+            'SELECT config, state, policy, quorum FROM studies WHERE name = ?', (name,)).fetchone()
+        assert row is not None, f'study {name} is not found'
+        config, state, policy, quorum = row
+        with np.load(io.BytesIO(state)) as data:
+            return GAPassive.from_arrays(json.loads(config), dict(data), policy=policy, quorum=quorum)
+
+    def _load(self, name: str) -> GAPassive:
+        version = self._version(name)
+        assert version is not None, f'study {name} is not found'
+        cached = self._studies.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        ga = self.load(name)
+        self._studies[name] = (version, ga)
+        return ga
+
+    @staticmethod
+    def _blob(ga: GAPassive) -> bytes:
+        buffer = io.BytesIO()
+        np.savez(buffer, **ga.serialize_arrays())
+        return buffer.getvalue()
+
+    def _save(self, name: str, ga: GAPassive):
+        version = self._version(name) + 1
+        self._connection.execute(
+            'UPDATE studies SET state = ?, generation = ?, version = ?, updated = ? WHERE name = ?',
+            (self._blob(ga), ga.generation, version, time.time(), name))
+        self._studies[name] = (version, ga)
+
+    def _sync(self, name: str, ga: GAPassive):
+        """Add candidates of the GA as waiting trials, remove unfinished trials of replaced candidates"""
+        candidates = dict(ga.candidates())
+        unfinished = {
+            row[0] for row in self._connection.execute(
+                'SELECT id FROM trials WHERE study = ? AND status != ?', (name, COMPLETE))
+        }
+        self._connection.executemany(
+            'DELETE FROM trials WHERE study = ? AND id = ?',
+            [(name, key) for key in unfinished if key not in candidates])
+        self._connection.executemany(
+            'INSERT OR IGNORE INTO trials (study, id, generation, parameters, status) VALUES (?, ?, ?, ?, ?)',
+            [(name, key, ga.generation, json.dumps(parameters), WAITING)
+             for key, parameters in candidates.items() if key not in unfinished])
+
+    def claim(
+            self,
+            name: str,
+            n: int = 1,
+            worker: Optional[str] = None,
+            timeout: Optional[float] = None,
+    ) -> List[Tuple[int, List[float]]]:
+        """
+        Claim candidates to evaluate, no other worker claims them until they time out
+
+        :param name: name of the study
+        :param n: maximum number of candidates
+        :param worker: name of the worker, only recorded
+        :param timeout: seconds after which a running candidate can be claimed again, never if None
+        :return: ids and parameters of candidates, empty if no candidate is available
+        """
+        assert n > 0
+        now = time.time()
+        with self._transaction():
+            if timeout is None:
+                rows = self._connection.execute(
+                    'SELECT id, parameters FROM trials WHERE study = ? AND status = ? ORDER BY id LIMIT ?',
+                    (name, WAITING, n)).fetchall()
+            else:
+                rows = self._connection.execute(
+                    'SELECT id, parameters FROM trials WHERE study = ? '
+                    'AND (status = ? OR (status = ? AND claimed < ?)) ORDER BY id LIMIT ?',
+                    (name, WAITING, RUNNING, now - timeout, n)).fetchall()
+            self._connection.executemany(
+                'UPDATE trials SET status = ?, worker = ?, claimed = ? WHERE study = ? AND id = ?',
+                [(RUNNING, worker, now, name, key) for key, _ in rows])
+        return [(key, json.loads(parameters)) for key, parameters in rows]
+
+    def complete(self, name: str, results: Union[Mapping[int, float], Iterable[Tuple[int, float]]]) -> int:
+        """
+        Tell fitness values of claimed candidates to the GA, the GA advances by its policy
+        and its new candidates are added, results of replaced or completed candidates are ignored
+
+        :param name: name of the study
+        :param results: fitness values keyed by ids of candidates, or pairs of id and fitness value
+        :return: number of accepted results
+        """
+        if isinstance(results, Mapping):
+            results = results.items()
+        results = dict((int(key), float(fitness)) for key, fitness in results)
+        assert all(fitness >= 0 for fitness in results.values()), 'fitness value should not be negative'
+
+        try:
+            with self._transaction():
+                ga = self._load(name)
+                keys = list(results)
+                unfinished = set()
+                for i in range(0, len(keys), self._CHUNK):
+                    chunk = keys[i:i + self._CHUNK]
+                    marks = ','.join('?' * len(chunk))
+                    unfinished.update(row[0] for row in self._connection.execute(
+                        f'SELECT id FROM trials WHERE study = ? AND status != ? AND id IN ({marks})',
+                        [name, COMPLETE, *chunk]))
+                if len(unfinished) == 0:
+                    return 0
+
+                self._connection.executemany(
+                    'UPDATE trials SET status = ?, fitness = ? WHERE study = ? AND id = ?',
+                    [(COMPLETE, results[key], name, key) for key in unfinished])
+                accepted = ga.tell([(key, results[key]) for key in sorted(unfinished)])
+                self._sync(name, ga)
+                self._save(name, ga)
+        except BaseException:
+            # the GA in memory may be changed by the rolled back transaction
+            self._studies.pop(name, None)
+            raise
+        return accepted
+
+    def status(self, name: str) -> dict:
+        """
+        :param name: name of the study
+        :return: generation, whether it is satisfied, numbers of trials by status and the best individual
+        """
+        ga = self._load(name)
+        counts = dict(self._connection.execute(
+            'SELECT status, COUNT(*) FROM trials WHERE study = ? GROUP BY status', (name,)).fetchall())
+        return {
+            'generation': ga.generation,
+            'satisfied': ga.is_satisfied(),
+            **{status: counts.get(status, 0) for status in (WAITING, RUNNING, COMPLETE)},
+            'best': ga.best().serialize(),
+        }
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self) -> StudyStorage:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -19,8 +19,10 @@
 #
 
 import random
+from functools import partial
+from typing import List, Callable, Optional, Tuple
 
-from typing import List
+import numpy as np
 
 
 def single_point(a: List[float], b: List[float], **_) -> (List[float], List[float]):
@@ -114,3 +116,93 @@ def sbx(a: List[float], b: List[float], eta=2, **_) -> (List[float], List[float]
         offspring_2.append(0.5 * ((1 - beta) * a[i] + (1 + beta) * b[i]))
 
     return offspring_1, offspring_2
+
+
+def single_point_batch(a: np.ndarray, b: np.ndarray, **_) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Same as single_point, but crossover every row of two parent matrices
+    at its own random cut point.
+
+    :param a: P×D matrix of genes
+    :param b: P×D matrix of genes
+    :return: two P×D matrices of offsprings
+    """
+    if np.shape(a) != np.shape(b):
+        raise ValueError('chromosome length should be same')
+
+    rows, cols = np.shape(a)
+    if cols <= 1:
+        return np.array(a, dtype=float), np.array(b, dtype=float)
+
+    points = np.random.randint(1, cols, size=(rows, 1))
+    head = np.arange(cols) < points
+    return np.where(head, a, b), np.where(head, b, a)
+
+
+def blend_batch(a: np.ndarray, b: np.ndarray, alpha=0.5, **_) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Same as blend, but works on two parent matrices at once.
+
+    :param a: P×D matrix of genes
+    :param b: P×D matrix of genes
+    :param alpha: range factor
+    :return: two P×D matrices of offsprings
+    """
+    if np.shape(a) != np.shape(b):
+        raise ValueError('chromosome length should be same')
+
+    low = np.minimum(a, b)
+    hi = np.maximum(a, b)
+    delta = alpha * (hi - low)
+    return (
+        np.random.uniform(low - delta, hi + delta),
+        np.random.uniform(low - delta, hi + delta),
+    )
+
+
+def sbx_batch(a: np.ndarray, b: np.ndarray, eta=2, **_) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Same as sbx, but works on two parent matrices at once.
+
+    :param a: P×D matrix of genes
+    :param b: P×D matrix of genes
+    :param eta: distribution index, small value make the children far from the parents
+    :return: two P×D matrices of offsprings
+    """
+    if np.shape(a) != np.shape(b):
+        raise ValueError('chromosome length should be same')
+
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    mu = np.random.random(np.shape(a))
+    beta = np.where(
+        mu <= 0.5,
+        np.power(2 * mu, 1 / (eta + 1)),
+        np.power(1 / (2 * (1 - mu)), 1 / (eta + 1)),
+    )
+
+    return (
+        0.5 * ((1 + beta) * a + (1 - beta) * b),
+        0.5 * ((1 - beta) * a + (1 + beta) * b),
+    )
+
+
+_BATCH = {
+    single_point: single_point_batch,
+    blend: blend_batch,
+    sbx: sbx_batch,
+}
+
+
+def batch(operator: Callable) -> Optional[Callable]:
+    """
+    Find the batch variant of a crossover operator, keywords are kept
+    if the operator is a functools.partial.
+
+    :param operator: crossover operator works on two lists of genes
+    :return: the operator works on two parent matrices, None if there is not one
+    """
+    if isinstance(operator, partial):
+        func = _BATCH.get(operator.func)
+        return partial(func, *operator.args, **operator.keywords) if func is not None else None
+    return _BATCH.get(operator)
@@ -21,17 +21,91 @@
 #  https://engineering.purdue.edu/~sudhoff/Software%20Distribution/GOSET%202.3%20manual.pdf
 #
 
+from concurrent.futures import ThreadPoolExecutor
 from random import random, randrange
-from typing import List
+from typing import Callable
 
 import numpy as np
 
 
 def _array(item):
-    return np.array(item if isinstance(item, list) else [item])
+    return np.atleast_1d(np.asarray(item, dtype=float))
 
 
-def divcon_a(items: list, hi: float = 0.1, lo: float = 0.02, **_) -> list:
+def _matrix(items) -> np.ndarray:
+    items = np.asarray(items, dtype=float)
+    return items.reshape(len(items), -1)
+
+
+def _distances(items: np.ndarray, squares: np.ndarray, start: int, stop: int, norm: str) -> np.ndarray:
+    """
+    Distances between items[start:stop] and all items
+
+    :return: (stop - start)×N matrix
+    """
+    block = items[start:stop]
+    if norm == 'euclidean':
+        dist = block @ items.T
+        dist *= -2
+        dist += squares[start:stop, None]
+        dist += squares[None, :]
+        np.maximum(dist, 0, out=dist)
+        dist[np.arange(stop - start), np.arange(start, stop)] = 0
+        return np.sqrt(dist, out=dist)
+
+    # infinity norm, keep maximum of every column to avoid a (stop - start)×N×D tensor
+    dist = np.zeros((stop - start, len(items)))
+    diff = np.empty_like(dist)
+    for k in range(items.shape[1]):
+        np.subtract(block[:, k, None], items[None, :, k], out=diff)
+        np.abs(diff, out=diff)
+        np.maximum(dist, diff, out=dist)
+    return dist
+
+
+def _per_row(
+        items: np.ndarray,
+        aggregate: Callable[[np.ndarray], np.ndarray],
+        norm: str,
+        memory: int,
+        threads: int,
+) -> np.ndarray:
+    """
+    Calculate distances between all items tile by tile, only the aggregate
+    of every row is kept, so the N×N distance matrix is never created.
+
+    :param items: N×D matrix
+    :param aggregate: reduce a tile of distances to a value for every row
+    :param norm: 'euclidean' or 'chebyshev'
+    :param memory: approximate maximum memory in bytes used by a tile
+    :param threads: number of threads calculating tiles
+    :return: aggregates of all rows
+    """
+    rows = len(items)
+    step = max(1, memory // max(1, 3 * rows * items.itemsize))
+    squares = np.einsum('ij,ij->i', items, items) if norm == 'euclidean' else None
+
+    def work(start: int) -> np.ndarray:
+        return aggregate(_distances(items, squares, start, min(start + step, rows), norm))
+
+    starts = range(0, rows, step)
+    if threads > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(threads) as executor:
+            parts = list(executor.map(work, starts))
+    else:
+        parts = [work(start) for start in starts]
+
+    return np.concatenate(parts) if len(parts) > 0 else np.zeros(0)
+
+
+def divcon_a(
+        items: list,
+        hi: float = 0.1,
+        lo: float = 0.02,
+        memory: int = 2 ** 26,
+        threads: int = 1,
+        **_,
+) -> list:
     """
     Diversity Control Algorithm A
     Calculate distances between all items, set penalty to those who have
@@ -40,30 +114,25 @@ def divcon_a(items: list, hi: float = 0.1, lo: float = 0.02, **_) -> list:
     :param items: is a list of chromosomes(list of genes) or fitness values
     :param hi: higher bound of distance threshold
     :param lo: higher bound of distance threshold
+    :param memory: approximate maximum memory in bytes used by a tile of distances
+    :param threads: number of threads calculating tiles of distances
     :return: list of penalty
     """
     assert hi >= lo
 
-    # calculate Euclidean distance between all items
-    dist = np.zeros((len(items), len(items)))
-    for i in range(len(items) - 1):
-        genes_i = _array(items[i])
-        for j in range(i + 1, len(items)):
-            genes_j = _array(items[j])
-            dist[i][j] = np.linalg.norm(genes_j - genes_i)
-            dist[j][i] = dist[i][j]
+    # calculate Euclidean distance between all items, only keep the sum of every row
+    items = _matrix(items)
+    sums = _per_row(items, lambda dist: np.sum(dist, axis=1), 'euclidean', memory, threads)
 
     # calculate threshold
     alpha = lo + (random() * (hi - lo))
-    threshold = np.mean(dist) * alpha
+    threshold = np.sum(sums) / (len(items) ** 2) * alpha
 
     # calculate penalty
-    penalties = []
-    for i in range(len(items)):
-        neighbors = len(list(filter(lambda x: x < threshold, dist[i])))
-        penalties.append(1 / neighbors)
+    neighbors = _per_row(
+        items, lambda dist: np.count_nonzero(dist < threshold, axis=1), 'euclidean', memory, threads)
 
-    return penalties
+    return (1 / np.maximum(neighbors, 1)).tolist()
 
 
 def divcon_b(items: list, hi: float = 2.0, lo: float = 0.5, trials: int = 3, **_) -> list:
@@ -82,66 +151,47 @@ def divcon_b(items: list, hi: float = 2.0, lo: float = 0.5, trials: int = 3, **_
     assert hi >= lo
     assert isinstance(trials, int) and trials > 0
 
-    rows, cols = np.shape(items)
-    penalties = [0] * rows
-
-    for _ in range(trials):
-        # create bins
-        bin_num = round((lo + random() * (hi - lo)) * rows)
-        bins = np.linspace(0, 1, bin_num + 1)
-
-        # random vector
-        vector = np.random.permutation(cols)
-
-        # multiply and hash
-        sums = vector.dot(np.array(items).transpose())
-        sums = [i % 1 for i in sums]
-
-        # allocate bins
-        groups: List[List[int]] = [[] for _ in range(bin_num)]
-        for i, item in enumerate(sums):
-            for j in reversed(range(bin_num)):
-                if item >= bins[j]:
-                    groups[j].append(i)
-                    break
-
-        # keep bigger value to prevent special weight
-        # which cause different items have similar sum
-        for group in groups:
-            for index in group:
-                penalty = 1 / len(group) if len(group) > 0 else 1
-                if penalty > penalties[index]:
-                    penalties[index] = penalty
+    items = _matrix(items)
+    rows, cols = items.shape
 
-    return penalties
+    # number of bins and a random vector for every trial
+    bin_nums = [max(1, round((lo + random() * (hi - lo)) * rows)) for _ in range(trials)]
+    vectors = np.array([np.random.permutation(cols) for _ in range(trials)])
+
+    # multiply and hash, one column for every trial
+    sums = np.mod(items @ vectors.T, 1)
+
+    penalties = np.zeros((trials, rows))
+    for t, bin_num in enumerate(bin_nums):
+        # allocate bins, index of the last bin whose left edge is not greater than the sum
+        bins = np.linspace(0, 1, bin_num + 1)[:bin_num]
+        groups = np.digitize(sums[:, t], bins) - 1
+        penalties[t] = 1 / np.bincount(groups, minlength=bin_num)[groups]
+
+    # keep bigger value to prevent special weight
+    # which cause different items have similar sum
+    return np.max(penalties, axis=0).tolist()
 
 
-def divcon_c(items: list, dist_const: float = 0.001, **_) -> list:
+def divcon_c(items: list, dist_const: float = 0.001, memory: int = 2 ** 26, threads: int = 1, **_) -> list:
     """
     Diversity Control Algorithm C
     Penalty depends on calculating the infinity norm between all items.
 
     :param items: is a list of chromosomes(list of genes) or fitness values
     :param dist_const: distance constant, the bigger value the more severe penalty
+    :param memory: approximate maximum memory in bytes used by a tile of distances
+    :param threads: number of threads calculating tiles of distances
     :return: list of penalty
     """
     assert dist_const > 0
 
-    # calculate infinity norm between all items
-    dist = np.zeros((len(items), len(items)))
-    for i in range(len(items) - 1):
-        genes_i = _array(items[i])
-        for j in range(i + 1, len(items)):
-            genes_j = _array(items[j])
-            dist[i][j] = np.linalg.norm(genes_j - genes_i, np.inf)
-            dist[j][i] = dist[i][j]
+    # calculate infinity norm between all items, only keep the sum of kernel of every row
+    sums = _per_row(
+        _matrix(items), lambda dist: np.sum(np.exp(- dist / dist_const), axis=1), 'chebyshev', memory, threads)
 
     # calculate penalty
-    penalties = []
-    for i in range(len(items)):
-        penalties.append(1 / np.sum(np.exp(- dist[i] / dist_const)))
-
-    return penalties
+    return (1 / sums).tolist()
 
 
 def divcon_d(items: list, dist_const: float = 0.001, sample: int = 3, **_) -> list:
@@ -18,9 +18,17 @@
 #  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
 #
 
-import random
+import numpy as np
 
-from operators.utils import tournament
+from operators.utils import tournament_indices, fitness_of
+
+
+def _eliminate(items, indices):
+    if isinstance(items, list):
+        for i in indices:
+            items[i].is_alive = False
+    else:
+        items.alive[indices] = False
 
 
 def random_pick(items: list, size: int, **_) -> None:
@@ -30,30 +38,28 @@ def random_pick(items: list, size: int, **_) -> None:
     :param items: chromosomes
     :param size: number of elimination
     """
-    pool = random.sample(items, size)
-    for item in pool:
-        item.is_alive = False
+    _eliminate(items, np.random.choice(len(items), size, replace=False))
 
 
-def fitness_tournament(items: list, size: int, **_) -> None:
+def fitness_tournament(items: list, size: int, fitness=None, round_size: int = 3, **_) -> None:
     """
     Tournament by fitness
 
     :param items: chromosomes
     :param size: number of elimination
+    :param fitness: effective fitness values of items, read from items if None
+    :param round_size: number of chromosomes in a round
     """
-    pool = tournament(items, [-item.fitness for item in items], size)
-    for item in pool:
-        item.is_alive = False
+    _eliminate(items, tournament_indices(-fitness_of(items, fitness), size, round_size))
 
 
-def age_tournament(items: list, size: int, **_) -> None:
+def age_tournament(items: list, size: int, round_size: int = 3, **_) -> None:
     """
     Tournament by age
 
     :param items: chromosomes
     :param size: number of elimination
+    :param round_size: number of chromosomes in a round
     """
-    pool = tournament(items, [item.age for item in items], size)
-    for item in pool:
-        item.is_alive = False
+    ages = [item.age for item in items] if isinstance(items, list) else items.age
+    _eliminate(items, tournament_indices(ages, size, round_size))
@@ -20,54 +20,84 @@
 
 import random
 
+import numpy as np
 
-def _mate(chromosomes: list) -> list:
-    offsprings = []
-    for i in range(len(chromosomes) // 2):
-        a, b = chromosomes[i * 2] + chromosomes[i * 2 + 1]
-        offsprings.append(a)
-        offsprings.append(b)
+from operators.utils import take, fitness_of
 
-    if len(chromosomes) % 2 != 0:
-        a, b = chromosomes[-1] + random.choice(chromosomes)
-        if random.random() < 0.5:
-            offsprings.append(a)
-        else:
-            offsprings.append(b)
 
-    return offsprings
+def _crossover(parents, first, second):
+    """
+    Crossover parents[first[i]] and parents[second[i]] for every i.
+    A population of parents crossover at once by the batch variant of the
+    crossover operator if there is one, a list of chromosomes crossover pair by pair.
+
+    :param parents: population or list of chromosomes
+    :param first: indices of the first parents
+    :param second: indices of the second parents
+    :return: offsprings, two for every pair in order
+    """
+    if isinstance(parents, list):
+        offsprings = []
+        for i, j in zip(first, second):
+            offsprings.extend(parents[i] + parents[j])
+        return offsprings
+
+    config = parents.config
+    a = parents.genes[first]
+    b = parents.genes[second]
+    if config.crossover_batch is not None:
+        x, y = config.crossover_batch(a, b)
+    else:
+        pairs = [config.crossover(a[i].tolist(), b[i].tolist()) for i in range(len(a))]
+        x = np.array([pair[0] for pair in pairs]).reshape(a.shape)
+        y = np.array([pair[1] for pair in pairs]).reshape(b.shape)
+
+    genes = np.empty((2 * len(a), parents.dimension))
+    genes[0::2] = x
+    genes[1::2] = y
+    return parents.spawn(genes)
+
 
+def _mate(chromosomes) -> list:
+    size = len(chromosomes)
+    first = list(range(0, size - 1, 2))
+    second = list(range(1, size, 2))
 
-def random_mating(chromosomes: list) -> list:
+    if size % 2 == 0:
+        return _crossover(chromosomes, first, second)
+
+    offsprings = _crossover(chromosomes, first + [size - 1], second + [random.randrange(size)])
+    return take(offsprings, list(range(size - 1)) + [size - 1 + random.randrange(2)])
+
+
+def random_mating(chromosomes) -> list:
     """
     Randomly pick two chromosomes as parents, chromosome can be picked many times
 
     :param chromosomes: parents
-    :return: offsprings
+    :return: offsprings, same number as parents
     """
-    offsprings = []
-    for i in range(len(chromosomes)):
-        parents = random.choices(chromosomes, k=2)
-        a, b = parents[0] + parents[1]
-        offsprings.append(a)
-        offsprings.append(b)
-
-    return offsprings
+    size = len(chromosomes)
+    pairs = (size + 1) // 2
+    offsprings = _crossover(
+        chromosomes,
+        np.random.randint(size, size=pairs).tolist(),
+        np.random.randint(size, size=pairs).tolist(),
+    )
+    return take(offsprings, range(size))
 
 
-def random_mating_once(chromosomes: list) -> list:
+def random_mating_once(chromosomes) -> list:
     """
     Randomly pick two chromosomes as parents, every chromosome can only be picked once
 
     :param chromosomes: parents
     :return: offsprings
     """
-    pool = chromosomes[:]
-    random.shuffle(pool)
-    return _mate(pool)
+    return _mate(take(chromosomes, np.random.permutation(len(chromosomes))))
 
 
-def phenotypic_mating(chromosomes: list) -> list:
+def phenotypic_mating(chromosomes) -> list:
     """
     Pick parents ordered by fitness,
     chromosomes whose fitness close to each other will mate
@@ -75,8 +105,8 @@ def phenotypic_mating(chromosomes: list) -> list:
     :param chromosomes: parents
     :return: offsprings
     """
-    pool = sorted(chromosomes)
-    return _mate(pool)
+    order = np.argsort(fitness_of(chromosomes), kind='stable')
+    return _mate(take(chromosomes, order))
 
 
 def genotypic_mating(chromosomes: list) -> list:
@@ -19,8 +19,10 @@
 #
 
 import random
+from functools import partial
+from typing import List, Callable, Optional
 
-from typing import List
+import numpy as np
 
 
 def random_mutate(genes: List[float], rate: float, **_) -> List[float]:
@@ -106,3 +108,97 @@ def vector_relative(genes: List[float], rate: float, sigma: float = 0.2, **_) ->
         return genes
 
     return [genes[i] * (1 + random.gauss(0, sigma)) for i in range(len(genes))]
+
+
+def random_mutate_batch(genes: np.ndarray, rate: float, **_) -> np.ndarray:
+    """
+    Same as random_mutate, but mutates an N×D matrix of genes in place
+
+    :param genes: N×D matrix of genes
+    :param rate: probablity of mutate for every gene value
+    :return: the mutated matrix
+    """
+    mask = np.random.random(genes.shape) < rate
+    genes[mask] = np.random.random(np.count_nonzero(mask))
+    return genes
+
+
+def partial_abs_batch(genes: np.ndarray, rate: float, sigma: float = 0.2, **_) -> np.ndarray:
+    """
+    Same as partial_abs, but mutates an N×D matrix of genes in place
+
+    :param genes: N×D matrix of genes
+    :param rate: probablity of mutate for every gene value
+    :param sigma: sigma for normal distribution
+    :return: the mutated matrix
+    """
+    mask = np.random.random(genes.shape) < rate
+    genes[mask] += np.random.normal(0, sigma, np.count_nonzero(mask))
+    return genes
+
+
+def partial_relative_batch(genes: np.ndarray, rate: float, sigma: float = 0.2, **_) -> np.ndarray:
+    """
+    Same as partial_relative, but mutates an N×D matrix of genes in place
+
+    :param genes: N×D matrix of genes
+    :param rate: probablity of mutate for every gene value
+    :param sigma: sigma for normal distribution
+    :return: the mutated matrix
+    """
+    mask = np.random.random(genes.shape) < rate
+    genes[mask] *= 1 + np.random.normal(0, sigma, np.count_nonzero(mask))
+    return genes
+
+
+def vector_abs_batch(genes: np.ndarray, rate: float, sigma: float = 0.2, **_) -> np.ndarray:
+    """
+    Same as vector_abs, but mutates an N×D matrix of genes in place,
+    every row is chosen by the probablity independently
+
+    :param genes: N×D matrix of genes
+    :param rate: probablity of mutate for every row
+    :param sigma: sigma for normal distribution
+    :return: the mutated matrix
+    """
+    rows = np.random.random(len(genes)) < rate
+    genes[rows] += np.random.normal(0, sigma, (np.count_nonzero(rows), genes.shape[1]))
+    return genes
+
+
+def vector_relative_batch(genes: np.ndarray, rate: float, sigma: float = 0.2, **_) -> np.ndarray:
+    """
+    Same as vector_relative, but mutates an N×D matrix of genes in place,
+    every row is chosen by the probablity independently
+
+    :param genes: N×D matrix of genes
+    :param rate: probablity of mutate for every row
+    :param sigma: sigma for normal distribution
+    :return: the mutated matrix
+    """
+    rows = np.random.random(len(genes)) < rate
+    genes[rows] *= 1 + np.random.normal(0, sigma, (np.count_nonzero(rows), genes.shape[1]))
+    return genes
+
+
+_BATCH = {
+    random_mutate: random_mutate_batch,
+    partial_abs: partial_abs_batch,
+    partial_relative: partial_relative_batch,
+    vector_abs: vector_abs_batch,
+    vector_relative: vector_relative_batch,
+}
+
+
+def batch(operator: Callable) -> Optional[Callable]:
+    """
+    Find the batch variant of a mutation operator, keywords are kept
+    if the operator is a functools.partial.
+
+    :param operator: mutation operator works on a list of genes
+    :return: the operator mutates a matrix of genes in place, None if there is not one
+    """
+    if isinstance(operator, partial):
+        func = _BATCH.get(operator.func)
+        return partial(func, *operator.args, **operator.keywords) if func is not None else None
+    return _BATCH.get(operator)
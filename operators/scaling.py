@@ -18,73 +18,76 @@
 #  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
 #
 
-from typing import List, Callable
+from typing import Sequence
 
 import numpy as np
 
 
-def offset(items: List[float], **_) -> Callable[[float], float]:
+def offset(items: Sequence[float], **_) -> np.ndarray:
     """
     Move down all items by a min(items)
 
     :param items: fitness values
-    :return: mapping function
+    :return: scaled fitness values
     """
-    b = min(items)
-    return lambda x: x - b
+    items = np.asarray(items, dtype=float)
+    return items - np.min(items)
 
 
-def linear_avg(items: List[float], k: float = 10.0, **_) -> Callable[[float], float]:
+def linear_avg(items: Sequence[float], k: float = 10.0, **_) -> np.ndarray:
     """
     Keep average(items) unchanged, scale up items greater then avg,
     scale down items lesser then avg.
 
     :param items: fitness values
     :param k: scale factor
-    :return: mapping function
+    :return: scaled fitness values
     """
     assert k >= 1
 
+    items = np.asarray(items, dtype=float)
     avg = np.average(items)
-    a = (k - 1) * avg / (max(items) - avg)
+    a = (k - 1) * avg / (np.max(items) - avg)
     b = avg * (1 - a)
-    return lambda x: a * x + b
+    return a * items + b
 
 
-def linear_med(items: List[float], k: float = 10.0, **_) -> Callable[[float], float]:
+def linear_med(items: Sequence[float], k: float = 10.0, **_) -> np.ndarray:
     """
     Keep median(items) unchanged, scale up items greater then med,
     scale down items lesser then med.
 
     :param items: fitness values
     :param k: scale factor
-    :return: mapping function
+    :return: scaled fitness values
     """
     assert k >= 1
 
+    items = np.asarray(items, dtype=float)
     med = np.median(items)
-    a = (k - 1) * med / (max(items) - med)
+    a = (k - 1) * med / (np.max(items) - med)
     b = med * (1 - a)
-    return lambda x: a * x + b
+    return a * items + b
 
 
-def linear_map(items: List[float], k: float = 10.0, **_) -> Callable[[float], float]:
+def linear_map(items: Sequence[float], k: float = 10.0, **_) -> np.ndarray:
     """
     A linear scaling maps min(items) to 1, maps max(items) to k.
 
     :param items: fitness values
     :param k: scale factor
-    :return: mapping function
+    :return: scaled fitness values
     """
     assert k >= 1
 
-    m = min(items)
-    a = (k - 1) / (max(items) - m)
+    items = np.asarray(items, dtype=float)
+    m = np.min(items)
+    a = (k - 1) / (np.max(items) - m)
     b = 1 - a * m
-    return lambda x: a * x + b
+    return a * items + b
 
 
-def truncate(items: List[float], factor: float = 2.0, **_) -> Callable[[float], float]:
+def truncate(items: Sequence[float], factor: float = 2.0, **_) -> np.ndarray:
     """
     Truncate lower part of items which smaller(greater) than average.
 
@@ -93,15 +96,16 @@ def truncate(items: List[float], factor: float = 2.0, **_) -> Callable[[float],
                    indicates how far from average.
                    If positive, cut point is below the average, otherwise
                    above the average.
-    :return: mapping function
+    :return: scaled fitness values
     """
+    items = np.asarray(items, dtype=float)
     std = np.std(items)
     avg = np.average(items)
     b = avg - factor * std
-    return lambda x: x - b
+    return items - b
 
 
-def quadratic(items: List[float], hi: float = 10.0, lo: float = 0.01, **_) -> Callable[[float], float]:
+def quadratic(items: Sequence[float], hi: float = 10.0, lo: float = 0.01, **_) -> np.ndarray:
     """
     Non-linear mapping. Map min(items) to lo, max(items) to hi, average(items) to 1.
     The function is quadratic.
@@ -109,17 +113,18 @@ def quadratic(items: List[float], hi: float = 10.0, lo: float = 0.01, **_) -> Ca
     :param items: fitness values
     :param hi: higher bound
     :param lo: lower bound
-    :return: mapping function
+    :return: scaled fitness values
     """
-    f_max = max(items)
+    items = np.asarray(items, dtype=float)
+    f_max = np.max(items)
     f_avg = np.average(items)
-    f_min = min(items)
+    f_min = np.min(items)
 
     left = np.linalg.inv(np.array([[f_max * f_max, f_max, 1],
                                    [f_avg * f_avg, f_avg, 1],
                                    [f_min * f_min, f_min, 1]]))
     right = np.array([hi, 1, lo]).transpose()
 
-    params = list((left.dot(right)).transpose())
+    params = left.dot(right)
 
-    return lambda x: params[0] * x * x + params[1] * x + params[2]
+    return (params[0] * items + params[1]) * items + params[2]
@@ -18,9 +18,9 @@
 #  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
 #
 
-import random
+import numpy as np
 
-from operators.utils import create_wheel, pick_from_wheel, tournament
+from operators.utils import pick_from_wheel, tournament, take, fitness_of
 
 
 def random_pick(items: list, size: int, **_) -> list:
@@ -31,43 +31,47 @@ def random_pick(items: list, size: int, **_) -> list:
     :param size: the mating mating pool
     :return: the mating pool
     """
-    return random.sample(items, size)
+    return take(items, np.random.choice(len(items), size, replace=False))
 
 
-def roulette_wheel(items: list, size: int, **_) -> list:
+def roulette_wheel(items: list, size: int, fitness=None, **_) -> list:
     """
     Pick item randomly at a roulette wheel of which width is the fitness value.
 
     :param items: list of chromosome, fitness value has to be positive
     :param size: the mating mating pool
+    :param fitness: effective fitness values of items, read from items if None
     :return: the mating pool
     """
-    wheel = create_wheel([item.fitness for item in items])
+    wheel = np.cumsum(fitness_of(items, fitness))
     return pick_from_wheel(items, wheel, size)
 
 
-def fitness_tournament(items: list, size: int, **_) -> list:
+def fitness_tournament(items: list, size: int, fitness=None, round_size: int = 3, **_) -> list:
     """
     Pick item by rounds of tournament.
 
     :param items: list of chromosome, fitness value has to be positive
     :param size: the mating mating pool
+    :param fitness: effective fitness values of items, read from items if None
+    :param round_size: number of chromosomes in a round
     :return: the mating pool
     """
-    return tournament(items, [item.fitness for item in items], size)
+    return tournament(items, fitness_of(items, fitness), size, round_size)
 
 
-def rank(items: list, size: int, **_) -> list:
+def rank(items: list, size: int, fitness=None, **_) -> list:
     """
     Derived from roulette wheel, roulette created by rank number,
     the higher fitness value the rank number will be.
 
     :param items: list of chromosome, fitness value has to be positive
     :param size: the mating mating pool
+    :param fitness: effective fitness values of items, read from items if None
     :return: the mating pool
     """
-    items_sorted = sorted(items)
-    length = len(items_sorted)
+    ranks = np.empty(len(items))
+    ranks[np.argsort(fitness_of(items, fitness), kind='stable')] = np.arange(1, len(items) + 1)
 
-    wheel = create_wheel([i for i in range(1, length + 1)])
+    wheel = np.cumsum(ranks)
     return pick_from_wheel(items, wheel, size)
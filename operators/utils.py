@@ -18,9 +18,9 @@
 #  Written by Vergil Choi <vergil.choi.zyc@gmail.com>, Jul 2020
 #
 
-import random
-from copy import deepcopy
-from typing import TypeVar, List
+from typing import TypeVar, List, Sequence, Optional
+
+import numpy as np
 
 T = TypeVar('T')
 S = TypeVar('S')
@@ -42,52 +42,129 @@ def prettify_matrix(matrix):
     return '\n'.join(table)
 
 
+def take(items, indices):
+    """
+    Pick items by indices without copying objects.
+    A list gives a list of references, a population gives a new population of those rows.
+
+    :param items: list or population
+    :param indices: indices of items
+    :return: picked items
+    """
+    if isinstance(items, list):
+        return [items[i] for i in indices]
+    return items[np.asarray(indices, dtype=int)]
+
+
+def fitness_of(items: Sequence, fitness: Optional[Sequence[float]] = None) -> np.ndarray:
+    """
+    Fitness values of items as an array
+
+    :param items: a list of chromosomes or a population
+    :param fitness: fitness values materialized by the caller, used directly if given
+    :return: fitness values
+    """
+    if fitness is not None:
+        return np.asarray(fitness, dtype=float)
+    if isinstance(items, list):
+        return np.array([item.fitness for item in items], dtype=float)
+    return items.effective_fitness()
+
+
 def create_wheel(items: List[T]) -> List[T]:
     assert len(items) > 0, 'items cannot be empty'
 
-    wheel = [items[0]]
-    for i in range(1, len(items)):
-        wheel.append(wheel[-1] + items[i])
-    return wheel
+    return np.cumsum(items).tolist()
+
+
+def spin_wheel(wheel: Sequence[float], size: int) -> np.ndarray:
+    """
+    Draw indices from a roulette wheel by binary search at once
+
+    :param wheel: cumulative widths, e.g. created by create_wheel
+    :param size: number of picks
+    :return: indices of picked slots
+    """
+    wheel = np.asarray(wheel, dtype=float)
+    picks = np.random.random(size) * wheel[-1]
+    return np.minimum(np.searchsorted(wheel, picks, side='left'), len(wheel) - 1)
 
 
 def pick_from_wheel(items: List[T], wheel: List[S], size: int) -> List[T]:
     assert len(items) == len(wheel), 'items and wheel should have same size'
     assert size <= len(items), 'size cannot be greater than items size'
 
-    pool = []
-    total = wheel[-1]
-    for i in range(size):
-        pick = random.random() * total
-        # TODO: use binary search to reduce time complexity
-        j = 0
-        while pick > wheel[j]:
-            j += 1
-        pool.append(deepcopy(items[j]))
-
-    return pool
+    return take(items, spin_wheel(wheel, size))
+
+
+def _sample_rows(population: int, rows: int, size: int) -> np.ndarray:
+    """
+    Sample indices without replacement for every row independently
+
+    :param population: indices are drawn from range(population)
+    :param rows: number of rows
+    :param size: number of indices in every row, not greater than population
+    :return: rows×size matrix of indices
+    """
+    if size * 2 > population:
+        return np.argsort(np.random.random((rows, population)), axis=1)[:, :size]
+
+    samples = np.random.randint(population, size=(rows, size))
+    while True:
+        ordered = np.sort(samples, axis=1)
+        duplicated = np.any(ordered[:, 1:] == ordered[:, :-1], axis=1)
+        count = np.count_nonzero(duplicated)
+        if count == 0:
+            return samples
+        samples[duplicated] = np.random.randint(population, size=(count, size))
+
+
+def tournament_indices(values: Sequence[float], size: int, round_size: int = 3) -> np.ndarray:
+    """
+    Pick indices by rounds of tournament, the biggest value in a round wins,
+    a winner cannot join following rounds.
+
+    Contestants of all remaining rounds are drawn as an index matrix at once.
+    When several rounds are won by the same index, only the first one counts,
+    the others are drawn again from the remaining indices.
+
+    :param values: values compared in tournaments
+    :param size: number of winners
+    :param round_size: number of contestants in a round
+    :return: indices of winners in order
+    """
+    values = np.asarray(values, dtype=float)
+    assert size <= len(values), 'size could not be greater than items size'
+    assert round_size > 0, 'round size should be positive'
+
+    remain = np.ones(len(values), dtype=bool)
+    winners = []
+    need = size
+    while need > 0:
+        indices = np.flatnonzero(remain)
+        if len(indices) <= round_size:
+            # every remaining index joins every round, so they win by order
+            order = indices[np.argsort(-values[indices], kind='stable')]
+            winners.append(order[:need])
+            break
+
+        contestants = indices[_sample_rows(len(indices), need, round_size)]
+        best = contestants[np.arange(need), np.argmax(values[contestants], axis=1)]
+        _, first = np.unique(best, return_index=True)
+        best = best[np.sort(first)]
+
+        winners.append(best)
+        remain[best] = False
+        need -= len(best)
+
+    return np.concatenate(winners) if len(winners) > 0 else np.zeros(0, dtype=int)
 
 
 def tournament(items: List[T], values: List[S], size: int, round_size: int = 3) -> List[T]:
     assert len(items) == len(values), 'items and values should have same size'
     assert size <= len(items), 'size could not be greater than items size'
 
-    remain = [i for i in range(len(items))]
-
-    pool = []
-    for i in range(size):
-        round_pool = random.sample(remain, min(len(remain), round_size))
-        max_index = round_pool[0]
-        max_value = values[round_pool[0]]
-        for index in round_pool:
-            if values[index] > max_value:
-                max_value = values[index]
-                max_index = index
-
-        pool.append(items[max_index])
-        remain.remove(max_index)
-
-    return pool
+    return take(items, tournament_indices(values, size, round_size))
 
 
 def repair(genes: List[float]) -> List[float]:
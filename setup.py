@@ -15,7 +15,7 @@ setup(
     long_description_content_type='text/markdown',
     url='https://github.com/vergilchoi/genetic_algorithm',
     packages=find_packages(),
-    python_requires='>=3.6',
+    python_requires='>=3.8',
     install_requires=['matplotlib', 'click', 'pyyaml', 'numpy'],
     classifiers=[
         'Programming Language :: Python :: 3',
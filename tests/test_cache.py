@@ -0,0 +1,115 @@
+import os
+import tempfile
+import unittest
+
+from ga.algorithms import GA, GAPassive
+from ga.cache import FitnessCache, FitnessStore
+from ga.conf import Config, FloatItem
+from ga.genetic import Chromosome
+
+
+class TestCache(unittest.TestCase):
+
+    def test_get_put(self):
+        cache = FitnessCache()
+        self.assertIsNone(cache.get((1.0, 2.0)))
+        cache.put((1.0, 2.0), 3)
+        self.assertEqual(cache.get((1.0, 2.0)), 3.0)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_lru_eviction(self):
+        cache = FitnessCache(max_size=2)
+        cache.put((1.0,), 1)
+        cache.put((2.0,), 2)
+        cache.get((1.0,))
+        cache.put((3.0,), 3)
+        self.assertIn((1.0,), cache)
+        self.assertNotIn((2.0,), cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_memory_budget(self):
+        cache = FitnessCache(max_size=None, max_memory=2000)
+        for i in range(100):
+            cache.put((float(i), 0.0, 0.0), i)
+        self.assertLessEqual(cache.memory, 2000)
+        self.assertGreater(cache.evictions, 0)
+        self.assertEqual(len(cache) + cache.evictions, 100)
+
+    def test_get_many(self):
+        cache = FitnessCache()
+        cache.put_many([(1.0,), (2.0,)], [1, 2])
+        values = cache.get_many([(2.0,), (4.0,)])
+        self.assertEqual(values[0], 2)
+        self.assertNotEqual(values[1], values[1])
+
+    def test_ga_evaluate(self):
+        calls = []
+
+        def fit(data):
+            calls.append(data)
+            return abs(sum(data))
+
+        cache = FitnessCache()
+        config = Config([FloatItem(0, 1, 1), FloatItem(0, 5, 1)], fit=fit, size=6, cache=cache)
+        p = GA(config, [Chromosome(config, [0.5, 0.5]) for _i in range(5)] + [Chromosome(config, [0, 0])])
+        p.evaluate(p.chromosomes)
+        self.assertEqual(len(calls), 2)
+        for item in p.chromosomes:
+            self.assertEqual(item.raw_fitness, abs(sum(item.decode())))
+
+        p.evaluate(p.chromosomes)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cache.hits, 2)
+
+
+class TestStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'fitness.db')
+        self.pattern = [FloatItem(0, 1, 1), FloatItem(0, 5, 1)]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_persist(self):
+        store = FitnessStore(self.path, self.pattern)
+        store.put_many([(0.5, 1.0), (0.1, 0.0)], [1, 2])
+        store.close()
+
+        store = FitnessStore(self.path, self.pattern)
+        values = store.get_many([(0.1, 0.0), (0.2, 0.0), (0.5, 1.0)])
+        self.assertEqual(values[0], 2)
+        self.assertNotEqual(values[1], values[1])
+        self.assertEqual(values[2], 1)
+        self.assertEqual(store.hits, 2)
+        self.assertEqual(store.misses, 1)
+
+        other = FitnessStore(self.path, [FloatItem(0, 1, 2), FloatItem(0, 5, 1)])
+        self.assertIsNone(other.get((0.5, 1.0)))
+
+    def test_eviction(self):
+        store = FitnessStore(self.path, self.pattern, max_size=3, policy='age')
+        store.put_many([(float(i), 0.0) for i in range(5)], range(5))
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.evictions, 2)
+
+    def test_passive(self):
+        config_data = {
+            'pattern': [item.serialize() for item in self.pattern],
+            'size': 4,
+            'cache': {'path': self.path},
+        }
+        data = GAPassive.from_dict(config_data).serialize()
+        self.assertTrue(all('cached' in item for item in data['population']))
+        for item in data['population']:
+            item['fitness'] = sum(item['parameters'])
+
+        ga = GAPassive.from_dict(config_data, data)
+        ga.evolve()
+        data = ga.serialize()
+        self.assertEqual(len(ga.config.cache), len({tuple(item.decode()) for item in ga.population}))
+        for item in data['offsprings']:
+            if item['cached']:
+                self.assertEqual(item['fitness'], sum(item['parameters']))
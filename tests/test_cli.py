@@ -117,3 +117,38 @@ class TestCLI(TestCase):
         self.assertTrue(path.joinpath('000.json').exists())
         self.assertDictEqual(functions.load_input_file(path.joinpath('000.json')), self.ga_data)
         shutil.rmtree(path)
+
+    def test_binary_state(self):
+        json_path = self.get_path('test_state.json')
+        npz_path = self.get_path('test_state.npz')
+
+        functions.dump_output(json_path, functions.evolve_ga(self.config_data, self.ga_data))
+        ga = functions.evolve_ga(self.config_data, functions.load_input_file(json_path))
+        functions.dump_output(npz_path, ga)
+        data = functions.load_input_file(npz_path)
+        self.assertEqual(int(data['generation']), 2)
+
+        functions.dump_output(json_path, functions.evolve_ga(self.config_data, data))
+        self.assertEqual(functions.load_input_file(json_path)['generation'], 3)
+        os.remove(json_path)
+        os.remove(npz_path)
+
+    def test_load_input_file_from_dir_past_999(self):
+        path = self.get_path('test_input/')
+        path.mkdir()
+        path.joinpath('999.json').touch()
+        with open(path.joinpath('1000.json'), 'w') as file:
+            json.dump(self.ga_data, file)
+        self.assertDictEqual(functions.load_input_file(path), self.ga_data)
+        shutil.rmtree(path)
+
+    def test_journal(self):
+        path = self.get_path('test_run.journal')
+        self.assertIsNone(functions.load_input_file(path))
+
+        functions.dump_output(path, functions.evolve_ga(self.config_data, self.ga_data), delta=True)
+        data = functions.load_input_file(path)
+        self.assertEqual(data['generation'], 1)
+        functions.dump_output(path, functions.evolve_ga(self.config_data, data), delta=True)
+        self.assertEqual(functions.load_input_file(path)['generation'], 2)
+        os.remove(path)
@@ -1,6 +1,11 @@
 from unittest import TestCase
 
-from ga.conf import Config, FloatItem
+import numpy as np
+
+from ga.conf import Config, FloatItem, GenePattern
+from ga.population import Population
+import operators.crossover as crs
+import operators.mating as mat
 
 
 class TestCrossover(TestCase):
@@ -45,3 +50,40 @@ class TestCrossover(TestCase):
             max_gen=10,
         )
         self.assertDictEqual(config.serialize(), self.config_map)
+
+    def test_gene_pattern(self):
+        pattern = GenePattern([FloatItem(-1, 1, 1), FloatItem(0, 10, 2), FloatItem(100, 200, 0)])
+
+        self.assertListEqual(pattern.decode([0.5, 0.123, 0.456]).tolist(), [0.0, 1.23, 146.0])
+
+        genes = np.random.random((5, 3))
+        parameters = pattern.decode(genes)
+        self.assertEqual(parameters.shape, (5, 3))
+        np.testing.assert_allclose(pattern.encode(parameters), genes, atol=0.03)
+        np.testing.assert_allclose(pattern.encode([[-2, 5, 250]]), [[0.5, 0.5, 0.5]])
+
+        # the end of a range is decoded again to the end rather than the start
+        parameters = pattern.decode(pattern.encode([[1, 10, 200]]))
+        self.assertListEqual(parameters.tolist(), [[1, 10, 200]])
+
+    def test_batch_follows_operators(self):
+        config = Config.from_dict(self.config_map)
+        self.assertIs(config.crossover_batch, crs.sbx_batch)
+        self.assertIsNotNone(config.mutation_batch)
+
+        calls = []
+
+        def crossover(a, b, **_):
+            calls.append(1)
+            return a, b
+
+        config.crossover = crossover
+        self.assertIsNone(config.crossover_batch)
+        mat.random_mating_once(Population(config))
+        self.assertGreater(len(calls), 0)
+
+        config.crossover = crs.single_point
+        self.assertIs(config.crossover_batch, crs.single_point_batch)
+
+        config.mutation = lambda genes, **_: genes
+        self.assertIsNone(config.mutation_batch)
@@ -1,5 +1,8 @@
+from functools import partial
 from unittest import TestCase
 
+import numpy as np
+
 import operators.crossover as crs
 
 
@@ -23,3 +26,32 @@ class TestCrossover(TestCase):
         self.assertAlmostEqual(a[0] + b[0], 1)
         self.assertAlmostEqual(a[1] + b[1], 1)
         # print(a, b)
+
+    def test_single_point_batch(self):
+        a = np.zeros((50, 4))
+        b = np.ones((50, 4))
+        x, y = crs.single_point_batch(a, b)
+        np.testing.assert_array_equal(x + y, 1)
+        self.assertTrue(np.all(x[:, 0] == 0))
+        self.assertTrue(np.all(x[:, -1] == 1))
+        self.assertTrue(np.all(np.diff(x, axis=1) >= 0))
+
+    def test_blend_batch(self):
+        a = np.array([[0.3, 0.5]] * 20)
+        b = np.array([[0.4, 0.6]] * 20)
+        for offspring in crs.blend_batch(a, b):
+            self.assertTrue(np.all((0.25 <= offspring[:, 0]) & (offspring[:, 0] <= 0.45)))
+            self.assertTrue(np.all((0.45 <= offspring[:, 1]) & (offspring[:, 1] <= 0.65)))
+
+    def test_simulated_binary_batch(self):
+        a = np.array([[0, 0.6]] * 20)
+        b = np.array([[1, 0.4]] * 20)
+        x, y = crs.sbx_batch(a, b)
+        np.testing.assert_allclose(x + y, 1)
+
+    def test_batch(self):
+        self.assertIs(crs.batch(crs.sbx), crs.sbx_batch)
+        self.assertIsNone(crs.batch(lambda a, b: (a, b)))
+        func = crs.batch(partial(crs.blend, alpha=0.1))
+        self.assertIs(func.func, crs.blend_batch)
+        self.assertDictEqual(func.keywords, {'alpha': 0.1})
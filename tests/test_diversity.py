@@ -32,3 +32,15 @@ class TestDiversity(unittest.TestCase):
 
     def test_divcon_d(self):
         self.assertLess(divcon_d(self.chromosomes), [1, 1, 1, 1, 1, 1])
+
+    def test_divcon_a_tiles(self):
+        self.assertListEqual(
+            divcon_a(self.chromosomes, 0.1, 0.1, memory=1, threads=2),
+            [0.5, 0.5, 0.25, 0.25, 0.25, 0.25]
+        )
+
+    def test_divcon_c_tiles(self):
+        expected = divcon_c(self.chromosomes)
+        result = divcon_c(self.chromosomes, memory=1, threads=2)
+        for i in range(len(expected)):
+            self.assertAlmostEqual(result[i], expected[i])
@@ -3,6 +3,7 @@ from unittest import TestCase
 import operators.elimination as elm
 from ga.conf import Config, FloatItem
 from ga.genetic import Chromosome
+from ga.population import Population
 
 
 class TestElimination(TestCase):
@@ -52,3 +53,10 @@ class TestElimination(TestCase):
 
         self.assertEqual(count, 5)
         # print([item.age for item in self.chromosomes if item.is_alive])
+
+    def test_population(self):
+        population = Population.from_chromosomes(self.chromosomes[0].config, self.chromosomes)
+
+        elm.age_tournament(population, 5, round_size=10)
+
+        self.assertListEqual(population.alive.tolist(), [True] * 5 + [False] * 5)
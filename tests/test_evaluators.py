@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from ga.algorithms import GA
+from ga.conf import Config, FloatItem
+from ga.evaluators import SerialEvaluator, ThreadPoolEvaluator, ProcessPoolEvaluator, AsyncEvaluator
+
+
+def _fit(data):
+    return abs(sum(data))
+
+
+class TestEvaluators(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.parameters = [[i, -2 * i, 0.5] for i in range(20)]
+        self.expected = [_fit(item) for item in self.parameters]
+
+    def test_serial(self):
+        self.assertListEqual(SerialEvaluator()(_fit, self.parameters), self.expected)
+
+    def test_thread_pool(self):
+        names = set()
+
+        def fit(data):
+            names.add(threading.current_thread().name)
+            return _fit(data)
+
+        with ThreadPoolEvaluator(max_workers=4) as evaluator:
+            self.assertListEqual(evaluator(fit, self.parameters), self.expected)
+        self.assertNotIn(threading.main_thread().name, names)
+
+    def test_process_pool(self):
+        with ProcessPoolEvaluator(max_workers=2, chunksize=3) as evaluator:
+            self.assertListEqual(evaluator(_fit, self.parameters), self.expected)
+            self.assertListEqual(evaluator(_fit, self.parameters[::-1]), self.expected[::-1])
+
+    def test_ga_with_evaluator(self):
+        with ThreadPoolEvaluator(max_workers=2) as evaluator:
+            config = Config([FloatItem(0, 1, 5), FloatItem(-5, 5, 5)], fit=_fit, size=10, max_gen=3,
+                            evaluator=evaluator)
+            p = GA(config)
+            p.evolve()
+            for item in p.chromosomes:
+                self.assertEqual(item.raw_fitness, _fit(item.decode()))
+
+    def test_async(self):
+        in_flight = []
+        peak = []
+
+        async def fit(data):
+            in_flight.append(data)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.001)
+            in_flight.remove(data)
+            return _fit(data)
+
+        result = asyncio.run(AsyncEvaluator(concurrency=3)(fit, self.parameters))
+        self.assertListEqual(result, self.expected)
+        self.assertEqual(max(peak), 3)
+
+    def test_ga_evolve_async(self):
+        generations = []
+
+        async def fit(data):
+            await asyncio.sleep(0)
+            return _fit(data)
+
+        config = Config([FloatItem(0, 1, 5), FloatItem(-5, 5, 5)], fit=fit, size=10, max_gen=3,
+                        evaluator=AsyncEvaluator(concurrency=4))
+        p = GA(config)
+        asyncio.run(p.evolve_async(lambda ga: generations.append(ga.generation)))
+        self.assertListEqual(generations, [0, 1, 2, 3])
+        for item in p.chromosomes:
+            self.assertEqual(item.raw_fitness, _fit(item.decode()))
+
+    def test_ga_evolve_async_fit_batch(self):
+        loop_threads = []
+
+        async def tick():
+            # the event loop keeps running while a blocking fit_batch evaluates a generation
+            while True:
+                loop_threads.append(threading.get_ident())
+                await asyncio.sleep(0.001)
+
+        def fit_batch(data):
+            self.assertNotEqual(threading.get_ident(), loop_threads[0])
+            time.sleep(0.01)
+            return np.abs(data.sum(axis=1))
+
+        async def run(p):
+            task = asyncio.ensure_future(tick())
+            await asyncio.sleep(0)
+            await p.evolve_async()
+            task.cancel()
+
+        config = Config([FloatItem(0, 1, 5), FloatItem(-5, 5, 5)], fit=_fit, size=10, max_gen=3,
+                        fit_batch=fit_batch)
+        p = GA(config)
+        asyncio.run(run(p))
+        self.assertEqual(p.generation, 3)
+        self.assertGreater(len(loop_threads), 3)
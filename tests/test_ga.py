@@ -1,8 +1,15 @@
+import random
+import time
 import unittest
 
-from ga.algorithms import GA, GAPassive
+import numpy as np
+
+from ga.algorithms import GA, GAPassive, GASteadyState
+from ga.cache import FitnessCache
 from ga.conf import Config, FloatItem
+from ga.evaluators import ThreadPoolEvaluator
 from ga.genetic import Chromosome
+import operators.elimination as elm
 
 
 class TestGA(unittest.TestCase):
@@ -59,12 +66,47 @@ class TestGA(unittest.TestCase):
         p.crossover()
         self.assertEqual(len(p.offsprings), 8)
 
+    def test_mutate_sigma_shrink(self):
+        p = GA(self.config, self.chromosomes)
+        p.crossover()
+        p.generation = self.config.max_gen
+        genes = p.offsprings.genes.copy()
+        p.mutate()
+        np.testing.assert_array_equal(p.offsprings.genes, genes)
+
     def test_evaluate(self):
         p = GA(self.config, self.chromosomes)
         p.evaluate(p.chromosomes)
         for item in p.chromosomes:
             self.assertEqual(item.fitness, abs(sum(item.decode())))
 
+    def test_evaluate_batch(self):
+        calls = []
+
+        def fit_batch(data):
+            calls.append(data.shape)
+            return np.abs(data.sum(axis=1))
+
+        self.config.fit_batch = fit_batch
+        p = GA(self.config)
+        p.evaluate(p.chromosomes)
+        self.assertListEqual(calls, [(12, 3)])
+        for item in p.chromosomes:
+            self.assertAlmostEqual(item.fitness, abs(sum(item.decode())))
+
+    def test_scale(self):
+        p = GA(self.config)
+        p.evaluate(p.chromosomes)
+        p.scale()
+
+        raw = p.population.fitness
+        np.testing.assert_allclose(p.population.effective, raw - raw.min())
+        for i, item in enumerate(p.chromosomes):
+            self.assertEqual(item.fitness, p.population.effective[i])
+
+        p.chromosomes[0].fitness = 1
+        self.assertIsNone(p.population.effective)
+
     def test_replace(self):
         p = GA(self.config, self.chromosomes)
         p.evaluate(p.chromosomes)
@@ -77,6 +119,42 @@ class TestGA(unittest.TestCase):
         p.replace()
         self.assertNotEqual(origin, p.chromosomes)
 
+    def test_keep_elitist(self):
+        self.config.elite_size = 3
+        p = GA(self.config)
+        p.population.update_fitness(np.arange(12))
+        p.population.alive[:] = True
+        p.population.alive[[0, 10, 11]] = False
+        p.offsprings = p.population.spawn(np.random.random((3, 3)))
+        p.offsprings.update_fitness([10.5, 1, 2])
+
+        p.keep_elitist()
+        self.assertListEqual(np.flatnonzero(~p.population.alive).tolist(), [0])
+        self.assertListEqual(p.offsprings.fitness.tolist(), [10.5])
+
+        p.replace()
+        self.assertListEqual(p.population.fitness.tolist(), [10.5] + list(range(1, 12)))
+        self.assertEqual(p.best().index, 11)
+
+    def test_best(self):
+        p = GA(self.config)
+        p.population.update_fitness(np.arange(12))
+        self.assertEqual(p.best().index, 11)
+
+        p.population.put([0], p.population.spawn(np.random.random((1, 3))))
+        self.assertEqual(p.best().index, 11)
+
+        offsprings = p.population.spawn(np.random.random((2, 3)))
+        offsprings.update_fitness([20, 30])
+        p.population.put([2, 3], offsprings)
+        self.assertEqual(p.best().index, 3)
+
+        p.population.put([3], p.population.spawn(np.random.random((1, 3))))
+        self.assertEqual(p.best().index, 2)
+
+        p.population[5].fitness = 100
+        self.assertEqual(p.best().index, 5)
+
     def test_serialize(self):
         p = GAPassive(
             self.config,
@@ -102,3 +180,176 @@ class TestGA(unittest.TestCase):
                 'age': 0,
             }
         })
+
+
+def slow_fit(x):
+    time.sleep(0.001 * random.random())
+    return abs(sum(x))
+
+
+class TestGASteadyState(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.config = Config(
+            gene_pattern=[FloatItem(0, 1, 5), FloatItem(0, 5, 5), FloatItem(-5, 5, 5)],
+            fit=slow_fit,
+            size=12,
+            max_gen=10,
+        )
+
+    def check(self, p: GASteadyState):
+        generations = []
+        p.evolve(lambda ga: generations.append(ga.generation))
+
+        self.assertListEqual(generations, list(range(11)))
+        self.assertEqual(p.inserted, 10 * self.config.pool_size)
+        self.assertEqual(len(p.population), 12)
+        self.assertTrue(np.all(p.population.alive))
+        for item in p.population:
+            self.assertAlmostEqual(item.raw_fitness, abs(sum(item.decode())))
+
+    def test_serial(self):
+        p = GASteadyState(self.config)
+        self.assertEqual(p.in_flight, 1)
+        self.check(p)
+
+    def test_pool(self):
+        with ThreadPoolEvaluator(max_workers=4) as evaluator:
+            self.config.evaluator = evaluator
+            p = GASteadyState(self.config)
+            self.assertEqual(p.in_flight, 4)
+            self.check(p)
+
+    def test_fit_batch(self):
+        with ThreadPoolEvaluator(max_workers=2) as evaluator:
+            self.config.evaluator = evaluator
+            self.config.fit_batch = lambda data: np.abs(data.sum(axis=1))
+            self.check(GASteadyState(self.config))
+
+    def test_insert_keeps_scaling(self):
+        self.config.scaling = True
+        p = GASteadyState(self.config)
+        p.evaluate(p.population)
+        p.next_generation()
+        for _ in range(3):
+            offspring = p.breed()
+            p.evaluate(offspring)
+            p.insert(offspring)
+            self.assertIsNotNone(p.population.effective)
+            raw = p.population.fitness * p.population.penalty if self.config.diversity else p.population.fitness
+            np.testing.assert_allclose(
+                p.population.effective, np.maximum(self.config.scale(np.maximum(raw, 0)), 0))
+
+
+class TestGAPassiveAskTell(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.config = Config(
+            gene_pattern=[FloatItem(0, 1, 5), FloatItem(0, 5, 5), FloatItem(-5, 5, 5)],
+            fit=lambda x: abs(sum(x)),
+            size=12,
+            max_gen=10,
+        )
+
+    def tell(self, p: GAPassive, candidates):
+        results = {key: abs(sum(parameters)) for key, parameters in candidates}
+        return p.tell(reversed(list(results.items())))
+
+    def check(self, p: GAPassive, dead: int):
+        self.assertEqual(len(p.population), 12)
+        self.assertEqual(np.count_nonzero(~p.population.alive), dead)
+        for item in p.population:
+            self.assertAlmostEqual(item.raw_fitness, abs(sum(item.decode())))
+
+    def test_generational(self):
+        p = GAPassive(self.config)
+        first = p.ask(5)
+        self.assertListEqual([key for key, _ in first], list(range(5)))
+        self.assertEqual(len(p.ask()), 7)
+        # unanswered candidates are handed out again
+        self.assertEqual(len(p.ask()), 12)
+
+        self.assertEqual(self.tell(p, first), 5)
+        self.assertEqual(self.tell(p, first), 0)
+        self.assertEqual(p.generation, 0)
+        self.assertListEqual([key for key, _ in p.candidates()], list(range(5, 12)))
+        self.assertEqual(self.tell(p, p.ask()), 7)
+        self.assertEqual(p.generation, 1)
+        # results of dropped candidates are ignored
+        self.assertEqual(self.tell(p, first), 0)
+
+        while not p.is_satisfied():
+            self.tell(p, p.ask(3))
+        self.assertEqual(p.generation, 10)
+        self.assertListEqual(p.ask(), [])
+        # parents eliminated by the last evolve wait for offsprings
+        self.check(p, len(p.offsprings))
+
+    def test_quorum(self):
+        p = GAPassive(self.config, quorum=0.5)
+        self.tell(p, p.ask())
+        size = len(p.offsprings)
+        self.tell(p, p.ask(size // 2))
+        self.assertEqual(p.generation, 2)
+        self.check(p, len(p.offsprings))
+
+    def test_steady(self):
+        p = GAPassive(self.config, policy='steady')
+        self.tell(p, p.ask())
+        self.assertEqual(p.generation, 1)
+
+        size = len(p.offsprings)
+        asked = p.ask(3)
+        self.assertEqual(self.tell(p, asked[:2]), 2)
+        self.assertEqual(p.inserted, 2)
+        # replaced candidates get new ids
+        self.assertEqual(len(p.offsprings), size)
+        self.assertNotIn(asked[0][0], [key for key, _ in p.ask()])
+        self.assertEqual(self.tell(p, asked), 1)
+
+        while not p.is_satisfied():
+            self.tell(p, p.ask(1))
+        self.assertEqual(p.inserted, 9 * self.config.pool_size)
+        self.check(p, 0)
+
+    def test_steady_cache(self):
+        # few distinct parameters, new offsprings are often found in the cache
+        self.config = Config(
+            gene_pattern=[FloatItem(0, 3, 0), FloatItem(0, 3, 0)],
+            fit=lambda x: abs(sum(x)),
+            size=8,
+            max_gen=10,
+            cache=FitnessCache(100),
+        )
+        p = GAPassive(self.config, policy='steady')
+        while not p.is_satisfied():
+            asked = p.ask()
+            self.assertGreater(len(asked), 0)
+            self.tell(p, asked)
+        self.assertEqual(p.generation, 10)
+
+    def test_steady_elitism(self):
+        self.config.elimination = elm.random_pick
+        self.config.elite_size = 1
+        p = GAPassive(self.config, policy='steady')
+        self.tell(p, p.ask())
+        best = p.population.fitness.max()
+        while not p.is_satisfied():
+            p.tell([(key, 0) for key, _ in p.ask(1)])
+            self.assertEqual(p.population.fitness[p.population.alive].max(), best)
+            self.assertIsNotNone(p.population.effective)
+
+    def test_serialize(self):
+        p = GAPassive(self.config)
+        self.tell(p, p.ask())
+        asked = p.ask(2)
+        self.tell(p, asked[:1])
+
+        data = p.serialize()
+        self.assertEqual(sum(item['evaluated'] for item in data['offsprings']), 1)
+        waiting = asked[1:] + p.ask()
+        for restored in (GAPassive.from_dict(self.config.serialize(), data),
+                         GAPassive.from_arrays(self.config.serialize(), p.serialize_arrays())):
+            # candidates handed out are handed out again after restored
+            self.assertListEqual(restored.ask(), sorted(waiting))
+            self.assertEqual(self.tell(restored, asked), 1)
@@ -73,3 +73,18 @@ class TestGenetic(unittest.TestCase):
             'alive': True,
             'age': 0,
         })
+
+    def test_compact(self):
+        c = Chromosome(self.config)
+        self.assertFalse(hasattr(c, '__dict__'))
+        self.assertIs(c.config, self.config)
+        self.assertIs(c.population.config, self.config)
+
+    def test_items(self):
+        c = Chromosome(self.config, [0.25, 0.5, 0.75])
+        self.assertEqual(c[1], 0.5)
+        self.assertIsInstance(c[1], float)
+        self.assertListEqual(c[1:], [0.5, 0.75])
+        self.assertListEqual(list(c), [0.25, 0.5, 0.75])
+        c[2] = 0.125
+        self.assertListEqual(list(c), c.genes)
@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+
+from ga.conf import Config, FloatItem
+from ga.islands import IslandModel, topology_targets
+
+
+def fit(x):
+    return 1 / (sum(item * item for item in x) + 0.001)
+
+
+def fail(_):
+    raise ValueError('broken fitness function')
+
+
+class TestIslands(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.config = Config([FloatItem(-1, 1, 5) for _ in range(3)], fit, size=20, max_gen=12)
+
+    def test_topology(self):
+        self.assertListEqual(topology_targets('ring', 3), [[1], [2], [0]])
+        self.assertListEqual(topology_targets('star', 3), [[1, 2], [0], [0]])
+        self.assertListEqual(topology_targets('full', 3), [[1, 2], [0, 2], [0, 1]])
+        self.assertListEqual(topology_targets('full', 1), [[]])
+
+    def test_evolve(self):
+        for topology in ('ring', 'star', 'full'):
+            model = IslandModel(self.config, islands=3, migration_interval=4, topology=topology, seed=1)
+            populations = model.evolve()
+            self.assertEqual(len(populations), 3)
+            for population in populations:
+                self.assertEqual(len(population), 20)
+            best = model.best()
+            self.assertEqual(best.raw_fitness, max(np.max(item.fitness) for item in populations))
+
+    def test_seed(self):
+        a = IslandModel(self.config, islands=2, migration_interval=3, seed=7).evolve()
+        b = IslandModel(self.config, islands=2, migration_interval=3, seed=7).evolve()
+        for x, y in zip(a, b):
+            np.testing.assert_array_equal(x.genes, y.genes)
+        self.assertFalse(np.array_equal(a[0].genes, a[1].genes))
+
+    def test_failure(self):
+        self.config.fit = fail
+        with self.assertRaises(RuntimeError):
+            IslandModel(self.config, islands=2).evolve()
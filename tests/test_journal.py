@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+from ga.algorithms import GAPassive
+from ga.journal import Journal, natural_key
+
+
+class TestJournal(unittest.TestCase):
+    config_data = {
+        'pattern': [
+            {'start': 0, 'end': 1, 'precision': 5},
+            {'start': -1, 'end': 1, 'precision': 5},
+        ],
+        'size': 6,
+        'maxGen': 50,
+    }
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'run.journal')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def generations(self, count: int) -> list:
+        data = GAPassive.from_dict(self.config_data).serialize()
+        result = [data]
+        for _ in range(count - 1):
+            for item in data['offsprings'] or data['population']:
+                item['fitness'] = sum(item['parameters']) + 2
+            ga = GAPassive.from_dict(self.config_data, data)
+            ga.evolve()
+            data = ga.serialize()
+            result.append(data)
+        return result
+
+    def check(self, delta: bool):
+        states = self.generations(8)
+        for i, data in enumerate(states):
+            # a new object every time reads the journal from the file
+            Journal(self.path, delta=delta, full_every=3).append(data)
+            self.assertDictEqual(Journal(self.path).latest(), data)
+
+        records = list(Journal(self.path).records())
+        self.assertListEqual([generation for generation, _ in records], list(range(8)))
+        for (_, data), expected in zip(records, states):
+            self.assertDictEqual(data, expected)
+        return os.path.getsize(self.path)
+
+    def test_full(self):
+        self.check(False)
+
+    def test_delta(self):
+        full = self.check(False)
+        os.remove(self.path)
+        self.assertLess(self.check(True), full)
+
+    def test_interrupted(self):
+        states = self.generations(3)
+        journal = Journal(self.path, delta=True)
+        journal.append(states[0])
+        journal.append(states[1])
+        size = os.path.getsize(self.path)
+        with open(self.path, 'ab') as file:
+            file.write(b'GAJR\x01partial')
+
+        self.assertDictEqual(Journal(self.path).latest(), states[1])
+        Journal(self.path, delta=True).append(states[2])
+        self.assertGreater(os.path.getsize(self.path), size)
+        self.assertDictEqual(Journal(self.path).latest(), states[2])
+        self.assertEqual(len(list(Journal(self.path).records())), 3)
+
+    def test_natural_key(self):
+        names = ['1000.json', '999.json', '010.json', '2.json']
+        self.assertListEqual(sorted(names, key=natural_key), ['2.json', '010.json', '999.json', '1000.json'])
@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+
+import operators.mating as mat
+from ga.conf import Config, FloatItem
+from ga.genetic import Chromosome
+from ga.population import Population
+
+
+class TestMating(unittest.TestCase):
+
+    def setUp(self) -> None:
+        pattern = [FloatItem(0, 1, 5), FloatItem(0, 1, 5), FloatItem(0, 1, 5)]
+        self.config = Config(pattern, sum, size=7)
+        self.population = Population(self.config)
+        self.population.fitness[:] = np.arange(7)
+
+    def test_random_mating(self):
+        offsprings = mat.random_mating(self.population)
+        self.assertIsInstance(offsprings, Population)
+        self.assertEqual(len(offsprings), 7)
+
+    def test_random_mating_once(self):
+        offsprings = mat.random_mating_once(self.population)
+        self.assertEqual(len(offsprings), 7)
+        self.assertTrue(np.all(offsprings.genes >= 0))
+        self.assertTrue(np.all(offsprings.genes < 1))
+
+    def test_phenotypic_mating(self):
+        offsprings = mat.phenotypic_mating(self.population)
+        self.assertEqual(len(offsprings), 7)
+
+    def test_without_batch(self):
+        self.config.crossover_batch = None
+        offsprings = mat.random_mating_once(self.population)
+        self.assertEqual(len(offsprings), 7)
+
+    def test_list(self):
+        chromosomes = [Chromosome(self.config) for _i in range(5)]
+        offsprings = mat.random_mating_once(chromosomes)
+        self.assertEqual(len(offsprings), 5)
+        for item in offsprings:
+            self.assertIsInstance(item, Chromosome)
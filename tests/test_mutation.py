@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 import operators.mutation as m
 
 
@@ -44,3 +46,40 @@ class TestMutation(unittest.TestCase):
             self.assertEqual(len(genes), len(new_genes))
             self.assertGreaterEqual(new_genes, [0.0, 0.8, 0.4, 0.20])
             self.assertLessEqual(new_genes, [0.0, 1.2, 0.6, 0.30])
+
+    def test_random_mutate_batch(self):
+        genes = np.array([[0, 1, 0.1, 0.9]] * 10, dtype=float)
+        new_genes = m.random_mutate_batch(genes, 1)
+        self.assertIs(new_genes, genes)
+        self.assertTrue(np.all((0 <= genes) & (genes <= 1)))
+
+    def test_partial_abs_batch(self):
+        genes = np.array([[0, 1, 0.5, 0.25]] * 100)
+        m.partial_abs_batch(genes, 0.5)
+        self.assertTrue(np.all(genes >= [-1, 0, -0.5, -0.75]))
+        self.assertTrue(np.all(genes <= [1, 2, 1.5, 1.25]))
+
+    def test_partial_relative_batch(self):
+        genes = np.array([[0, 1, 0.5, 0.25]] * 100)
+        m.partial_relative_batch(genes, 1, 0.02)
+        self.assertTrue(np.all(genes >= [0.0, 0.8, 0.4, 0.20]))
+        self.assertTrue(np.all(genes <= [0.0, 1.2, 0.6, 0.30]))
+
+    def test_vector_abs_batch(self):
+        genes = np.array([[0, 1, 0.5, 0.25]] * 100)
+        m.vector_abs_batch(genes, 0.5)
+        changed = np.any(genes != [0, 1, 0.5, 0.25], axis=1)
+        self.assertTrue(np.all(np.all(genes[~changed] == [0, 1, 0.5, 0.25], axis=1)))
+        self.assertTrue(np.all(genes >= [-1, 0, -0.5, -0.75]))
+        self.assertTrue(np.all(genes <= [1, 2, 1.5, 1.25]))
+
+    def test_vector_relative_batch(self):
+        genes = np.array([[0, 1, 0.5, 0.25]] * 100)
+        m.vector_relative_batch(genes, 1, 0.02)
+        self.assertTrue(np.all(genes >= [0.0, 0.8, 0.4, 0.20]))
+        self.assertTrue(np.all(genes <= [0.0, 1.2, 0.6, 0.30]))
+
+    def test_sigma(self):
+        genes = np.array([[0, 1, 0.5, 0.25]] * 10)
+        m.partial_abs_batch(genes, 1, sigma=0)
+        np.testing.assert_array_equal(genes, [[0, 1, 0.5, 0.25]] * 10)
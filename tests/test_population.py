@@ -0,0 +1,103 @@
+import unittest
+from copy import deepcopy
+
+import numpy as np
+
+from ga.conf import FloatItem, Config
+from ga.genetic import Chromosome
+from ga.population import Population
+
+
+class TestPopulation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.config = Config(
+            [FloatItem(0, 1, 5), FloatItem(-1, 0, 5), FloatItem(-100, 100, 5)],
+            fit=sum,
+            size=10,
+        )
+        self.population = Population(self.config)
+
+    def test_generate(self):
+        self.assertEqual(self.population.genes.shape, (10, 3))
+        self.assertTrue(np.all(self.population.genes >= 0))
+        self.assertTrue(np.all(self.population.genes < 1))
+        self.assertTrue(np.all(self.population.alive))
+        self.assertTrue(np.all(self.population.age == 0))
+
+    def test_view(self):
+        c = self.population[3]
+        c.fitness = 2
+        c.age = 5
+        c.is_alive = False
+        c[0] = 0.25
+        self.assertEqual(self.population.fitness[3], 2)
+        self.assertEqual(self.population.age[3], 5)
+        self.assertFalse(self.population.alive[3])
+        self.assertEqual(self.population.genes[3, 0], 0.25)
+        self.assertIs(c.array.base, self.population.genes)
+
+    def test_take(self):
+        part = self.population[[1, 2]]
+        self.assertEqual(len(part), 2)
+        part.genes[0, 0] = 0.5
+        self.assertNotEqual(self.population.genes[1, 0], 0.5)
+
+    def test_put(self):
+        other = Population(self.config, np.zeros((2, 3)), fitness=[1, 2])
+        self.population.put([4, 7], other)
+        self.assertListEqual(self.population[7].genes, [0.0, 0.0, 0.0])
+        self.assertEqual(self.population[7].raw_fitness, 2)
+
+    def test_delete(self):
+        rest = self.population.delete([0, 9])
+        self.assertEqual(len(rest), 8)
+        np.testing.assert_array_equal(rest.genes, self.population.genes[1:9])
+
+    def test_from_chromosomes(self):
+        c = Chromosome(self.config, [0.1, 0.2, 0.3])
+        c.fitness = 3
+        c.age = 2
+        population = Population.from_chromosomes(self.config, [c, Chromosome(self.config)])
+        self.assertEqual(len(population), 2)
+        self.assertListEqual(population[0].genes, [0.1, 0.2, 0.3])
+        self.assertEqual(population[0].raw_fitness, 3)
+        self.assertEqual(population[0].age, 2)
+
+    def test_copy_detaches(self):
+        c = deepcopy(self.population[0])
+        c[0] = 0.75
+        self.assertIsNot(c.population, self.population)
+        self.assertIs(c.config, self.config)
+        self.assertNotEqual(self.population.genes[0, 0], 0.75)
+
+    def test_phenotype_cache(self):
+        parameters = self.population.decode()
+        self.assertIs(self.population.decode().base, parameters.base)
+        self.assertFalse(parameters.flags.writeable)
+
+        c = self.population[2]
+        c[0] = 0.5
+        self.assertEqual(c.decode()[0], 0.5)
+        self.assertEqual(self.population.decode()[2, 0], 0.5)
+
+        c.genes = [0, 0, 0]
+        self.assertListEqual(c.decode(), [0, -1, -100])
+
+        self.population.genes[:] = 0.25
+        self.population.repair()
+        self.assertTrue(np.all(self.population.decode()[:, 0] == 0.25))
+
+        other = self.population.take([0, 1])
+        self.population.put([4, 5], other)
+        np.testing.assert_array_equal(self.population.decode()[4:6], other.decode())
+
+    def test_take_copies_caches(self):
+        expected = self.population.decode().copy()
+        self.population.effective = np.ones(len(self.population))
+        for other in (self.population[0:4], self.population[:], self.population.copy()):
+            other[0].genes = [.9, .9, .9]
+            other.decode_row(0)
+            other.effective[0] = 5
+            np.testing.assert_array_equal(self.population.decode(), expected)
+            self.assertEqual(self.population.effective[0], 1)
@@ -27,36 +27,42 @@ class TestScaling(TestCase):
     case = [1, 2, 3, 4, 5]
 
     def test_offset(self):
-        func = offset(self.case)
-        self.assertEqual(func(1), 0)
-        self.assertEqual(func(5), 4)
+        result = offset(self.case)
+        self.assertEqual(result[0], 0)
+        self.assertEqual(result[4], 4)
 
     def test_linear_avg(self):
         a = 13.5
         b = -37.5
-        func = linear_avg(self.case)
-        self.assertEqual(func(1), a + b)
-        self.assertEqual(func(5), 30)
+        result = linear_avg(self.case)
+        self.assertEqual(result[0], a + b)
+        self.assertEqual(result[4], 30)
 
     def test_linear_med(self):
         a = 13.5
         b = -37.5
-        func = linear_avg(self.case)
-        self.assertEqual(func(1), a + b)
-        self.assertEqual(func(5), 30)
+        result = linear_med(self.case)
+        self.assertEqual(result[0], a + b)
+        self.assertEqual(result[4], 30)
 
     def test_linear_map(self):
-        func = linear_map(self.case)
-        self.assertEqual(func(1), 1)
-        self.assertEqual(func(5), 10)
+        result = linear_map(self.case)
+        self.assertEqual(result[0], 1)
+        self.assertEqual(result[4], 10)
 
     def test_truncate(self):
-        func = truncate(self.case, 0)
-        self.assertEqual(func(1), -2)
-        self.assertEqual(func(5), 2)
+        result = truncate(self.case, 0)
+        self.assertEqual(result[0], -2)
+        self.assertEqual(result[4], 2)
 
     def test_quadratic(self):
-        func = quadratic(self.case)
-        self.assertAlmostEqual(func(1), 0.01)
-        self.assertAlmostEqual(func(5), 10)
-        self.assertAlmostEqual(func(3), 1)
+        result = quadratic(self.case)
+        self.assertAlmostEqual(result[0], 0.01)
+        self.assertAlmostEqual(result[4], 10)
+        self.assertAlmostEqual(result[2], 1)
+
+    def test_shape(self):
+        for scale in (offset, linear_avg, linear_med, linear_map, truncate, quadratic):
+            result = scale(self.case)
+            self.assertIsInstance(result, np.ndarray)
+            self.assertEqual(result.shape, (len(self.case),))
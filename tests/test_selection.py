@@ -3,6 +3,7 @@ import unittest
 import operators.selection as slc
 from ga.conf import Config, FloatItem
 from ga.genetic import Chromosome
+from ga.population import Population
 
 
 class TestSelection(unittest.TestCase):
@@ -37,3 +38,10 @@ class TestSelection(unittest.TestCase):
     def test_rank(self):
         p = slc.rank(self.chromosomes, 5)
         self.assertEqual(len(p), 5)
+
+    def test_roulette_wheel_population(self):
+        population = Population.from_chromosomes(self.chromosomes[0].config, self.chromosomes)
+        p = slc.roulette_wheel(population, 5)
+        self.assertIsInstance(p, Population)
+        self.assertEqual(len(p), 5)
+        self.assertTrue(all(item.raw_fitness > 0 for item in p))
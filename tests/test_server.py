@@ -0,0 +1,170 @@
+import json
+import os
+import stat
+import threading
+import time
+from pathlib import Path
+from unittest import TestCase
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from cli import functions
+from cli.server import Session, create_server
+
+
+class TestServer(TestCase):
+    config_data = {
+        'pattern': [
+            {'start': 0, 'end': 1, 'precision': 10},
+            {'start': 0, 'end': 2, 'precision': 10},
+            {'start': 0, 'end': 3, 'precision': 10},
+        ],
+        'size': 5,
+        'crossoverRate': 0.75,
+        'mutationRate': 0.06,
+        'elitism': 1,
+        'maxGen': 100,
+        'diversity': True,
+        'scaling': True,
+    }
+
+    def setUp(self) -> None:
+        self.cwd = Path(os.getcwd())
+        if self.cwd == Path(os.path.dirname(__file__)):
+            self.cwd = self.cwd.joinpath('..')
+        self.path = self.cwd.joinpath('test_server.json')
+
+    def tearDown(self) -> None:
+        if self.path.exists():
+            os.remove(self.path)
+
+    def evaluate(self, session: Session, n=None) -> int:
+        asked = session.ask(n)
+        results = [{'id': item['id'], 'fitness': sum(item['parameters'])} for item in asked['candidates']]
+        session.tell(list(reversed(results)))
+        return len(results)
+
+    def test_ask_tell(self):
+        session = Session(self.config_data, str(self.path))
+        self.assertEqual(session.ga.generation, 0)
+        self.assertEqual(len(session.ask(2)['candidates']), 2)
+        self.assertEqual(len(session.ask()['candidates']), 3)
+        # all candidates are handed out, unanswered ones are handed out again
+        self.assertEqual(len(session.ask()['candidates']), 5)
+
+        asked = session.ask(3)
+        result = session.tell([{'id': item['id'], 'fitness': 1.0} for item in asked['candidates']])
+        self.assertEqual(result, {'accepted': 3, 'generation': 0})
+        self.assertEqual(session.status()['pending'], 2)
+        self.assertEqual([item['id'] for item in session.ask()['candidates']], [3, 4])
+
+        self.evaluate(session)
+        self.assertEqual(session.ga.generation, 1)
+        self.assertEqual(session.status()['evaluated'], 0)
+        # results of candidates of the last generation are ignored
+        self.assertEqual(session.tell([{'id': 0, 'fitness': 1.0}])['accepted'], 0)
+
+        for _ in range(3):
+            while session.ga.generation < 4:
+                self.evaluate(session, 2)
+        self.assertEqual(session.ga.generation, 4)
+
+    def test_snapshot(self):
+        session = Session(self.config_data, str(self.path), snapshot_interval=3600)
+        self.evaluate(session)
+        asked = session.ask(1)
+        session.tell([{'id': asked['candidates'][0]['id'], 'fitness': 2.0}])
+        session.save_if_due()
+        self.assertFalse(self.path.exists())
+
+        self.assertEqual(session.snapshot(), str(self.path))
+        data = functions.load_input_file(self.path)
+        self.assertEqual(data['generation'], 1)
+        self.assertEqual(sum(item['evaluated'] for item in data['offsprings']), 1)
+
+        # a generation is resumed where it stopped
+        resumed = Session(self.config_data, str(self.path))
+        self.assertEqual(resumed.status()['pending'], session.status()['pending'])
+        self.assertNotIn(asked['candidates'][0]['id'], [item['id'] for item in resumed.ask()['candidates']])
+
+        session.snapshot_interval = 0
+        session.save_if_due()
+        self.assertFalse(session.dirty)
+
+    def test_http(self):
+        session = Session(self.config_data, str(self.path))
+        server = create_server(session, port=0)
+        thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        thread.start()
+        url = f'http://127.0.0.1:{server.server_address[1]}'
+
+        def request(path, data=None):
+            body = json.dumps(data).encode() if data is not None else None
+            with urlopen(Request(url + path, body, method='GET' if body is None else 'POST')) as response:
+                return json.loads(response.read())
+
+        try:
+            asked = request('/ask?n=10')
+            self.assertEqual(len(asked['candidates']), 5)
+            results = [{'id': item['id'], 'fitness': 1.0} for item in asked['candidates']]
+            self.assertEqual(request('/tell', {'results': results})['generation'], 1)
+            self.assertEqual(request('/status')['generation'], 1)
+
+            with self.assertRaises(HTTPError) as context:
+                request('/tell', {'results': [{'id': 5, 'fitness': -1.0}]})
+            self.assertEqual(context.exception.code, 400)
+            with self.assertRaises(HTTPError) as context:
+                request('/unknown')
+            self.assertEqual(context.exception.code, 404)
+
+            # saved periodically by the server
+            session.snapshot_interval = 0
+            for _ in range(100):
+                if self.path.exists():
+                    break
+                time.sleep(0.05)
+            self.assertEqual(functions.load_input_file(self.path)['generation'], 1)
+            self.assertEqual(request('/snapshot', {})['path'], str(self.path))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_http_cache(self):
+        # the store of the cache is opened by the main thread and used by the threads of the server
+        cache = self.cwd.joinpath('test_server_cache.db')
+        session = Session({**self.config_data, 'size': 20, 'cache': {'path': str(cache)}}, str(self.path))
+        server = create_server(session, port=0)
+        thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        thread.start()
+        url = f'http://127.0.0.1:{server.server_address[1]}'
+
+        def request(path, data=None):
+            body = json.dumps(data).encode() if data is not None else None
+            with urlopen(Request(url + path, body, method='GET' if body is None else 'POST')) as response:
+                return json.loads(response.read())
+
+        try:
+            for generation in range(1, 3):
+                asked = request('/ask')
+                results = [{'id': item['id'], 'fitness': sum(item['parameters'])} for item in asked['candidates']]
+                self.assertEqual(request('/tell', {'results': results})['generation'], generation)
+            self.assertGreater(len(session.ga.config.cache), 0)
+        finally:
+            server.shutdown()
+            server.server_close()
+            session.ga.config.cache.close()
+            os.remove(cache)
+
+    def test_socket_path(self):
+        session = Session(self.config_data, str(self.cwd.joinpath('test_server_state.json')))
+        self.path.write_text('{}')
+        # only a stale socket is replaced
+        with self.assertRaises(AssertionError):
+            create_server(session, socket=str(self.path))
+        self.assertEqual(self.path.read_text(), '{}')
+
+        os.remove(self.path)
+        create_server(session, socket=str(self.path)).server_close()
+        server = create_server(session, socket=str(self.path))
+        server.server_close()
+        self.assertTrue(stat.S_ISSOCK(os.stat(self.path).st_mode))
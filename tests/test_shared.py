@@ -0,0 +1,85 @@
+import os
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from ga.algorithms import GA
+from ga.conf import Config, FloatItem
+from ga.shared import SharedArray, SharedMemoryEvaluator, SharedPopulation, attach
+
+
+def _fit(data):
+    return abs(sum(data))
+
+
+def _crash(_):
+    os._exit(1)
+
+
+def _sum_rows(handle):
+    memory, genes = attach(handle)
+    result = genes.sum(axis=1).tolist()
+    del genes
+    memory.close()
+    return result
+
+
+class TestShared(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.config = Config([FloatItem(0, 1, 5), FloatItem(-1, 0, 5), FloatItem(-100, 100, 5)], _fit, size=10)
+
+    def test_shared_array(self):
+        shared = SharedArray((3, 2))
+        shared.array[:] = 1
+        memory, array = attach(shared.handle)
+        self.assertTrue(np.all(array == 1))
+        array[0, 0] = 5
+        self.assertEqual(shared.array[0, 0], 5)
+        del array
+        memory.close()
+
+        name = shared.handle.name
+        shared.close()
+        with self.assertRaises(FileNotFoundError):
+            attach(shared.handle._replace(name=name))
+
+    def test_population(self):
+        with SharedPopulation(self.config) as population:
+            genes, _ = population.handles()
+            with SharedMemoryEvaluator(max_workers=2) as evaluator:
+                result = evaluator.executor.submit(_sum_rows, genes).result()
+            np.testing.assert_allclose(result, population.genes.sum(axis=1))
+
+            other = population.take([0, 1])
+            population.put([5, 6], other)
+            population.update_fitness([1, 2], [5, 6])
+            np.testing.assert_array_equal(population.genes[5:7], other.genes)
+            self.assertEqual(population.champion(), 6)
+
+        self.assertEqual(len(population.genes), 10)
+
+    def test_evaluator(self):
+        parameters = np.array([[i, -2 * i, 0.5] for i in range(20)])
+        expected = [_fit(item) for item in parameters.tolist()]
+        with SharedMemoryEvaluator(max_workers=2, chunksize=3) as evaluator:
+            self.assertListEqual(evaluator.evaluate(_fit, parameters).tolist(), expected)
+            self.assertListEqual(evaluator(_fit, parameters[::-1].tolist()), expected[::-1])
+            # a larger matrix replaces the blocks
+            self.assertEqual(len(evaluator.evaluate(_fit, np.ones((50, 3)))), 50)
+
+    def test_ga(self):
+        with SharedMemoryEvaluator(max_workers=2) as evaluator:
+            self.config.evaluator = evaluator
+            ga = GA(self.config, SharedPopulation(self.config))
+            ga.evolve()
+            for item in ga.population:
+                self.assertAlmostEqual(item.raw_fitness, abs(sum(item.decode())))
+            ga.population.close()
+
+    def test_crash(self):
+        with SharedMemoryEvaluator(max_workers=2) as evaluator:
+            with self.assertRaises(BrokenProcessPool):
+                evaluator.evaluate(_crash, np.ones((4, 3)))
+            self.assertListEqual(evaluator.evaluate(_fit, np.ones((4, 3))).tolist(), [3.0] * 4)
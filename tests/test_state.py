@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from ga.algorithms import GAPassive
+from ga.state import is_state, load_state, save_state
+
+
+class TestState(unittest.TestCase):
+    config_data = {
+        'pattern': [
+            {'start': 0, 'end': 1, 'precision': 5},
+            {'start': -1, 'end': 1, 'precision': 5},
+        ],
+        'size': 6,
+    }
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'state.npz')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_save_load(self):
+        arrays = {
+            'matrix': np.arange(12, dtype=float).reshape(3, 4),
+            'flags': np.array([True, False]),
+            'empty': np.zeros((0, 4)),
+            'scalar': np.array(3),
+        }
+        save_state(self.path, arrays)
+
+        for mmap in (True, False):
+            data = load_state(self.path, mmap)
+            self.assertSetEqual(set(data), set(arrays))
+            for name, array in arrays.items():
+                np.testing.assert_array_equal(data[name], array)
+                self.assertEqual(data[name].shape, array.shape)
+
+        self.assertIsInstance(load_state(self.path)['matrix'], np.memmap)
+        self.assertListEqual(os.listdir(self.directory.name), ['state.npz'])
+
+    def test_passive(self):
+        ga = GAPassive.from_dict(self.config_data)
+        save_state(self.path, ga.serialize_arrays())
+
+        data = load_state(self.path)
+        self.assertTrue(is_state(data))
+        self.assertEqual(data['parameters'].shape, (6, 2))
+        fitness = np.abs(data['parameters']).sum(axis=1)
+        data = dict(data, population_fitness=fitness)
+
+        ga = GAPassive.from_arrays(self.config_data, data)
+        np.testing.assert_array_equal(ga.population.fitness, fitness)
+        ga.evolve()
+        arrays = ga.serialize_arrays()
+        np.testing.assert_array_equal(arrays['parameters'], ga.offsprings.decode())
+
+        restored = GAPassive.from_arrays(self.config_data, arrays)
+        self.assertEqual(restored.generation, ga.generation)
+        np.testing.assert_array_equal(restored.population.genes, ga.population.genes)
+        np.testing.assert_array_equal(restored.offsprings.genes, ga.offsprings.genes)
+        np.testing.assert_array_equal(restored.population.alive, ga.population.alive)
+        self.assertEqual(restored.best().decode(), ga.best().decode())
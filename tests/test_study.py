@@ -0,0 +1,82 @@
+import multiprocessing as mp
+import os
+import tempfile
+import unittest
+
+from ga.study import StudyStorage
+
+
+def _work(path: str, worker: str):
+    with StudyStorage(path) as storage:
+        while not storage.status('shared')['satisfied']:
+            candidates = storage.claim('shared', 3, worker)
+            storage.complete('shared', {key: abs(sum(parameters)) for key, parameters in candidates})
+
+
+class TestStudyStorage(unittest.TestCase):
+    config_data = {
+        'pattern': [
+            {'start': 0, 'end': 1, 'precision': 5},
+            {'start': 0, 'end': 5, 'precision': 5},
+        ],
+        'size': 12,
+        'maxGen': 5,
+    }
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'studies.db')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_claim_complete(self):
+        with StudyStorage(self.path) as storage:
+            self.assertTrue(storage.create('a', self.config_data))
+            self.assertFalse(storage.create('a', self.config_data))
+            self.assertTrue(storage.create('b', self.config_data, policy='steady'))
+            self.assertListEqual(storage.studies(), ['a', 'b'])
+
+            claimed = storage.claim('a', 5, 'worker')
+            self.assertListEqual([key for key, _ in claimed], list(range(5)))
+            self.assertListEqual([key for key, _ in storage.claim('a', 20)], list(range(5, 12)))
+            self.assertListEqual(storage.claim('a', 1), [])
+            # running candidates are claimed again after the timeout
+            self.assertEqual(len(storage.claim('a', 20, timeout=0)), 12)
+            self.assertEqual(storage.status('b')['waiting'], 12)
+
+            self.assertEqual(storage.complete('a', {key: 1.0 for key, _ in claimed}), 5)
+            self.assertEqual(storage.complete('a', {key: 1.0 for key, _ in claimed}), 0)
+            status = storage.status('a')
+            self.assertEqual((status['generation'], status['running'], status['complete']), (0, 7, 5))
+
+            with StudyStorage(self.path) as other:
+                rest = other.claim('a', 20, timeout=0)
+                self.assertEqual(other.complete('a', [(key, 2.0) for key, _ in rest]), 7)
+            status = storage.status('a')
+            self.assertEqual(status['generation'], 1)
+            self.assertEqual(status['waiting'], len(storage.load('a').offsprings))
+
+            storage.delete('b')
+            self.assertListEqual(storage.studies(), ['a'])
+
+    def test_workers(self):
+        with StudyStorage(self.path) as storage:
+            storage.create('shared', self.config_data, quorum=0.75)
+
+        context = mp.get_context('fork')
+        processes = [context.Process(target=_work, args=(self.path, f'worker-{i}')) for i in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(60)
+            self.assertEqual(process.exitcode, 0)
+
+        with StudyStorage(self.path) as storage:
+            status = storage.status('shared')
+            self.assertTrue(status['satisfied'])
+            self.assertEqual(status['generation'], 5)
+            self.assertEqual(status['waiting'] + status['running'], 0)
+            ga = storage.load('shared')
+            for item in ga.population:
+                self.assertAlmostEqual(item.raw_fitness, abs(sum(item.decode())))
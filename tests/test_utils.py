@@ -25,13 +25,15 @@ class TestUtils(unittest.TestCase):
 
         pool = utils.pick_from_wheel(items, wheel, 5)
 
-        for i in range(10):
-            for j in range(5):
-                self.assertIsNot(items[i], pool[j])
-                self.assertIsNot(items[i].property_2, pool[j].property_2)
-
+        self.assertEqual(len(pool), 5)
         for item in pool:
-            self.assertEqual(item.property_1, 5)
+            self.assertIs(item, items[5])
+
+    def test_spin_wheel(self):
+        wheel = utils.create_wheel([1, 0, 2, 0, 1])
+        indices = utils.spin_wheel(wheel, 1000)
+        self.assertEqual(len(indices), 1000)
+        self.assertSetEqual(set(indices.tolist()), {0, 2, 4})
 
     def test_tournament(self):
         items = [A(i) for i in range(10)]
@@ -49,6 +51,20 @@ class TestUtils(unittest.TestCase):
             for i in range(5):
                 self.assertNotEqual(pool[i].property_1, pool[i - 1].property_1)
 
+    def test_tournament_indices(self):
+        values = [5, 1, 4, 2, 3]
+
+        for round_size in (1, 2, 3, 5):
+            indices = utils.tournament_indices(values, 5, round_size)
+            self.assertListEqual(sorted(indices.tolist()), [0, 1, 2, 3, 4])
+
+        # every index joins every round, so winners are ordered by value
+        indices = utils.tournament_indices(values, 3, 5)
+        self.assertListEqual(indices.tolist(), [0, 2, 4])
+
+        indices = utils.tournament_indices(list(range(1000)), 900, 4)
+        self.assertEqual(len(set(indices.tolist())), 900)
+
     def test_repair(self):
         genes = [-0.1, 1.1, -1.2, 2.2]
         repaired = utils.repair(genes)